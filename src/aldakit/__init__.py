@@ -1,6 +1,8 @@
 """aldakit: a pythonic alda music programming language implementation."""
 
-from .api import list_ports, play, play_file, save, save_file
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .ast_nodes import (
     ASTNode,
     ASTVisitor,
@@ -36,20 +38,56 @@ from .ast_nodes import (
     VoiceNode,
 )
 from .errors import AldaParseError, AldaScanError, AldaSyntaxError
-from .midi import (
-    LibremidiBackend,
-    MidiBackend,
-    MidiGenerator,
-    MidiNote,
-    MidiSequence,
-    generate_midi,
-)
-from .midi.transcriber import list_input_ports, transcribe
 from .parser import Parser, parse
 from .scanner import Scanner
-from .score import Score
 from .tokens import SourcePosition, Token, TokenType
 
+if TYPE_CHECKING:
+    from .api import list_ports, play, play_file, save, save_file
+    from .midi import (
+        LibremidiBackend,
+        MidiBackend,
+        MidiGenerator,
+        MidiNote,
+        MidiSequence,
+        generate_midi,
+    )
+    from .midi.transcriber import list_input_ports, transcribe
+    from .score import Score
+
+# Names whose modules pull in the MIDI backends (and their native
+# extensions); imported on first attribute access (PEP 562).
+_LAZY_ATTRS: dict[str, str] = {
+    "list_ports": ".api",
+    "play": ".api",
+    "play_file": ".api",
+    "save": ".api",
+    "save_file": ".api",
+    "LibremidiBackend": ".midi",
+    "MidiBackend": ".midi",
+    "MidiGenerator": ".midi",
+    "MidiNote": ".midi",
+    "MidiSequence": ".midi",
+    "generate_midi": ".midi",
+    "list_input_ports": ".midi.transcriber",
+    "transcribe": ".midi.transcriber",
+    "Score": ".score",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 __version__ = "0.1.10"
 
 
@@ -6,7 +6,10 @@
 #include <nanobind/stl/string_view.h>
 #include <nanobind/stl/vector.h>
 
+#include <chrono>
+#include <condition_variable>
 #include <deque>
+#include <iterator>
 #include <mutex>
 
 namespace nb = nanobind;
@@ -21,6 +24,7 @@ struct MidiMessage {
 struct MidiInWrapper {
   std::deque<MidiMessage> message_queue;
   std::mutex queue_mutex;
+  std::condition_variable queue_cv;
   libremidi::midi_in impl;
   std::function<void(const std::vector<unsigned char>&, int64_t)> python_callback;
 
@@ -29,11 +33,14 @@ struct MidiInWrapper {
   libremidi::input_configuration create_config() {
     libremidi::input_configuration conf;
     conf.on_message = [this](libremidi::message&& msg) {
-      std::lock_guard<std::mutex> lock(queue_mutex);
-      message_queue.push_back(MidiMessage{
-        std::vector<unsigned char>(msg.begin(), msg.end()),
-        msg.timestamp
-      });
+      {
+        std::lock_guard<std::mutex> lock(queue_mutex);
+        message_queue.push_back(MidiMessage{
+          std::vector<unsigned char>(msg.begin(), msg.end()),
+          msg.timestamp
+        });
+      }
+      queue_cv.notify_one();
     };
     conf.ignore_sysex = true;
     conf.ignore_timing = true;
@@ -57,17 +64,40 @@ struct MidiInWrapper {
     return impl.is_port_open();
   }
 
-  // Poll for messages and invoke callback if set, return list of messages
+  // Drain queued messages. The queue is swapped out in O(1) so the MIDI
+  // thread is never blocked while messages are copied out.
   std::vector<MidiMessage> poll() {
-    std::vector<MidiMessage> messages;
+    std::deque<MidiMessage> pending;
     {
       std::lock_guard<std::mutex> lock(queue_mutex);
-      while (!message_queue.empty()) {
-        messages.push_back(std::move(message_queue.front()));
-        message_queue.pop_front();
-      }
+      pending.swap(message_queue);
+    }
+    return std::vector<MidiMessage>(std::make_move_iterator(pending.begin()),
+                                    std::make_move_iterator(pending.end()));
+  }
+
+  // Drain queued messages into a caller-owned list, replacing its contents,
+  // so a polling loop can reuse one list instead of receiving a new one.
+  size_t poll_into(nb::list out) {
+    std::deque<MidiMessage> pending;
+    {
+      std::lock_guard<std::mutex> lock(queue_mutex);
+      pending.swap(message_queue);
     }
-    return messages;
+    out.clear();
+    for (auto& msg : pending) {
+      out.append(nb::cast(std::move(msg)));
+    }
+    return pending.size();
+  }
+
+  // Block until a message is queued or the timeout (seconds) elapses.
+  // Called with the GIL released so other Python threads keep running.
+  bool wait_for_messages(double timeout) {
+    std::unique_lock<std::mutex> lock(queue_mutex);
+    return queue_cv.wait_for(
+        lock, std::chrono::duration<double>(timeout),
+        [this] { return !message_queue.empty(); });
   }
 
   // Check if there are pending messages
@@ -155,8 +185,15 @@ NB_MODULE(_libremidi, m) {
       .def("is_port_open", &MidiInWrapper::is_port_open)
       .def("poll", &MidiInWrapper::poll,
            "Poll for incoming MIDI messages. Returns a list of MidiMessage objects.")
+      .def("poll_into", &MidiInWrapper::poll_into, nb::arg("out"),
+           "Poll for incoming MIDI messages into an existing list, replacing "
+           "its contents. Returns the number of messages.")
       .def("has_messages", &MidiInWrapper::has_messages,
            "Check if there are pending messages without consuming them.")
+      .def("wait_for_messages", &MidiInWrapper::wait_for_messages,
+           nb::arg("timeout"), nb::call_guard<nb::gil_scoped_release>(),
+           "Block until a message arrives or timeout (seconds) elapses. "
+           "Returns True if messages are pending.")
       .def("absolute_timestamp", &MidiInWrapper::absolute_timestamp,
            "Get the current absolute timestamp in nanoseconds.");
 
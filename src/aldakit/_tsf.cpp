@@ -11,6 +11,7 @@
 
 #include <nanobind/nanobind.h>
 #include <nanobind/stl/string.h>
+#include <nanobind/stl/tuple.h>
 #include <nanobind/stl/vector.h>
 
 // TinySoundFont implementation
@@ -24,7 +25,10 @@
 #include "miniaudio.h"
 
 #include <atomic>
+#include <chrono>
+#include <condition_variable>
 #include <mutex>
+#include <tuple>
 #include <vector>
 #include <cstring>
 #include <algorithm>
@@ -69,8 +73,14 @@ public:
         : tsf_(nullptr)
         , device_initialized_(false)
         , playing_(false)
+        , rendering_(false)
         , current_time_(0.0)
         , global_gain_(1.0f)
+        , seq_duration_(0.0)
+        , next_program_(0)
+        , next_note_on_(0)
+        , next_note_off_(0)
+        , events_dirty_(true)
     {
         std::memset(&device_, 0, sizeof(device_));
     }
@@ -159,6 +169,7 @@ public:
         pc.time = time;
         pc.applied = false;
         scheduled_programs_.push_back(pc);
+        events_dirty_ = true;
     }
 
     /**
@@ -167,15 +178,21 @@ public:
     void schedule_note(int channel, int key, float velocity,
                        double start_time, double duration) {
         std::lock_guard<std::mutex> lock(mutex_);
-        ScheduledNote note;
-        note.channel = channel;
-        note.key = key;
-        note.velocity = std::max(0.0f, std::min(1.0f, velocity));
-        note.start_time = start_time;
-        note.end_time = start_time + duration;
-        note.started = false;
-        note.stopped = false;
-        scheduled_notes_.push_back(note);
+        add_note(channel, key, velocity, start_time, duration);
+    }
+
+    /**
+     * Schedule many notes under a single lock.
+     *
+     * Each entry is (channel, key, velocity, start_time, duration).
+     */
+    void schedule_notes(
+        const std::vector<std::tuple<int, int, float, double, double>>& notes) {
+        std::lock_guard<std::mutex> lock(mutex_);
+        scheduled_notes_.reserve(scheduled_notes_.size() + notes.size());
+        for (const auto& [channel, key, velocity, start_time, duration] : notes) {
+            add_note(channel, key, velocity, start_time, duration);
+        }
     }
 
     /**
@@ -186,6 +203,7 @@ public:
         scheduled_notes_.clear();
         scheduled_programs_.clear();
         current_time_ = 0.0;
+        events_dirty_ = true;
     }
 
     /**
@@ -227,6 +245,7 @@ public:
         {
             std::lock_guard<std::mutex> lock(mutex_);
             current_time_ = 0.0;
+            rendering_ = false;
             for (auto& note : scheduled_notes_) {
                 note.started = false;
                 note.stopped = false;
@@ -234,6 +253,7 @@ public:
             for (auto& pc : scheduled_programs_) {
                 pc.applied = false;
             }
+            events_dirty_ = true;
             tsf_reset(tsf_);
         }
 
@@ -260,6 +280,7 @@ public:
         if (tsf_) {
             tsf_note_off_all(tsf_);
         }
+        started_cv_.notify_all();
     }
 
     /**
@@ -269,6 +290,19 @@ public:
         return playing_;
     }
 
+    /**
+     * Block until the audio thread has rendered its first block, playback
+     * stops, or the timeout (seconds) elapses. Returns true once audio has
+     * started. Called with the GIL released.
+     */
+    bool wait_until_playing(double timeout) {
+        std::unique_lock<std::mutex> lock(mutex_);
+        started_cv_.wait_for(
+            lock, std::chrono::duration<double>(timeout),
+            [this] { return rendering_ || !playing_; });
+        return rendering_;
+    }
+
     /**
      * Get current playback time.
      */
@@ -278,6 +312,60 @@ public:
     }
 
 private:
+    void add_note(int channel, int key, float velocity,
+                  double start_time, double duration) {
+        ScheduledNote note;
+        note.channel = channel;
+        note.key = key;
+        note.velocity = std::max(0.0f, std::min(1.0f, velocity));
+        note.start_time = start_time;
+        note.end_time = start_time + std::max(0.0, duration);
+        note.started = false;
+        note.stopped = false;
+        scheduled_notes_.push_back(note);
+        events_dirty_ = true;
+    }
+
+    /**
+     * Rebuild the time-ordered event indices for pending events.
+     *
+     * The audio callback walks these with cursors instead of scanning
+     * every scheduled event for every sample.
+     */
+    void build_event_order() {
+        program_order_.clear();
+        for (size_t i = 0; i < scheduled_programs_.size(); ++i) {
+            if (!scheduled_programs_[i].applied) program_order_.push_back(i);
+        }
+        std::stable_sort(program_order_.begin(), program_order_.end(),
+            [this](size_t a, size_t b) {
+                return scheduled_programs_[a].time < scheduled_programs_[b].time;
+            });
+
+        note_on_order_.clear();
+        note_off_order_.clear();
+        seq_duration_ = 0.0;
+        for (size_t i = 0; i < scheduled_notes_.size(); ++i) {
+            const auto& note = scheduled_notes_[i];
+            seq_duration_ = std::max(seq_duration_, note.end_time);
+            if (!note.started) note_on_order_.push_back(i);
+            if (!note.stopped) note_off_order_.push_back(i);
+        }
+        std::stable_sort(note_on_order_.begin(), note_on_order_.end(),
+            [this](size_t a, size_t b) {
+                return scheduled_notes_[a].start_time < scheduled_notes_[b].start_time;
+            });
+        std::stable_sort(note_off_order_.begin(), note_off_order_.end(),
+            [this](size_t a, size_t b) {
+                return scheduled_notes_[a].end_time < scheduled_notes_[b].end_time;
+            });
+
+        next_program_ = 0;
+        next_note_on_ = 0;
+        next_note_off_ = 0;
+        events_dirty_ = false;
+    }
+
     static void audio_callback(ma_device* device, void* output,
                                const void* /* input */, ma_uint32 frame_count) {
         auto* player = static_cast<TsfPlayer*>(device->pUserData);
@@ -292,28 +380,42 @@ private:
             return;
         }
 
+        if (events_dirty_) {
+            build_event_order();
+        }
+
         const double time_per_sample = 1.0 / static_cast<double>(SAMPLE_RATE);
-        const double seq_duration = duration();
+        const size_t program_count = program_order_.size();
+        const size_t note_on_count = note_on_order_.size();
+        const size_t note_off_count = note_off_order_.size();
 
         for (ma_uint32 i = 0; i < frame_count; ++i) {
             // Apply program changes
-            for (auto& pc : scheduled_programs_) {
-                if (!pc.applied && current_time_ >= pc.time) {
-                    tsf_channel_set_presetindex(tsf_, pc.channel, pc.program);
-                    pc.applied = true;
-                }
+            while (next_program_ < program_count) {
+                auto& pc = scheduled_programs_[program_order_[next_program_]];
+                if (current_time_ < pc.time) break;
+                tsf_channel_set_presetindex(tsf_, pc.channel, pc.program);
+                pc.applied = true;
+                ++next_program_;
             }
 
-            // Process note events
-            for (auto& note : scheduled_notes_) {
-                if (!note.started && current_time_ >= note.start_time) {
-                    tsf_channel_note_on(tsf_, note.channel, note.key, note.velocity);
-                    note.started = true;
-                }
-                if (!note.stopped && note.started && current_time_ >= note.end_time) {
-                    tsf_channel_note_off(tsf_, note.channel, note.key);
-                    note.stopped = true;
-                }
+            // Release due notes before starting new ones, so a repeated
+            // pitch that ends and restarts on the same sample is not cut off.
+            // A note is only released once it has started.
+            while (next_note_off_ < note_off_count) {
+                auto& note = scheduled_notes_[note_off_order_[next_note_off_]];
+                if (!note.started || current_time_ < note.end_time) break;
+                tsf_channel_note_off(tsf_, note.channel, note.key);
+                note.stopped = true;
+                ++next_note_off_;
+            }
+
+            while (next_note_on_ < note_on_count) {
+                auto& note = scheduled_notes_[note_on_order_[next_note_on_]];
+                if (current_time_ < note.start_time) break;
+                tsf_channel_note_on(tsf_, note.channel, note.key, note.velocity);
+                note.started = true;
+                ++next_note_on_;
             }
 
             // Render one stereo sample
@@ -321,19 +423,19 @@ private:
             current_time_ += time_per_sample;
         }
 
+        if (!rendering_) {
+            rendering_ = true;
+            started_cv_.notify_all();
+        }
+
         // Check if playback is complete
         if (scheduled_notes_.empty()) {
             // No notes scheduled - stop immediately
             playing_ = false;
-        } else if (current_time_ > seq_duration + TAIL_SECONDS) {
+        } else if (current_time_ > seq_duration_ + TAIL_SECONDS
+                   && next_note_off_ == note_off_count) {
             // All notes done + tail time elapsed
-            bool all_stopped = std::all_of(
-                scheduled_notes_.begin(), scheduled_notes_.end(),
-                [](const ScheduledNote& n) { return n.stopped; }
-            );
-            if (all_stopped) {
-                playing_ = false;
-            }
+            playing_ = false;
         }
     }
 
@@ -341,12 +443,25 @@ private:
     ma_device device_;
     bool device_initialized_;
     std::atomic<bool> playing_;
+    bool rendering_;  // Set by the first audio callback after play()
     double current_time_;
     float global_gain_;
 
     std::vector<ScheduledNote> scheduled_notes_;
     std::vector<ScheduledProgram> scheduled_programs_;
+
+    // Pending events in time order, consumed by the audio callback.
+    std::vector<size_t> program_order_;
+    std::vector<size_t> note_on_order_;
+    std::vector<size_t> note_off_order_;
+    double seq_duration_;
+    size_t next_program_;
+    size_t next_note_on_;
+    size_t next_note_off_;
+    bool events_dirty_;
+
     mutable std::mutex mutex_;
+    std::condition_variable started_cv_;
 };
 
 
@@ -375,6 +490,9 @@ NB_MODULE(_tsf, m) {
         .def("schedule_note", &TsfPlayer::schedule_note,
              "channel"_a, "key"_a, "velocity"_a, "start_time"_a, "duration"_a,
              "Schedule a note (velocity 0.0-1.0, times in seconds).")
+        .def("schedule_notes", &TsfPlayer::schedule_notes,
+             "notes"_a,
+             "Schedule many notes from (channel, key, velocity, start_time, duration) tuples.")
         .def("clear_schedule", &TsfPlayer::clear_schedule,
              "Clear all scheduled events.")
         .def("duration", &TsfPlayer::duration,
@@ -385,6 +503,10 @@ NB_MODULE(_tsf, m) {
              "Stop playback.")
         .def("is_playing", &TsfPlayer::is_playing,
              "Check if currently playing.")
+        .def("wait_until_playing", &TsfPlayer::wait_until_playing,
+             "timeout"_a, nb::call_guard<nb::gil_scoped_release>(),
+             "Block until audio output has started or the timeout (seconds) "
+             "elapses. Returns True if playback started.")
         .def("current_time", &TsfPlayer::current_time,
              "Get current playback position in seconds.");
 }
@@ -3,6 +3,7 @@
 import argparse
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 
 from . import __version__, generate_midi, parse
@@ -21,8 +22,12 @@ from .errors import AldaParseError
 from .midi import LibremidiBackend
 
 
+@lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
+    """Create the argument parser.
+
+    The parser is built once and shared; callers must not mutate it.
+    """
     parser = argparse.ArgumentParser(
         prog="aldakit",
         description="Parse and play Alda music files.",
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from .base import ComposeElement
+from .base import ComposeElement, _memoized_factory
 
 if TYPE_CHECKING:
     pass
@@ -20,7 +20,7 @@ from ..ast_nodes import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tempo(ComposeElement):
     """Tempo attribute."""
 
@@ -42,7 +42,7 @@ class Tempo(ComposeElement):
         return f"({symbol} {self.bpm})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Volume(ComposeElement):
     """Volume attribute."""
 
@@ -61,7 +61,7 @@ class Volume(ComposeElement):
         return f"(volume {self.level})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Quant(ComposeElement):
     """Quantization attribute."""
 
@@ -80,7 +80,7 @@ class Quant(ComposeElement):
         return f"(quant {self.level})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Panning(ComposeElement):
     """Panning attribute."""
 
@@ -99,7 +99,7 @@ class Panning(ComposeElement):
         return f"(panning {self.level})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OctaveSet(ComposeElement):
     """Set octave to specific value."""
 
@@ -112,7 +112,7 @@ class OctaveSet(ComposeElement):
         return f"o{self.value}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OctaveUp(ComposeElement):
     """Increase octave by one."""
 
@@ -123,7 +123,7 @@ class OctaveUp(ComposeElement):
         return ">"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OctaveDown(ComposeElement):
     """Decrease octave by one."""
 
@@ -134,7 +134,7 @@ class OctaveDown(ComposeElement):
         return "<"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Dynamic(ComposeElement):
     """Dynamic marking (pp, p, mp, mf, f, ff)."""
 
@@ -150,9 +150,10 @@ class Dynamic(ComposeElement):
         return f"({self.marking})"
 
 
-# Factory functions
+# Factory functions (elements are frozen, so identical calls share one instance)
 
 
+@_memoized_factory
 def tempo(bpm: int | float, global_: bool = False) -> Tempo:
     """Create a tempo attribute.
 
@@ -166,6 +167,7 @@ def tempo(bpm: int | float, global_: bool = False) -> Tempo:
     return Tempo(bpm=bpm, global_=global_)
 
 
+@_memoized_factory
 def volume(level: int | float) -> Volume:
     """Create a volume attribute.
 
@@ -182,6 +184,7 @@ def volume(level: int | float) -> Volume:
 vol = volume
 
 
+@_memoized_factory
 def quant(level: int | float) -> Quant:
     """Create a quantization attribute.
 
@@ -194,6 +197,7 @@ def quant(level: int | float) -> Quant:
     return Quant(level=level)
 
 
+@_memoized_factory
 def panning(level: int | float) -> Panning:
     """Create a panning attribute.
 
@@ -206,6 +210,7 @@ def panning(level: int | float) -> Panning:
     return Panning(level=level)
 
 
+@_memoized_factory
 def octave(n: int) -> OctaveSet:
     """Set the octave.
 
@@ -3,11 +3,36 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+from ..constants import COMPOSE_FACTORY_CACHE_SIZE
 
 if TYPE_CHECKING:
     from ..ast_nodes import ASTNode
 
+_T = TypeVar("_T")
+
+
+def _memoized_factory(factory: Callable[..., _T]) -> Callable[..., _T]:
+    """Memoize an element factory, so identical calls share one frozen element.
+
+    Calls with unhashable arguments bypass the cache and build a new element.
+    """
+    cached = lru_cache(maxsize=COMPOSE_FACTORY_CACHE_SIZE, typed=True)(factory)
+
+    @wraps(factory)
+    def wrapper(*args: object, **kwargs: object) -> _T:
+        try:
+            hash((args, tuple(kwargs.values())))
+        except TypeError:
+            return factory(*args, **kwargs)
+        return cached(*args, **kwargs)
+
+    wrapper.cache_info = cached.cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return wrapper
+
 
 class ComposeElement(ABC):
     """Base class for all compose elements.
@@ -16,6 +41,9 @@ class ComposeElement(ABC):
     serialize to Alda source code.
     """
 
+    # Empty so slotted subclasses carry no per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def to_ast(self) -> ASTNode:
         """Convert this element to an AST node."""
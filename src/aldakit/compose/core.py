@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field, replace
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable
 
-from .base import ComposeElement
+from .base import ComposeElement, _memoized_factory
 
 if TYPE_CHECKING:
     pass
@@ -35,7 +35,7 @@ _SEMITONE_TO_PITCH = ["c", "c", "d", "d", "e", "f", "f", "g", "g", "a", "a", "b"
 _SEMITONE_ACCIDENTALS = ["", "+", "", "+", "", "", "+", "", "+", "", "+", ""]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Note(ComposeElement):
     """A musical note.
 
@@ -209,7 +209,7 @@ class Note(ComposeElement):
         return self.__mul__(n)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rest(ComposeElement):
     """A musical rest (silence).
 
@@ -267,7 +267,7 @@ class Rest(ComposeElement):
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Chord(ComposeElement):
     """A chord (multiple notes played simultaneously).
 
@@ -311,7 +311,7 @@ class Chord(ComposeElement):
         return "/".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class Seq(ComposeElement):
     """A sequence of musical elements.
 
@@ -331,7 +331,7 @@ class Seq(ComposeElement):
 
     def to_alda(self) -> str:
         """Convert to Alda source code."""
-        return " ".join(e.to_alda() for e in self.elements)
+        return _join_alda(self.elements)
 
     @classmethod
     def from_alda(cls, source: str) -> Seq:
@@ -369,7 +369,26 @@ class Seq(ComposeElement):
         return NotImplemented
 
 
-@dataclass
+def _join_alda(elements: Iterable[ComposeElement]) -> str:
+    """Space-join the Alda source of elements in a single pass.
+
+    Nested plain ``Seq`` elements are flattened with an explicit stack rather
+    than rendered and joined level by level.
+    """
+    tokens: list[str] = []
+    stack = list(elements)
+    stack.reverse()
+    while stack:
+        element = stack.pop()
+        # Exact type check: _ParsedSeq renders its original source instead
+        if type(element) is Seq:
+            stack.extend(reversed(element.elements))
+        else:
+            tokens.append(element.to_alda())
+    return " ".join(tokens)
+
+
+@dataclass(slots=True)
 class _ParsedSeq(Seq):
     """A sequence created from parsed Alda source.
 
@@ -397,7 +416,7 @@ class _ParsedSeq(Seq):
         return self.source
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Repeat(ComposeElement):
     """A repeated element.
 
@@ -432,8 +451,12 @@ class Repeat(ComposeElement):
 
 
 # Factory functions
+#
+# The elements they build are frozen, so identical calls share one instance.
+# typed=True keeps e.g. duration=4 and duration=4.0 apart.
 
 
+@_memoized_factory
 def note(
     pitch: str,
     *,
@@ -472,6 +495,7 @@ def note(
     )
 
 
+@_memoized_factory
 def rest(
     *,
     duration: int | None = None,
@@ -493,6 +517,7 @@ def rest(
     return Rest(duration=duration, dots=dots, ms=ms, seconds=seconds)
 
 
+@_memoized_factory
 def chord(
     *notes_or_pitches: Note | str, duration: int | None = None, dots: int = 0
 ) -> Chord:
@@ -536,7 +561,7 @@ def seq(*elements: ComposeElement, metadata: dict[str, Any] | None = None) -> Se
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Cram(ComposeElement):
     """A cram expression (tuplet) - fit multiple notes into a duration.
 
@@ -607,7 +632,7 @@ def cram(*elements: ComposeElement, duration: int | None = None, dots: int = 0)
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Voice(ComposeElement):
     """A voice within a part for polyphonic writing.
 
@@ -638,7 +663,7 @@ class Voice(ComposeElement):
         return f"V{self.number}: {inner}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoiceGroup(ComposeElement):
     """A group of parallel voices.
 
@@ -693,7 +718,7 @@ def voice_group(*voices: Voice) -> VoiceGroup:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Variable(ComposeElement):
     """A variable definition.
 
@@ -719,7 +744,7 @@ class Variable(ComposeElement):
         return f"{self.name} = {inner}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VariableRef(ComposeElement):
     """A reference to a previously defined variable.
 
@@ -774,7 +799,7 @@ def var_ref(name: str) -> VariableRef:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Marker(ComposeElement):
     """A marker definition for synchronization points.
 
@@ -796,7 +821,7 @@ class Marker(ComposeElement):
         return f"%{self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtMarker(ComposeElement):
     """A marker reference (jump to marker).
 
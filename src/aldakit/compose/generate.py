@@ -1006,6 +1006,22 @@ def turing_machine(
 # Helper Functions
 # =============================================================================
 
+# Pitch class -> (letter, accidental), spelling black keys as sharps
+_PITCH_CLASS_SPELLINGS: tuple[tuple[str, str | None], ...] = (
+    ("c", None),
+    ("c", "+"),
+    ("d", None),
+    ("d", "+"),
+    ("e", None),
+    ("f", None),
+    ("f", "+"),
+    ("g", None),
+    ("g", "+"),
+    ("a", None),
+    ("a", "+"),
+    ("b", None),
+)
+
 
 def _midi_to_note(midi_pitch: int, *, duration: int | None = None) -> Note:
     """Convert a MIDI pitch number to a Note.
@@ -1017,15 +1033,12 @@ def _midi_to_note(midi_pitch: int, *, duration: int | None = None) -> Note:
     Returns:
         A Note with the appropriate pitch and octave.
     """
-    pitch_names = ["c", "c", "d", "d", "e", "f", "f", "g", "g", "a", "a", "b"]
-    accidentals = [None, "+", None, "+", None, None, "+", None, "+", None, "+", None]
-
-    pitch_class = midi_pitch % 12
-    octave = (midi_pitch // 12) - 1
+    octave, pitch_class = divmod(midi_pitch, 12)
+    letter, accidental = _PITCH_CLASS_SPELLINGS[pitch_class]
 
     return note(
-        pitch_names[pitch_class],
+        letter,
         duration=duration,
-        octave=octave,
-        accidental=accidentals[pitch_class],
+        octave=octave - 1,
+        accidental=accidental,
     )
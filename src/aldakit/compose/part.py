@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 
 from ..ast_nodes import PartDeclarationNode
 from .base import ComposeElement
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Part(ComposeElement):
     """An instrument part declaration.
 
@@ -52,4 +53,12 @@ def part(*instruments: str, alias: str | None = None) -> Part:
     """
     if not instruments:
         raise ValueError("At least one instrument name is required")
+    # Names become part-state and program-table keys during MIDI generation;
+    # interning lets those dict lookups match by identity. Non-str names are
+    # passed through unchanged.
+    instruments = tuple(
+        sys.intern(name) if isinstance(name, str) else name for name in instruments
+    )
+    if isinstance(alias, str):
+        alias = sys.intern(alias)
     return Part(instruments=instruments, alias=alias)
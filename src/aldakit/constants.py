@@ -59,6 +59,8 @@ POLL_INTERVAL_PLAYBACK = 0.1
 THREAD_JOIN_TIMEOUT = 0.5
 PLAYBACK_SLEEP_THRESHOLD = 0.01
 SEQUENTIAL_MODE_SLEEP = 0.01
+PLAYBACK_WAIT_TIMEOUT = 0.5  # Max blocking slice so Ctrl+C stays responsive
+TSF_START_TIMEOUT = 1.0  # Max wait for the audio device's first callback
 
 # =============================================================================
 # TRANSCRIPTION DEFAULTS
@@ -79,6 +81,13 @@ REPL_CONTINUATION_PROMPT = "  ... "
 REPL_HISTORY_FILENAME = ".alda_history"
 REPL_COMPLETION_MIN_WORD_LENGTH = 3
 REPL_INSTRUMENT_COLUMNS = 4
+REPL_LEXER_CACHE_SIZE = 512  # Tokenized lines kept for redraws
+PARSE_CACHE_SIZE = 256  # Parsed sources kept for REPL replays
+COMPOSE_FACTORY_CACHE_SIZE = 4096  # Shared immutable elements per factory
+MIDI_RENDER_CACHE_SIZE = 256  # Element-built scores whose MIDI render is reused
+DURATION_LOOKUP_CACHE_SIZE = 1024  # Beat lengths mapped to (duration, dots)
+TEMPO_MAP_CACHE_SIZE = 256  # Tempo-change lists with precomputed tick points
+TRANSCRIBE_TIMING_CACHE_SIZE = 32  # Derived quantizer settings per session config
 
 # =============================================================================
 # TEMPO & DURATION CALCULATIONS
@@ -15,8 +15,7 @@ from typing import TYPE_CHECKING, Callable
 from ...constants import (
     MAX_PLAYBACK_SLOTS,
     PLAYBACK_SLEEP_THRESHOLD,
-    POLL_INTERVAL_DEFAULT,
-    SEQUENTIAL_MODE_SLEEP,
+    PLAYBACK_WAIT_TIMEOUT,
     THREAD_JOIN_TIMEOUT,
 )
 
@@ -96,6 +95,10 @@ class AsyncPlaybackManager:
         self._lock = threading.Lock()
         self._concurrent_mode = True
         self._shutdown = False
+        # Set whenever no slot is active; play() clears it, the last
+        # finishing slot sets it again.
+        self._idle = threading.Event()
+        self._idle.set()
 
     @property
     def concurrent_mode(self) -> bool:
@@ -211,6 +214,8 @@ class AsyncPlaybackManager:
                 slot.events = []
                 slot.event_index = 0
                 slot.stop_requested = False
+                if not any(s.active for s in self._slots):
+                    self._idle.set()
 
     def play(self, sequence: MidiSequence) -> int | None:
         """Start playing a MIDI sequence asynchronously.
@@ -229,8 +234,7 @@ class AsyncPlaybackManager:
 
         # In sequential mode, wait for all playback to complete
         if not self._concurrent_mode:
-            while self.is_playing():
-                time.sleep(SEQUENTIAL_MODE_SLEEP)
+            self.wait()
 
         # Find a free slot
         slot = self._find_free_slot()
@@ -247,6 +251,7 @@ class AsyncPlaybackManager:
             slot.events = events
             slot.event_index = 0
             slot.stop_requested = False
+            self._idle.clear()
 
         slot.thread = threading.Thread(
             target=self._play_slot, args=(slot,), daemon=True
@@ -287,14 +292,28 @@ class AsyncPlaybackManager:
             if slot.thread and slot.thread.is_alive():
                 slot.thread.join(timeout=THREAD_JOIN_TIMEOUT)
 
-    def wait(self, poll_interval: float = POLL_INTERVAL_DEFAULT) -> None:
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until no slot is active or the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to block, or None to wait indefinitely.
+
+        Returns:
+            True if playback has finished, False on timeout.
+        """
+        return self._idle.wait(timeout)
+
+    def wait(self, poll_interval: float = PLAYBACK_WAIT_TIMEOUT) -> None:
         """Block until all playback completes.
 
+        Waits on the idle event in slices of ``poll_interval`` seconds so a
+        KeyboardInterrupt is still delivered promptly.
+
         Args:
-            poll_interval: Seconds between status checks.
+            poll_interval: Maximum seconds per blocking wait.
         """
-        while self.is_playing():
-            time.sleep(poll_interval)
+        while not self._idle.wait(poll_interval):
+            pass
 
     def shutdown(self) -> None:
         """Shutdown the playback manager, stopping all playback."""
@@ -13,7 +13,7 @@ from ...constants import (
     MIDI_STATUS_NOTE_OFF,
     MIDI_STATUS_NOTE_ON,
     MIDI_STATUS_PROGRAM_CHANGE,
-    POLL_INTERVAL_DEFAULT,
+    PLAYBACK_WAIT_TIMEOUT,
 )
 from ..types import MidiSequence
 from .async_playback import AsyncPlaybackManager
@@ -213,11 +213,24 @@ class LibremidiBackend(MidiBackend):
             return self._async_manager.is_playing()
         return False
 
-    def wait(self, poll_interval: float = POLL_INTERVAL_DEFAULT) -> None:
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until playback finishes or the timeout expires.
+
+        Args:
+            timeout: Maximum seconds to block, or None to wait indefinitely.
+
+        Returns:
+            True if nothing is playing, False on timeout.
+        """
+        if self._async_manager:
+            return self._async_manager.wait_idle(timeout)
+        return True
+
+    def wait(self, poll_interval: float = PLAYBACK_WAIT_TIMEOUT) -> None:
         """Block until all playback completes.
 
         Args:
-            poll_interval: Seconds between status checks.
+            poll_interval: Maximum seconds per blocking wait.
         """
         if self._async_manager:
             self._async_manager.wait(poll_interval)
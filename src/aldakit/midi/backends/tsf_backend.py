@@ -9,6 +9,7 @@ from __future__ import annotations
 import time
 from pathlib import Path
 
+from ...constants import TSF_START_TIMEOUT
 from .base import MidiBackend
 from ..smf import write_midi_file
 from ..soundfont import find_soundfont, list_soundfonts
@@ -131,23 +132,26 @@ class TsfBackend(MidiBackend):
         Returns:
             0 to indicate playback started (single slot).
         """
-        self._player.clear_schedule()
+        player = self._player
+        player.clear_schedule()
 
         # Schedule program changes
+        schedule_program = player.schedule_program
         for pc in sequence.program_changes:
-            self._player.schedule_program(pc.channel, pc.program, pc.time)
-
-        # Schedule notes
-        for note in sequence.notes:
-            self._player.schedule_note(
-                note.channel,
-                note.pitch,
-                note.velocity / 127.0,  # Convert to 0.0-1.0
-                note.start_time,
-                note.duration,
-            )
-
-        self._player.play()
+            schedule_program(pc.channel, pc.program, pc.time)
+
+        # Schedule all notes in one call (velocity converted to 0.0-1.0)
+        player.schedule_notes(
+            [
+                (n.channel, n.pitch, n.velocity / 127.0, n.start_time, n.duration)
+                for n in sequence.notes
+            ]
+        )
+
+        # Return once the audio thread is rendering, so current_time() and
+        # is_playing() reflect real output immediately
+        if player.play():
+            player.wait_until_playing(TSF_START_TIMEOUT)
         return 0
 
     def save(self, sequence: MidiSequence, path: Path | str) -> None:
@@ -1,6 +1,7 @@
 """MIDI generator that converts an Alda AST to MIDI events."""
 
 from dataclasses import dataclass, field
+from typing import Any, Callable
 
 from ..ast_nodes import (
     ASTNode,
@@ -120,7 +121,7 @@ MODE_INTERVALS: dict[str, int] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class PartState:
     """State for a single part/instrument."""
 
@@ -136,7 +137,7 @@ class PartState:
     transpose: int = 0  # Transposition in semitones
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratorState:
     """Global state for the MIDI generator."""
 
@@ -207,47 +208,32 @@ class MidiGenerator:
 
     def _process_node(self, node: ASTNode) -> None:
         """Process an AST node."""
-        if isinstance(node, PartNode):
-            self._process_part(node)
-        elif isinstance(node, EventSequenceNode):
-            self._process_event_sequence(node)
-        elif isinstance(node, NoteNode):
-            self._process_note(node)
-        elif isinstance(node, RestNode):
-            self._process_rest(node)
-        elif isinstance(node, ChordNode):
-            self._process_chord(node)
-        elif isinstance(node, OctaveSetNode):
-            for part in self._get_all_part_states():
-                part.octave = node.octave
-        elif isinstance(node, OctaveUpNode):
-            for part in self._get_all_part_states():
-                part.octave += 1
-        elif isinstance(node, OctaveDownNode):
-            for part in self._get_all_part_states():
-                part.octave -= 1
-        elif isinstance(node, BarlineNode):
-            pass  # Barlines are purely visual
-        elif isinstance(node, LispListNode):
-            self._process_lisp_list(node)
-        elif isinstance(node, VariableDefinitionNode):
-            self._process_variable_definition(node)
-        elif isinstance(node, VariableReferenceNode):
-            self._process_variable_reference(node)
-        elif isinstance(node, MarkerNode):
-            self._process_marker(node)
-        elif isinstance(node, AtMarkerNode):
-            self._process_at_marker(node)
-        elif isinstance(node, VoiceGroupNode):
-            self._process_voice_group(node)
-        elif isinstance(node, CramNode):
-            self._process_cram(node)
-        elif isinstance(node, RepeatNode):
-            self._process_repeat(node)
-        elif isinstance(node, OnRepetitionsNode):
-            self._process_on_repetitions(node)
-        elif isinstance(node, BracketedSequenceNode):
-            self._process_event_sequence(node.events)
+        handler = _NODE_HANDLERS.get(type(node))
+        if handler is None:
+            handler = _resolve_node_handler(type(node))
+        handler(self, node)
+
+    def _process_octave_set(self, node: OctaveSetNode) -> None:
+        """Set the octave of all active parts."""
+        for part in self._get_all_part_states():
+            part.octave = node.octave
+
+    def _process_octave_up(self, node: OctaveUpNode) -> None:
+        """Raise the octave of all active parts."""
+        for part in self._get_all_part_states():
+            part.octave += 1
+
+    def _process_octave_down(self, node: OctaveDownNode) -> None:
+        """Lower the octave of all active parts."""
+        for part in self._get_all_part_states():
+            part.octave -= 1
+
+    def _process_bracketed_sequence(self, node: BracketedSequenceNode) -> None:
+        """Process the events of a bracketed sequence."""
+        self._process_event_sequence(node.events)
+
+    def _ignore_node(self, node: ASTNode) -> None:
+        """Skip nodes with no musical effect (e.g. barlines, which are visual)."""
 
     def _process_part(self, node: PartNode) -> None:
         """Process a part declaration and its events."""
@@ -270,9 +256,12 @@ class MidiGenerator:
 
             # Create or get part state
             if part_name not in self.state.parts:
-                # Determine MIDI program from instrument name
-                normalized = name.lower().replace("_", "-")
-                program = INSTRUMENT_PROGRAMS.get(normalized, 0)
+                # Determine MIDI program from instrument name, normalizing
+                # only names that miss the table as written
+                program = INSTRUMENT_PROGRAMS.get(name)
+                if program is None:
+                    normalized = name.lower().replace("_", "-")
+                    program = INSTRUMENT_PROGRAMS.get(normalized, 0)
 
                 channel = self.state.next_channel
                 self.state.next_channel = min(15, self.state.next_channel + 1)
@@ -896,6 +885,46 @@ class MidiGenerator:
         return count
 
 
+# Exact node type -> handler, so dispatch is one dict lookup per node
+_NODE_HANDLERS: dict[type, Callable[[MidiGenerator, Any], Any]] = {
+    PartNode: MidiGenerator._process_part,
+    EventSequenceNode: MidiGenerator._process_event_sequence,
+    NoteNode: MidiGenerator._process_note,
+    RestNode: MidiGenerator._process_rest,
+    ChordNode: MidiGenerator._process_chord,
+    OctaveSetNode: MidiGenerator._process_octave_set,
+    OctaveUpNode: MidiGenerator._process_octave_up,
+    OctaveDownNode: MidiGenerator._process_octave_down,
+    BarlineNode: MidiGenerator._ignore_node,
+    LispListNode: MidiGenerator._process_lisp_list,
+    VariableDefinitionNode: MidiGenerator._process_variable_definition,
+    VariableReferenceNode: MidiGenerator._process_variable_reference,
+    MarkerNode: MidiGenerator._process_marker,
+    AtMarkerNode: MidiGenerator._process_at_marker,
+    VoiceGroupNode: MidiGenerator._process_voice_group,
+    CramNode: MidiGenerator._process_cram,
+    RepeatNode: MidiGenerator._process_repeat,
+    OnRepetitionsNode: MidiGenerator._process_on_repetitions,
+    BracketedSequenceNode: MidiGenerator._process_bracketed_sequence,
+}
+
+
+def _resolve_node_handler(node_type: type) -> Callable[[MidiGenerator, Any], Any]:
+    """Find and cache the handler for a node type missing from the table.
+
+    Subclasses of known node types use their base's handler; anything else
+    is ignored.
+    """
+    for base in node_type.__mro__[1:]:
+        handler = _NODE_HANDLERS.get(base)
+        if handler is not None:
+            break
+    else:
+        handler = MidiGenerator._ignore_node
+    _NODE_HANDLERS[node_type] = handler
+    return handler
+
+
 def generate_midi(ast: RootNode) -> MidiSequence:
     """Convenience function to generate MIDI from an AST.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..ast_nodes import (
     ChordNode,
@@ -18,6 +19,7 @@ from ..ast_nodes import (
     RestNode,
     RootNode,
 )
+from ..constants import DURATION_LOOKUP_CACHE_SIZE
 from .types import INSTRUMENT_PROGRAMS, MidiNote, MidiSequence
 
 # MIDI pitch to note letter and accidental
@@ -75,8 +77,14 @@ for name, program in INSTRUMENT_PROGRAMS.items():
     if program not in PROGRAM_TO_INSTRUMENT:
         PROGRAM_TO_INSTRUMENT[program] = name
 
+# Dense program -> instrument table covering every 7-bit program number,
+# with unmapped programs falling back to piano.
+_PROGRAM_INSTRUMENTS: tuple[str, ...] = tuple(
+    PROGRAM_TO_INSTRUMENT.get(program, "piano") for program in range(128)
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class _QuantizedNote:
     """A note with quantized timing and duration."""
 
@@ -87,6 +95,28 @@ class _QuantizedNote:
     channel: int
     start_seconds: float
     duration_seconds: float
+    duration_value: int
+    dots: int
+
+
+def _compute_pitch_note(pitch: int) -> tuple[str, int, tuple[str, ...]]:
+    """Compute (letter, octave, accidentals) for a MIDI pitch arithmetically."""
+    # MIDI note 60 = C4
+    # octave = pitch // 12 - 1
+    # C0 = MIDI 12
+    octave = (pitch // 12) - 1
+    pitch_class = pitch % 12
+
+    letter, accidentals = PITCH_CLASS_TO_NOTE[pitch_class]
+    return letter, octave, tuple(accidentals)
+
+
+# MIDI pitch -> (letter, octave, accidentals) for the whole 0-127 range.
+# Accidentals are stored as tuples and copied into a fresh list per call, so
+# no two NoteNodes share a mutable list.
+_PITCH_TABLE: tuple[tuple[str, int, tuple[str, ...]], ...] = tuple(
+    map(_compute_pitch_note, range(128))
+)
 
 
 def midi_pitch_to_note(pitch: int) -> tuple[str, int, list[str]]:
@@ -98,14 +128,11 @@ def midi_pitch_to_note(pitch: int) -> tuple[str, int, list[str]]:
     Returns:
         Tuple of (letter, octave, accidentals).
     """
-    # MIDI note 60 = C4
-    # octave = pitch // 12 - 1
-    # C0 = MIDI 12
-    octave = (pitch // 12) - 1
-    pitch_class = pitch % 12
-
-    letter, accidentals = PITCH_CLASS_TO_NOTE[pitch_class]
-    return letter, octave, accidentals
+    if 0 <= pitch <= 127:
+        letter, octave, accidentals = _PITCH_TABLE[pitch]
+    else:
+        letter, octave, accidentals = _compute_pitch_note(pitch)
+    return letter, octave, list(accidentals)
 
 
 def seconds_to_beats(seconds: float, bpm: float) -> float:
@@ -121,6 +148,20 @@ def _make_duration_node(denominator: int, dots: int = 0) -> DurationNode:
     )
 
 
+def _pooled_duration_node(
+    pool: dict[tuple[int, int], DurationNode], denominator: int, dots: int
+) -> DurationNode:
+    """Return the pool's DurationNode for (denominator, dots), creating it once.
+
+    Imported parts repeat a few durations, so one conversion shares a node
+    per distinct length, as it already shares accidental lists per pitch.
+    """
+    node = pool.get((denominator, dots))
+    if node is None:
+        node = pool[denominator, dots] = _make_duration_node(denominator, dots)
+    return node
+
+
 def _make_tempo_node(bpm: float, global_: bool = False) -> LispListNode:
     """Create a tempo or tempo! lisp node."""
     symbol = "tempo!" if global_ else "tempo"
@@ -145,8 +186,14 @@ def beats_to_duration(beats: float) -> tuple[int, int]:
     """
     candidate = beats
     expected = getattr(candidate, "expected", candidate)
-    beats = float(expected)
+    return _closest_duration(float(expected))
 
+
+# Quantized imports repeat a handful of beat lengths, so each distinct value
+# is matched against the duration tables only once
+@lru_cache(maxsize=DURATION_LOOKUP_CACHE_SIZE)
+def _closest_duration(beats: float) -> tuple[int, int]:
+    """Match a beat length to (duration_value, dots); see beats_to_duration."""
     if beats <= 0:
         return 4, 0  # Default to quarter note
 
@@ -251,7 +298,10 @@ def midi_to_ast(
 
         # Determine instrument
         program = channel_programs.get(channel, 0)
-        instrument_name = PROGRAM_TO_INSTRUMENT.get(program, "piano")
+        if 0 <= program < 128:
+            instrument_name = _PROGRAM_INSTRUMENTS[program]
+        else:
+            instrument_name = PROGRAM_TO_INSTRUMENT.get(program, "piano")
 
         # Create part declaration
         part_node = PartDeclarationNode(
@@ -276,19 +326,29 @@ def midi_to_ast(
 def _quantize_notes(
     notes: list[MidiNote], bpm: float, grid: float
 ) -> list[_QuantizedNote]:
-    """Quantize notes to a grid."""
+    """Quantize notes to a grid.
+
+    Same arithmetic as ``seconds_to_beats``, ``quantize_to_grid`` and
+    ``beats_to_duration``, fused into one pass so each note's notated
+    duration is resolved alongside its quantized timing.
+    """
     result = []
+    quantize = grid > 0
 
     for note in notes:
-        start_beats = seconds_to_beats(note.start_time, bpm)
-        duration_beats = seconds_to_beats(note.duration, bpm)
-
-        # Quantize start time
-        start_beats = quantize_to_grid(start_beats, grid)
-
-        # Quantize duration to nearest standard value
-        duration_beats = max(grid, quantize_to_grid(duration_beats, grid))
+        start_beats = note.start_time * bpm / 60.0
+        duration_beats = note.duration * bpm / 60.0
+
+        if quantize:
+            # Each start snaps to its own nearest grid point, so rounding
+            # error never accumulates along the track
+            start_beats = round(start_beats / grid) * grid
+            # Quantize duration to nearest standard value
+            duration_beats = max(grid, round(duration_beats / grid) * grid)
+        else:
+            duration_beats = max(grid, duration_beats)
 
+        duration_value, dots = _closest_duration(duration_beats)
         result.append(
             _QuantizedNote(
                 pitch=note.pitch,
@@ -298,6 +358,8 @@ def _quantize_notes(
                 channel=note.channel,
                 start_seconds=note.start_time,
                 duration_seconds=note.duration,
+                duration_value=duration_value,
+                dots=dots,
             )
         )
 
@@ -317,20 +379,28 @@ def _notes_to_events(
     current_beat = 0.0
     current_octave = 4  # Default octave
     tempo_index = 0
+    duration_pool: dict[tuple[int, int], DurationNode] = {}
+    # Time of the next pending tempo change; notes before it skip the merge
+    next_tempo_time = tempo_events[0][0] if tempo_events else float("inf")
 
     i = 0
     while i < len(notes):
         note = notes[i]
-        tempo_index = _emit_due_tempos(
-            tempo_events, tempo_index, note.start_seconds, events
-        )
+        if next_tempo_time <= note.start_seconds + 1e-4:
+            tempo_index = _emit_due_tempos(
+                tempo_events, tempo_index, note.start_seconds, events
+            )
+            if tempo_index < len(tempo_events):
+                next_tempo_time = tempo_events[tempo_index][0]
+            else:
+                next_tempo_time = float("inf")
 
         # Insert rest if there's a gap
         gap = note.start_beat - current_beat
         if gap > 0.01:
-            rest_duration, rest_dots = beats_to_duration(gap)
+            rest_duration, rest_dots = _closest_duration(gap)
             rest_node = RestNode(
-                duration=_make_duration_node(rest_duration, rest_dots),
+                duration=_pooled_duration_node(duration_pool, rest_duration, rest_dots),
                 position=None,
             )
             events.append(rest_node)
@@ -347,7 +417,8 @@ def _notes_to_events(
             # Create chord
             chord_elements = []
             chord_duration = chord_notes[0].duration_beats
-            duration_val, dots = beats_to_duration(chord_duration)
+            duration_val = chord_notes[0].duration_value
+            dots = chord_notes[0].dots
 
             # Set octave for first note of chord if needed
             first_letter, first_octave, first_acc = midi_pitch_to_note(
@@ -361,7 +432,9 @@ def _notes_to_events(
                 letter, octave, accidentals = midi_pitch_to_note(cn.pitch)
                 # Duration goes on first note only (Alda convention)
                 note_duration = (
-                    _make_duration_node(duration_val, dots) if idx == 0 else None
+                    _pooled_duration_node(duration_pool, duration_val, dots)
+                    if idx == 0
+                    else None
                 )
                 chord_elements.append(
                     NoteNode(
@@ -384,7 +457,8 @@ def _notes_to_events(
         else:
             # Single note
             letter, octave, accidentals = midi_pitch_to_note(note.pitch)
-            duration_val, dots = beats_to_duration(note.duration_beats)
+            duration_val = note.duration_value
+            dots = note.dots
 
             # Set octave if changed
             if octave != current_octave:
@@ -394,7 +468,7 @@ def _notes_to_events(
             note_node = NoteNode(
                 letter=letter,
                 accidentals=accidentals,
-                duration=_make_duration_node(duration_val, dots),
+                duration=_pooled_duration_node(duration_pool, duration_val, dots),
                 slurred=False,
                 position=None,
             )
@@ -412,6 +486,11 @@ def _emit_due_tempos(
     target_time: float,
     events: list,
 ) -> int:
+    """Append tempo nodes due by ``target_time``; return the next index.
+
+    Notes and tempo events are both sorted by time, so callers advance one
+    shared index and the merge is a single pass over each list.
+    """
     while index < len(tempo_events) and tempo_events[index][0] <= target_time + 1e-4:
         events.append(_make_tempo_node(tempo_events[index][1], global_=False))
         index += 1
@@ -1,9 +1,16 @@
 """Standard MIDI File (SMF) writer."""
 
 import struct
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
-from .types import MidiSequence
+from ..constants import TEMPO_MAP_CACHE_SIZE
+from .types import MidiControlChange, MidiNote, MidiProgramChange, MidiSequence
+
+_DEFAULT_TEMPO_US = 500000  # 120 BPM
 
 
 def _write_variable_length(value: int) -> bytes:
@@ -11,19 +18,20 @@ def _write_variable_length(value: int) -> bytes:
     if value < 0:
         raise ValueError("Variable-length value must be non-negative")
 
-    if value == 0:
-        return b"\x00"
-
-    result = []
-    while value:
-        result.append(value & 0x7F)
-        value >>= 7
-
-    # Reverse and set continuation bits
-    result.reverse()
-    for i in range(len(result) - 1):
-        result[i] |= 0x80
+    if value < 0x80:
+        return bytes((value,))
+    if value < 0x4000:
+        # Two bytes covers every delta up to 16383 ticks
+        return bytes((0x80 | (value >> 7), value & 0x7F))
 
+    # 7-bit groups, most significant first, with the continuation bit set on
+    # all but the last
+    shift = (value.bit_length() - 1) // 7 * 7
+    result = bytearray()
+    while shift:
+        result.append(0x80 | ((value >> shift) & 0x7F))
+        shift -= 7
+    result.append(value & 0x7F)
     return bytes(result)
 
 
@@ -46,65 +54,77 @@ def _seconds_to_ticks_simple(seconds: float, ticks_per_beat: int, tempo_us: int)
     return int(beats * ticks_per_beat)
 
 
+# Tempo points for a tempo-change list, keyed on its (time, bpm) pairs, so
+# sequences sharing a tempo layout share the segment precomputation
+@lru_cache(maxsize=TEMPO_MAP_CACHE_SIZE)
+def _build_tempo_points(
+    changes: tuple[tuple[float, float], ...], ticks_per_beat: int
+) -> tuple[tuple[tuple[float, int, int], ...], tuple[float, ...]]:
+    """Precompute (time_seconds, tempo_us, tick) for each tempo change.
+
+    Returns:
+        The tempo points and, separately, their times for binary search.
+    """
+    if not changes:
+        # No tempo changes - everything at default tempo
+        return ((0.0, _DEFAULT_TEMPO_US, 0),), (0.0,)
+
+    tempo_points: list[tuple[float, int, int]] = []
+
+    # First tempo change may not be at t=0, so handle initial segment
+    current_tick = 0
+    current_time = 0.0
+    current_tempo_us = _DEFAULT_TEMPO_US
+
+    for time, bpm in sorted(changes, key=lambda c: c[0]):
+        if time > current_time:
+            # Compute ticks elapsed during this segment
+            segment_duration = time - current_time
+            segment_ticks = _seconds_to_ticks_simple(
+                segment_duration, ticks_per_beat, current_tempo_us
+            )
+            current_tick += segment_ticks
+
+        # Record this tempo change point
+        new_tempo_us = _bpm_to_tempo(bpm)
+        tempo_points.append((time, new_tempo_us, current_tick))
+        current_time = time
+        current_tempo_us = new_tempo_us
+
+    # If first tempo change wasn't at t=0, insert the initial segment
+    if tempo_points[0][0] > 0:
+        tempo_points.insert(0, (0.0, _DEFAULT_TEMPO_US, 0))
+
+    return tuple(tempo_points), tuple(point[0] for point in tempo_points)
+
+
 class TempoMap:
     """Maps absolute time (seconds) to MIDI ticks, accounting for tempo changes."""
 
     def __init__(self, sequence: "MidiSequence") -> None:
         self.ticks_per_beat = sequence.ticks_per_beat
-        self.default_tempo_us = 500000  # 120 BPM
-
-        # Build sorted list of (time_seconds, tempo_us, tick_at_this_time)
-        # We precompute tick positions for each tempo change
-        self._tempo_points: list[tuple[float, int, int]] = []
-
-        if not sequence.tempo_changes:
-            # No tempo changes - everything at default tempo
-            self._tempo_points = [(0.0, self.default_tempo_us, 0)]
-            return
-
-        sorted_changes = sorted(sequence.tempo_changes, key=lambda t: t.time)
-
-        # First tempo change may not be at t=0, so handle initial segment
-        current_tick = 0
-        current_time = 0.0
-        current_tempo_us = self.default_tempo_us
-
-        for tc in sorted_changes:
-            if tc.time > current_time:
-                # Compute ticks elapsed during this segment
-                segment_duration = tc.time - current_time
-                segment_ticks = _seconds_to_ticks_simple(
-                    segment_duration, self.ticks_per_beat, current_tempo_us
-                )
-                current_tick += segment_ticks
-
-            # Record this tempo change point
-            new_tempo_us = _bpm_to_tempo(tc.bpm)
-            self._tempo_points.append((tc.time, new_tempo_us, current_tick))
-            current_time = tc.time
-            current_tempo_us = new_tempo_us
-
-        # If first tempo change wasn't at t=0, insert the initial segment
-        if self._tempo_points[0][0] > 0:
-            self._tempo_points.insert(0, (0.0, self.default_tempo_us, 0))
+        self.default_tempo_us = _DEFAULT_TEMPO_US
+
+        # Sorted (time_seconds, tempo_us, tick_at_this_time) per tempo change,
+        # plus the point times alone for binary search in seconds_to_ticks
+        changes = tuple((tc.time, tc.bpm) for tc in sequence.tempo_changes)
+        self._tempo_points, self._point_times = _build_tempo_points(
+            changes, self.ticks_per_beat
+        )
 
     def seconds_to_ticks(self, seconds: float) -> int:
         """Convert absolute time in seconds to MIDI ticks."""
         if seconds <= 0:
             return 0
 
-        # Find the tempo segment containing this timestamp
-        # Walk through tempo points to find the last one <= seconds
-        last_point_time = 0.0
-        last_point_tempo_us = self.default_tempo_us
-        last_point_tick = 0
-
-        for point_time, point_tempo_us, point_tick in self._tempo_points:
-            if point_time > seconds:
-                break
-            last_point_time = point_time
-            last_point_tempo_us = point_tempo_us
-            last_point_tick = point_tick
+        # Find the tempo segment containing this timestamp: the last tempo
+        # point at or before it
+        index = bisect_right(self._point_times, seconds) - 1
+        if index < 0:
+            point = (0.0, self.default_tempo_us, 0)
+        else:
+            point = self._tempo_points[index]
+        last_point_time, last_point_tempo_us, last_point_tick = point
 
         # Compute ticks from last tempo change point to target time
         remaining_duration = seconds - last_point_time
@@ -130,36 +150,35 @@ def write_midi_file(sequence: MidiSequence, path: Path | str) -> None:
     # Build tempo map for accurate time-to-tick conversion
     tempo_map = TempoMap(sequence)
 
-    # Group notes by channel
+    # Group notes by channel, so each track only visits its own notes
     channels: dict[int, list] = {}
     for note in sequence.notes:
-        if note.channel not in channels:
-            channels[note.channel] = []
-        channels[note.channel].append(note)
+        channels.setdefault(note.channel, []).append(note)
 
-    # Add program changes to their channels
+    # Group program and control changes the same way, so building a track
+    # never rescans another channel's events
+    programs: dict[int, list] = {}
     for pc in sequence.program_changes:
-        if pc.channel not in channels:
-            channels[pc.channel] = []
-
-    tracks: list[bytes] = []
-
-    # Track 0: tempo track
-    tempo_track_data = _build_tempo_track(sequence, tempo_map)
-    tracks.append(tempo_track_data)
-
-    # One track per channel
-    for channel in sorted(channels.keys()):
-        track_data = _build_channel_track(sequence, channel, tempo_map)
-        tracks.append(track_data)
-
-    # Build the complete file
-    output = _build_header(len(tracks), sequence.ticks_per_beat)
-    for track_data in tracks:
-        output += _build_track_chunk(track_data)
-
-    # Write to file
-    Path(path).write_bytes(output)
+        channels.setdefault(pc.channel, [])
+        programs.setdefault(pc.channel, []).append(pc)
+    controls: dict[int, list] = {}
+    for cc in sequence.control_changes:
+        controls.setdefault(cc.channel, []).append(cc)
+
+    # Write each track as soon as it is built, so only one is held in memory
+    with open(path, "wb") as f:
+        # Track 0 is the tempo track, followed by one track per channel
+        f.write(_build_header(len(channels) + 1, sequence.ticks_per_beat))
+        _write_track_chunk(f, _build_tempo_track(sequence, tempo_map))
+        for channel in sorted(channels.keys()):
+            track_data = _build_channel_track(
+                channel,
+                channels[channel],
+                programs.get(channel, ()),
+                controls.get(channel, ()),
+                tempo_map,
+            )
+            _write_track_chunk(f, track_data)
 
 
 def _build_header(num_tracks: int, ticks_per_beat: int) -> bytes:
@@ -171,12 +190,13 @@ def _build_header(num_tracks: int, ticks_per_beat: int) -> bytes:
     return b"MThd" + struct.pack(">I", len(header_data)) + header_data
 
 
-def _build_track_chunk(track_data: bytes) -> bytes:
-    """Wrap track data in an MTrk chunk."""
-    return b"MTrk" + struct.pack(">I", len(track_data)) + track_data
+def _write_track_chunk(f: BinaryIO, track_data: bytes | bytearray) -> None:
+    """Write track data as an MTrk chunk without copying it into the header."""
+    f.write(b"MTrk" + struct.pack(">I", len(track_data)))
+    f.write(track_data)
 
 
-def _build_tempo_track(sequence: MidiSequence, tempo_map: TempoMap) -> bytes:
+def _build_tempo_track(sequence: MidiSequence, tempo_map: TempoMap) -> bytearray:
     """Build the tempo track (track 0)."""
     events: list[tuple[int, bytes]] = []
 
@@ -205,65 +225,72 @@ def _build_tempo_track(sequence: MidiSequence, tempo_map: TempoMap) -> bytes:
 
 
 def _build_channel_track(
-    sequence: MidiSequence, channel: int, tempo_map: TempoMap
-) -> bytes:
-    """Build a track for a specific MIDI channel."""
+    channel: int,
+    notes: Sequence[MidiNote],
+    program_changes: Sequence[MidiProgramChange],
+    control_changes: Sequence[MidiControlChange],
+    tempo_map: TempoMap,
+) -> bytearray:
+    """Build a track for a specific MIDI channel from that channel's events."""
     events: list[tuple[int, bytes]] = []
 
     # Add program changes
-    for pc in sequence.program_changes:
-        if pc.channel == channel:
-            tick = tempo_map.seconds_to_ticks(pc.time)
-            # Program change: Cn pp
-            msg = bytes([0xC0 | (channel & 0x0F), pc.program & 0x7F])
-            events.append((tick, msg))
+    for pc in program_changes:
+        tick = tempo_map.seconds_to_ticks(pc.time)
+        # Program change: Cn pp
+        msg = bytes([0xC0 | (channel & 0x0F), pc.program & 0x7F])
+        events.append((tick, msg))
 
     # Add control changes
-    for cc in sequence.control_changes:
-        if cc.channel == channel:
-            tick = tempo_map.seconds_to_ticks(cc.time)
-            # Control change: Bn cc vv
-            msg = bytes([0xB0 | (channel & 0x0F), cc.control & 0x7F, cc.value & 0x7F])
-            events.append((tick, msg))
+    for cc in control_changes:
+        tick = tempo_map.seconds_to_ticks(cc.time)
+        # Control change: Bn cc vv
+        msg = bytes([0xB0 | (channel & 0x0F), cc.control & 0x7F, cc.value & 0x7F])
+        events.append((tick, msg))
 
     # Add note on/off events
-    for note in sequence.notes:
-        if note.channel == channel:
-            start_tick = tempo_map.seconds_to_ticks(note.start_time)
-            end_tick = tempo_map.seconds_to_ticks(note.start_time + note.duration)
+    seconds_to_ticks = tempo_map.seconds_to_ticks
+    note_on_status = 0x90 | (channel & 0x0F)
+    note_off_status = 0x80 | (channel & 0x0F)
+    for note in notes:
+        start_tick = seconds_to_ticks(note.start_time)
+        end_tick = seconds_to_ticks(note.start_time + note.duration)
 
-            # Note on: 9n kk vv
-            note_on = bytes(
-                [0x90 | (channel & 0x0F), note.pitch & 0x7F, note.velocity & 0x7F]
-            )
-            # Note off: 8n kk vv
-            note_off = bytes([0x80 | (channel & 0x0F), note.pitch & 0x7F, 0])
+        # Note on: 9n kk vv
+        note_on = bytes((note_on_status, note.pitch & 0x7F, note.velocity & 0x7F))
+        # Note off: 8n kk vv
+        note_off = bytes((note_off_status, note.pitch & 0x7F, 0))
 
-            events.append((start_tick, note_on))
-            events.append((end_tick, note_off))
+        events.append((start_tick, note_on))
+        events.append((end_tick, note_off))
 
     # Sort events: by tick, then note_off before note_on at same tick
     events.sort(key=lambda e: (e[0], e[1][0] & 0xF0 != 0x80))
 
-    # End of track
-    if events:
-        last_tick = max(e[0] for e in events)
-    else:
-        last_tick = 0
+    # End of track, at the last (sorted) event's tick
+    last_tick = events[-1][0] if events else 0
     events.append((last_tick, b"\xff\x2f\x00"))
 
     return _encode_track_events(events)
 
 
-def _encode_track_events(events: list[tuple[int, bytes]]) -> bytes:
-    """Encode a list of (absolute_tick, event_bytes) to track data with delta times."""
+def _encode_track_events(events: list[tuple[int, bytes]]) -> bytearray:
+    """Encode a list of (absolute_tick, event_bytes) to track data with delta times.
+
+    The growing buffer is returned as is; the writer only reads it, so
+    copying it into ``bytes`` would duplicate the whole track.
+    """
     result = bytearray()
     last_tick = 0
 
     for tick, event_data in events:
-        delta = max(0, tick - last_tick)
-        result.extend(_write_variable_length(delta))
-        result.extend(event_data)
+        delta = tick - last_tick
+        if delta < 0x80:
+            # Zero, negative (clamped) and short deltas fit in one byte
+            result.append(delta if delta > 0 else 0)
+        else:
+            result += _write_variable_length(delta)
+        result += event_data
         last_tick = tick
 
-    return bytes(result)
+    return result
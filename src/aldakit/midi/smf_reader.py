@@ -21,7 +21,7 @@ class MidiParseError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class _PendingNote:
     """A note that has started but not yet ended."""
 
@@ -31,7 +31,7 @@ class _PendingNote:
     channel: int
 
 
-def _read_variable_length(data: bytes, offset: int) -> tuple[int, int]:
+def _read_variable_length(data: bytes | memoryview, offset: int) -> tuple[int, int]:
     """Read a MIDI variable-length quantity.
 
     Returns:
@@ -94,20 +94,21 @@ def read_midi_file(path: Path | str) -> MidiSequence:
         MidiParseError: If the file cannot be parsed.
     """
     data = Path(path).read_bytes()
+    # Track chunks are sliced from a view, so they are never copied
+    view = memoryview(data)
 
     if len(data) < 14:
         raise MidiParseError("File too small to be a valid MIDI file")
 
     # Parse header chunk
-    header_type = data[0:4]
+    header_type, header_length = struct.unpack_from(">4sI", data, 0)
     if header_type != b"MThd":
         raise MidiParseError(f"Invalid MIDI file: expected MThd, got {header_type!r}")
 
-    header_length = struct.unpack(">I", data[4:8])[0]
     if header_length < 6:
         raise MidiParseError(f"Invalid header length: {header_length}")
 
-    format_type, num_tracks, time_division = struct.unpack(">HHH", data[8:14])
+    format_type, num_tracks, time_division = struct.unpack_from(">HHH", data, 8)
 
     # Check for SMPTE time division (not supported)
     if time_division & 0x8000:
@@ -123,14 +124,13 @@ def read_midi_file(path: Path | str) -> MidiSequence:
         if offset + 8 > len(data):
             raise MidiParseError("Unexpected end of file reading track header")
 
-        track_type = data[offset : offset + 4]
+        track_type, track_length = struct.unpack_from(">4sI", data, offset)
         if track_type != b"MTrk":
             raise MidiParseError(
                 f"Invalid track chunk: expected MTrk, got {track_type!r}"
             )
 
-        track_length = struct.unpack(">I", data[offset + 4 : offset + 8])[0]
-        track_data = data[offset + 8 : offset + 8 + track_length]
+        track_data = view[offset + 8 : offset + 8 + track_length]
 
         events = _parse_track_events(track_data)
         tracks_data.append(events)
@@ -152,20 +152,26 @@ def read_midi_file(path: Path | str) -> MidiSequence:
     return sequence
 
 
-def _parse_track_events(track_data: bytes) -> list[tuple[int, bytes]]:
+def _parse_track_events(track_data: bytes | memoryview) -> list[tuple[int, bytes]]:
     """Parse a track chunk into a list of (absolute_tick, event_bytes) tuples."""
     events: list[tuple[int, bytes]] = []
     offset = 0
     absolute_tick = 0
     running_status: int | None = None
+    end = len(track_data)
 
-    while offset < len(track_data):
-        # Read delta time
-        delta, consumed = _read_variable_length(track_data, offset)
-        offset += consumed
-        absolute_tick += delta
+    while offset < end:
+        # Read delta time, inlining the common single-byte case
+        byte = track_data[offset]
+        if byte < 0x80:
+            offset += 1
+            absolute_tick += byte
+        else:
+            delta, consumed = _read_variable_length(track_data, offset)
+            offset += consumed
+            absolute_tick += delta
 
-        if offset >= len(track_data):
+        if offset >= end:
             break
 
         # Read event
@@ -187,7 +193,7 @@ def _parse_track_events(track_data: bytes) -> list[tuple[int, bytes]]:
 
         if status_byte == 0xFF:
             # Meta event
-            if offset + 1 >= len(track_data):
+            if offset + 1 >= end:
                 break
             meta_type = track_data[offset]
             offset += 1
@@ -211,7 +217,7 @@ def _parse_track_events(track_data: bytes) -> list[tuple[int, bytes]]:
 
             if msg_type in (0x80, 0x90, 0xA0, 0xB0, 0xE0):
                 # Two data bytes
-                if offset + 1 >= len(track_data):
+                if offset + 1 >= end:
                     break
                 data1 = track_data[offset]
                 data2 = track_data[offset + 1]
@@ -220,7 +226,7 @@ def _parse_track_events(track_data: bytes) -> list[tuple[int, bytes]]:
 
             elif msg_type in (0xC0, 0xD0):
                 # One data byte
-                if offset >= len(track_data):
+                if offset >= end:
                     break
                 data1 = track_data[offset]
                 offset += 1
@@ -7,38 +7,63 @@ SoundFont files for use with the TinySoundFont backend.
 from __future__ import annotations
 
 import hashlib
+import hmac
 import os
-import shutil
-import tempfile
+import queue
+import threading
+import time
+import urllib.error
 import urllib.request
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
+
+
+@dataclass(frozen=True, slots=True)
+class SoundFontEntry:
+    """A downloadable SoundFont in the catalog."""
+
+    url: str
+    filename: str
+    size_mb: float = 0
+    description: str = ""
+    sha256: str | None = None  # Hex checksum of the file
+    sha256_digest: bytes | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        digest = bytes.fromhex(self.sha256) if self.sha256 else None
+        object.__setattr__(self, "sha256_digest", digest)
+
 
 # Available SoundFonts for download (public domain / freely distributable)
-SOUNDFONT_CATALOG: dict[str, dict] = {
-    "FluidR3_GM": {
-        "url": "https://musical-artifacts.com/artifacts/738/FluidR3_GM.sf2",
-        "filename": "FluidR3_GM.sf2",
-        "size_mb": 141,
-        "description": "High-quality GM SoundFont (large)",
-        "sha256": "74594e8f4250680adf590507a306655a299935343583256f3b722c48a1bc1cb0",
-    },
-    "GeneralUser_GS": {
-        "url": "https://musical-artifacts.com/artifacts/6789/GeneralUser-GS.sf2",
-        "filename": "GeneralUser-GS.sf2",
-        "size_mb": 31,
-        "description": "Well-balanced GM/GS SoundFont",
-        "sha256": "c278464b823daf9c52106c0957f752817da0e52964817ff682fe3a8d2f8446ce",
-    },
-    "TimGM6mb": {
-        "url": "https://musical-artifacts.com/artifacts/7293/TimGM6mb.sf2",
-        "filename": "TimGM6mb.sf2",
-        "size_mb": 5.8,
-        "description": "Compact GM SoundFont, good quality for size",
-        "sha256": "82475b91a76de15cb28a104707d3247ba932e228bada3f47bba63c6b31aaf7a1",
-    },
+SOUNDFONT_CATALOG: dict[str, SoundFontEntry] = {
+    "FluidR3_GM": SoundFontEntry(
+        url="https://musical-artifacts.com/artifacts/738/FluidR3_GM.sf2",
+        filename="FluidR3_GM.sf2",
+        size_mb=141,
+        description="High-quality GM SoundFont (large)",
+        sha256="74594e8f4250680adf590507a306655a299935343583256f3b722c48a1bc1cb0",
+    ),
+    "GeneralUser_GS": SoundFontEntry(
+        url="https://musical-artifacts.com/artifacts/6789/GeneralUser-GS.sf2",
+        filename="GeneralUser-GS.sf2",
+        size_mb=31,
+        description="Well-balanced GM/GS SoundFont",
+        sha256="c278464b823daf9c52106c0957f752817da0e52964817ff682fe3a8d2f8446ce",
+    ),
+    "TimGM6mb": SoundFontEntry(
+        url="https://musical-artifacts.com/artifacts/7293/TimGM6mb.sf2",
+        filename="TimGM6mb.sf2",
+        size_mb=5.8,
+        description="Compact GM SoundFont, good quality for size",
+        sha256="82475b91a76de15cb28a104707d3247ba932e228bada3f47bba63c6b31aaf7a1",
+    ),
 }
 
+
 # Default SoundFont to download
 DEFAULT_SOUNDFONT = "TimGM6mb"
 
@@ -54,6 +79,10 @@ SOUNDFONT_NAMES = [
     "default.sf2",
 ]
 
+# Lookup forms of SOUNDFONT_NAMES used by SoundFontManager.find()
+_SOUNDFONT_NAME_SET: frozenset[str] = frozenset(SOUNDFONT_NAMES)
+_SOUNDFONT_NAME_RANK: dict[str, int] = {name: rank for rank, name in enumerate(SOUNDFONT_NAMES)}
+
 
 class SoundFontManager:
     """Manages SoundFont discovery, downloading, and setup.
@@ -75,7 +104,7 @@ class SoundFontManager:
     def __init__(
         self,
         soundfont_dir: Path | None = None,
-        catalog: dict[str, dict] | None = None,
+        catalog: Mapping[str, SoundFontEntry | dict] | None = None,
     ):
         """Initialize the SoundFont manager.
 
@@ -83,10 +112,27 @@ class SoundFontManager:
             soundfont_dir: Directory for storing downloaded SoundFonts.
                 Defaults to ~/.aldakit/soundfonts/
             catalog: Custom catalog of available SoundFonts. Defaults to
-                the built-in SOUNDFONT_CATALOG.
+                the built-in SOUNDFONT_CATALOG. Plain dict entries are
+                converted to SoundFontEntry.
         """
-        self._soundfont_dir = soundfont_dir or (Path.home() / ".aldakit" / "soundfonts")
-        self._catalog = catalog if catalog is not None else SOUNDFONT_CATALOG
+        # Resolved on first use; Path.home() fails when HOME can't be found
+        self._home: Path | None = None
+        self._soundfont_dir = soundfont_dir or (
+            self._home_dir() / ".aldakit" / "soundfonts"
+        )
+        if catalog is None:
+            self._catalog = SOUNDFONT_CATALOG
+        else:
+            self._catalog = {
+                name: info if isinstance(info, SoundFontEntry) else SoundFontEntry(**info)
+                for name, info in catalog.items()
+            }
+
+    def _home_dir(self) -> Path:
+        """Return the user's home directory, resolving it on first call."""
+        if self._home is None:
+            self._home = Path.home()
+        return self._home
 
     @property
     def soundfont_dir(self) -> Path:
@@ -94,9 +140,9 @@ class SoundFontManager:
         return self._soundfont_dir
 
     @property
-    def catalog(self) -> dict[str, dict]:
-        """The catalog of available SoundFonts for download."""
-        return self._catalog.copy()
+    def catalog(self) -> Mapping[str, SoundFontEntry]:
+        """Read-only view of the catalog of available SoundFonts for download."""
+        return MappingProxyType(self._catalog)
 
     def get_search_paths(self) -> list[Path]:
         """Get the list of paths searched for SoundFont files.
@@ -105,7 +151,7 @@ class SoundFontManager:
             List of directory paths to search.
         """
         search_paths: list[Path] = []
-        home = Path.home()
+        home = self._home_dir()
 
         # aldakit data directory (highest priority after env var)
         search_paths.append(self._soundfont_dir)
@@ -163,24 +209,24 @@ class SoundFontManager:
             if p.exists():
                 return p
 
-        search_paths = self.get_search_paths()
-
-        # Search for specific names first
-        for search_path in search_paths:
-            if not search_path.exists():
+        # Known names win in search-path order, so stop scanning at the
+        # first directory holding one; remember the first non-empty listing
+        # in case no directory does
+        fallback: tuple[Path, set[str]] | None = None
+        for search_path in self.get_search_paths():
+            names = self._scan_sf2_names(search_path)
+            if not names:
                 continue
-            for name in SOUNDFONT_NAMES:
-                sf_path = search_path / name
-                if sf_path.exists():
-                    return sf_path
+            known = names & _SOUNDFONT_NAME_SET
+            if known:
+                return search_path / min(known, key=_SOUNDFONT_NAME_RANK.__getitem__)
+            if fallback is None:
+                fallback = (search_path, names)
 
         # Fall back to any .sf2 file
-        for search_path in search_paths:
-            if not search_path.exists():
-                continue
-            sf2_files = sorted(search_path.glob("*.sf2"))
-            if sf2_files:
-                return sf2_files[0]
+        if fallback is not None:
+            search_path, names = fallback
+            return search_path / min(names)
 
         return None
 
@@ -203,22 +249,22 @@ class SoundFontManager:
 
         # Search all paths
         for search_path in self.get_search_paths():
-            if not search_path.exists():
-                continue
-            for sf_path in search_path.glob("*.sf2"):
+            for name in self._scan_sf2_names(search_path):
+                sf_path = search_path / name
                 if sf_path not in seen:
                     found.append(sf_path)
                     seen.add(sf_path)
 
         return sorted(found)
 
-    def list_available_downloads(self) -> dict[str, dict]:
+    def list_available_downloads(self) -> Mapping[str, SoundFontEntry]:
         """List SoundFonts available for download.
 
         Returns:
-            Dictionary of SoundFont names to their metadata.
+            Read-only mapping of SoundFont names to their metadata. Wrap it
+            in dict() if a mutable copy is needed.
         """
-        return self._catalog.copy()
+        return MappingProxyType(self._catalog)
 
     def download(
         self,
@@ -249,39 +295,38 @@ class SoundFontManager:
         info = self._catalog[name]
         target_dir = target_dir or self._soundfont_dir
         target_dir.mkdir(parents=True, exist_ok=True)
-        filename = str(info["filename"])
-        target_path = target_dir / filename
+        target_path = target_dir / info.filename
 
         # Skip if exists (unless force)
         if target_path.exists() and not force:
             return target_path
 
-        url = str(info["url"])
-
-        # Download to temp file first
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".sf2") as tmp:
-            tmp_path = Path(tmp.name)
-
-        try:
-            self._download_file(url, tmp_path, progress_callback)
-
-            # Verify hash if provided
-            if info.get("sha256"):
-                actual_hash = self._file_sha256(tmp_path)
-                if actual_hash != info["sha256"]:
-                    raise RuntimeError(
-                        f"Hash mismatch for {name}: expected {info['sha256']}, got {actual_hash}"
-                    )
-
-            # Move to target location
-            shutil.move(str(tmp_path), str(target_path))
-            return target_path
-
-        except Exception:
-            # Clean up temp file on error
-            if tmp_path.exists():
-                tmp_path.unlink()
-            raise
+        # Download next to the target so the final rename is atomic. A .part
+        # file left behind by an interrupted download is resumed, unless this
+        # is a forced download or there is no checksum to validate the result.
+        tmp_path = target_path.with_name(target_path.name + ".part")
+        if force or not info.sha256_digest:
+            tmp_path.unlink(missing_ok=True)
+        resumed = tmp_path.exists()
+        self._download_file(info.url, tmp_path, progress_callback, resume=True)
+
+        # Verify hash if provided
+        if info.sha256_digest:
+            actual_digest = self._file_sha256_digest(tmp_path)
+            if resumed and not hmac.compare_digest(actual_digest, info.sha256_digest):
+                # The leftover .part was stale or corrupt: download it afresh
+                tmp_path.unlink(missing_ok=True)
+                self._download_file(info.url, tmp_path, progress_callback)
+                actual_digest = self._file_sha256_digest(tmp_path)
+            if not hmac.compare_digest(actual_digest, info.sha256_digest):
+                tmp_path.unlink(missing_ok=True)
+                raise RuntimeError(
+                    f"Hash mismatch for {name}: expected {info.sha256}, "
+                    f"got {actual_digest.hex()}"
+                )
+
+        os.replace(tmp_path, target_path)
+        return target_path
 
     def ensure(
         self,
@@ -321,11 +366,12 @@ class SoundFontManager:
             print(f"SoundFont already available: {existing}")
             return existing
 
-        info = self._catalog.get(name, {})
-        print(f"Downloading {name} ({info.get('size_mb', '?')} MB)...")
-        print(f"  {info.get('description', '')}")
+        info = self._catalog.get(name)
+        if info is not None:
+            print(f"Downloading {name} ({info.size_mb} MB)...")
+            print(f"  {info.description}")
 
-        path = self.download(name, progress_callback=print_download_progress)
+        path = self.download(name, progress_callback=make_download_progress())
         print()  # Newline after progress
         print(f"Saved to: {path}")
         return path
@@ -349,23 +395,23 @@ class SoundFontManager:
         total_items = len(self._catalog)
 
         for idx, (name, info) in enumerate(self._catalog.items(), 1):
-            target_path = self._soundfont_dir / str(info["filename"])
+            target_path = self._soundfont_dir / info.filename
 
             if target_path.exists() and not force:
                 print(f"[{idx}/{total_items}] {name}: already exists, skipping")
                 downloaded_paths.append(target_path)
                 continue
 
-            print(f"[{idx}/{total_items}] Downloading {name} ({info.get('size_mb', '?')} MB)...")
-            print(f"  {info.get('description', '')}")
+            print(f"[{idx}/{total_items}] Downloading {name} ({info.size_mb} MB)...")
+            print(f"  {info.description}")
 
-            if not info.get("sha256"):
+            if not info.sha256:
                 print(f"  WARNING: No SHA256 checksum defined for {name}")
 
-            path = self.download(name, progress_callback=print_download_progress, force=force)
+            path = self.download(name, progress_callback=make_download_progress(), force=force)
             print()  # Newline after progress
             print(f"  Saved to: {path}")
-            print(f"  SHA256 verified: {info.get('sha256', 'N/A')[:16]}...")
+            print(f"  SHA256 verified: {(info.sha256 or 'N/A')[:16]}...")
             downloaded_paths.append(path)
 
         print(f"\nDownloaded {len(downloaded_paths)} SoundFont(s) to {self._soundfont_dir}")
@@ -381,63 +427,171 @@ class SoundFontManager:
             True if checksum matches, False if mismatch or file missing.
         """
         results: dict[str, bool] = {}
+        pending: dict[str, tuple[Path, bytes]] = {}
 
         for name, info in self._catalog.items():
-            target_path = self._soundfont_dir / str(info["filename"])
+            target_path = self._soundfont_dir / info.filename
 
             if not target_path.exists():
                 results[name] = False
                 continue
 
-            expected_hash = info.get("sha256")
-            if not expected_hash:
+            if not info.sha256_digest:
                 # No hash to verify, assume ok if file exists
                 results[name] = True
                 continue
 
-            actual_hash = self._file_sha256(target_path)
-            results[name] = actual_hash == expected_hash
+            # Placeholder keeps results in catalog order
+            results[name] = False
+            pending[name] = (target_path, info.sha256_digest)
+
+        if pending:
+            # hashlib releases the GIL while hashing, so files hash in parallel
+            workers = min(len(pending), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                actual_digests = executor.map(
+                    self._file_sha256_digest, [path for path, _ in pending.values()]
+                )
+                for (name, (_, expected_digest)), actual_digest in zip(
+                    pending.items(), actual_digests
+                ):
+                    results[name] = hmac.compare_digest(actual_digest, expected_digest)
 
         return results
 
+    @staticmethod
+    def _scan_sf2_names(directory: Path) -> set[str]:
+        """Return the names of .sf2 entries in a directory (empty if missing)."""
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name for entry in it if entry.name.endswith(".sf2")}
+        except OSError:
+            return set()
+
     @staticmethod
     def _download_file(
         url: str,
         target: Path,
         progress_callback: Callable[[int, int], None] | None = None,
+        resume: bool = False,
     ) -> None:
-        """Download a file with optional progress callback."""
-        request = urllib.request.Request(
-            url, headers={"User-Agent": "aldakit/0.1 (SoundFont downloader)"}
-        )
+        """Download a file with optional progress callback.
 
-        with urllib.request.urlopen(request, timeout=60) as response:
+        If resume is True and target already holds a partial download, an
+        HTTP Range request continues from its current size. A server that
+        ignores the range (200 instead of 206) restarts the file from scratch.
+        A 416 response (nothing left to fetch) leaves the file as it is, for
+        the caller's checksum to judge.
+        """
+        headers = {"User-Agent": "aldakit/0.1 (SoundFont downloader)"}
+        resume_from = target.stat().st_size if resume and target.exists() else 0
+        if resume_from:
+            headers["Range"] = f"bytes={resume_from}-"
+        request = urllib.request.Request(url, headers=headers)
+
+        try:
+            response = urllib.request.urlopen(request, timeout=60)
+        except urllib.error.HTTPError as e:
+            if e.code != 416 or not resume_from:
+                raise
+            # Range not satisfiable: the partial file is likely already complete
+            return
+
+        with response:
+            partial = bool(resume_from) and response.status == 206
+            downloaded = resume_from if partial else 0
             total_size = int(response.headers.get("Content-Length", 0))
-            downloaded = 0
-            chunk_size = 65536  # 64KB chunks
+            if total_size:
+                total_size += downloaded
+            chunk_size = 1 << 20  # 1MB chunks
+
+            with open(target, "ab" if partial else "wb", buffering=chunk_size) as f:
+                if hasattr(os, "posix_fadvise"):
+                    # Hint sequential writes to the kernel (POSIX only)
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                # Network reads run ahead on a helper thread while chunks are written
+                prefetch = SoundFontManager._prefetch_chunks(response.read, chunk_size)
+                with closing(prefetch) as chunks:
+                    for chunk in chunks:
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if progress_callback:
+                            progress_callback(downloaded, total_size)
 
-            with open(target, "wb") as f:
-                while True:
-                    chunk = response.read(chunk_size)
+    @staticmethod
+    def _prefetch_chunks(
+        read: Callable[[int], bytes],
+        chunk_size: int,
+        max_pending: int = 8,
+    ) -> Iterator[bytes]:
+        """Yield chunks from read() while a background thread reads ahead.
+
+        The reader thread stays up to max_pending chunks ahead of the consumer,
+        so blocking reads overlap with the consumer's work. Errors raised by
+        read() are re-raised in the consumer. Closing the generator signals
+        the reader thread to stop without waiting for a read in progress.
+        """
+        pending: queue.Queue[bytes | BaseException] = queue.Queue(maxsize=max_pending)
+        stop = threading.Event()
+
+        def reader() -> None:
+            try:
+                while not stop.is_set():
+                    chunk = read(chunk_size)
+                    pending.put(chunk)
                     if not chunk:
-                        break
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback:
-                        progress_callback(downloaded, total_size)
+                        return
+            except BaseException as e:
+                pending.put(e)
+
+        thread = threading.Thread(
+            target=reader, name="aldakit-soundfont-download", daemon=True
+        )
+        thread.start()
+        try:
+            while True:
+                item = pending.get()
+                if isinstance(item, BaseException):
+                    raise item
+                if not item:
+                    return
+                yield item
+        finally:
+            stop.set()
+            # Free the queue so a reader blocked on put() can exit. A reader
+            # stuck in read() exits on its own once the read returns (or the
+            # caller closes the response); its last put() then finds room.
+            try:
+                while True:
+                    pending.get_nowait()
+            except queue.Empty:
+                pass
 
     @staticmethod
-    def _file_sha256(path: Path) -> str:
-        """Calculate SHA256 hash of a file."""
+    def _file_sha256_digest(path: Path) -> bytes:
+        """Calculate the raw SHA256 digest of a file."""
         sha256 = hashlib.sha256()
         with open(path, "rb") as f:
             for chunk in iter(lambda: f.read(65536), b""):
                 sha256.update(chunk)
-        return sha256.hexdigest()
+        return sha256.digest()
+
+    @staticmethod
+    def _file_sha256(path: Path) -> str:
+        """Calculate SHA256 hash of a file as a hex string."""
+        return SoundFontManager._file_sha256_digest(path).hex()
+
+
+# Default manager instance, created on first use
+_default_manager: SoundFontManager | None = None
 
 
-# Default manager instance
-_default_manager = SoundFontManager()
+def _get_default_manager() -> SoundFontManager:
+    """Return the shared default manager, creating it on first call."""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = SoundFontManager()
+    return _default_manager
 
 
 # Module-level convenience functions (backwards compatibility)
@@ -445,8 +599,9 @@ _default_manager = SoundFontManager()
 
 def get_soundfont_dir() -> Path:
     """Get the aldakit SoundFont directory, creating it if needed."""
-    _default_manager.soundfont_dir.mkdir(parents=True, exist_ok=True)
-    return _default_manager.soundfont_dir
+    manager = _get_default_manager()
+    manager.soundfont_dir.mkdir(parents=True, exist_ok=True)
+    return manager.soundfont_dir
 
 
 def find_soundfont() -> Path | None:
@@ -455,7 +610,7 @@ def find_soundfont() -> Path | None:
     Returns:
         Path to a SoundFont file, or None if not found.
     """
-    return _default_manager.find()
+    return _get_default_manager().find()
 
 
 def list_soundfonts() -> list[Path]:
@@ -464,16 +619,16 @@ def list_soundfonts() -> list[Path]:
     Returns:
         List of paths to SoundFont files.
     """
-    return _default_manager.list()
+    return _get_default_manager().list()
 
 
-def list_available_downloads() -> dict[str, dict]:
+def list_available_downloads() -> Mapping[str, SoundFontEntry]:
     """List SoundFonts available for download.
 
     Returns:
-        Dictionary of SoundFont names to their metadata.
+        Read-only mapping of SoundFont names to their metadata.
     """
-    return _default_manager.list_available_downloads()
+    return _get_default_manager().list_available_downloads()
 
 
 def download_soundfont(
@@ -497,7 +652,7 @@ def download_soundfont(
         ValueError: If SoundFont name is not in catalog.
         RuntimeError: If download fails.
     """
-    return _default_manager.download(name, target_dir, progress_callback, force)
+    return _get_default_manager().download(name, target_dir, progress_callback, force)
 
 
 def ensure_soundfont(
@@ -517,21 +672,48 @@ def ensure_soundfont(
     Returns:
         Path to the SoundFont file.
     """
-    return _default_manager.ensure(name, progress_callback)
+    return _get_default_manager().ensure(name, progress_callback)
+
+
+_BYTES_PER_MB = 1024 * 1024
 
 
 def print_download_progress(downloaded: int, total: int) -> None:
     """Simple console progress printer."""
+    mb_down = downloaded / _BYTES_PER_MB
     if total > 0:
-        pct = (downloaded / total) * 100
-        mb_down = downloaded / (1024 * 1024)
-        mb_total = total / (1024 * 1024)
-        print(f"\rDownloading: {mb_down:.1f}/{mb_total:.1f} MB ({pct:.0f}%)", end="")
+        pct = downloaded * 100 / total
+        print(f"\rDownloading: {mb_down:.1f}/{total / _BYTES_PER_MB:.1f} MB ({pct:.0f}%)", end="")
     else:
-        mb_down = downloaded / (1024 * 1024)
         print(f"\rDownloading: {mb_down:.1f} MB", end="")
 
 
+def make_download_progress(min_interval: float = 0.05) -> Callable[[int, int], None]:
+    """Create a rate-limited console progress printer.
+
+    The returned callback behaves like print_download_progress() but prints
+    at most once every min_interval seconds. The final update (downloaded
+    equals total) is always printed.
+
+    Args:
+        min_interval: Minimum time between printed updates, in seconds.
+
+    Returns:
+        A callback(bytes_downloaded, total_bytes).
+    """
+    last_print = float("-inf")
+
+    def callback(downloaded: int, total: int) -> None:
+        nonlocal last_print
+        now = time.monotonic()
+        if now - last_print < min_interval and downloaded != total:
+            return
+        last_print = now
+        print_download_progress(downloaded, total)
+
+    return callback
+
+
 def setup_soundfont(name: str = DEFAULT_SOUNDFONT) -> Path:
     """Interactive SoundFont setup with progress display.
 
@@ -541,7 +723,7 @@ def setup_soundfont(name: str = DEFAULT_SOUNDFONT) -> Path:
     Returns:
         Path to the SoundFont file.
     """
-    return _default_manager.setup(name)
+    return _get_default_manager().setup(name)
 
 
 def setup_all_soundfonts(force: bool = False) -> list[Path]:
@@ -559,7 +741,7 @@ def setup_all_soundfonts(force: bool = False) -> list[Path]:
     Raises:
         RuntimeError: If any download fails or checksum verification fails.
     """
-    return _default_manager.setup_all(force)
+    return _get_default_manager().setup_all(force)
 
 
 def verify_soundfont_checksums() -> dict[str, bool]:
@@ -571,4 +753,4 @@ def verify_soundfont_checksums() -> dict[str, bool]:
         Dictionary mapping SoundFont names to verification status.
         True if checksum matches, False if mismatch or file missing.
     """
-    return _default_manager.verify_checksums()
+    return _get_default_manager().verify_checksums()
@@ -4,7 +4,11 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field, replace
-from typing import TYPE_CHECKING, Callable, Literal
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Iterator, Literal
 
 from .._libremidi import (  # type: ignore[import-not-found]
     MidiIn,
@@ -14,8 +18,11 @@ from .._libremidi import (  # type: ignore[import-not-found]
 from ..compose.attributes import Tempo
 from ..compose.core import Note, Rest, Seq, Cram, Chord
 from ..compose.part import Part
+from ..constants import TRANSCRIBE_TIMING_CACHE_SIZE
 from ..score import Score
 from .midi_to_ast import (
+    DOTTED_DURATION_VALUES,
+    DURATION_VALUES,
     beats_to_duration,
     duration_value_to_beats,
     midi_pitch_to_note,
@@ -29,8 +36,9 @@ if TYPE_CHECKING:
 # -----------------------------------------------------------------------------
 
 # Maximum time difference (seconds) for notes to be grouped into a chord.
-# Notes starting within this window are considered simultaneous.
-CHORD_GROUPING_TOLERANCE_SECONDS = 0.002
+# Notes starting within this window of a chord's first note are considered
+# simultaneous. Hand-played chords spread over roughly 10-30 ms.
+CHORD_GROUPING_TOLERANCE_SECONDS = 0.030
 
 # Minimum gap (seconds) between notes before inserting a rest.
 # Gaps smaller than this are absorbed into the preceding note.
@@ -41,8 +49,141 @@ MIN_REST_GAP_SECONDS = 0.05
 SWING_DETECTION_MIN_BEATS = 0.15
 SWING_DETECTION_MAX_BEATS = 0.85
 
+# Tempo range (BPM) over which swing eases off. At or below the first the
+# full swing_ratio applies; by the second the feel is straight (0.5).
+SWING_FULL_TEMPO_BPM = 120.0
+SWING_STRAIGHT_TEMPO_BPM = 180.0
 
-@dataclass
+_MIDI_PITCH_COUNT = 128
+
+# MIDI pitch -> (letter, octave, accidental), precomputed for note emission
+_PITCH_TABLE: tuple[tuple[str, int, str | None], ...] = tuple(
+    (letter, octave, accidentals[0] if accidentals else None)
+    for letter, octave, accidentals in map(midi_pitch_to_note, range(_MIDI_PITCH_COUNT))
+)
+
+# Note value denominators available to each feel when segmenting durations
+_PLAIN_DENOMINATORS = frozenset({1, 2, 4, 8, 16, 32, 64})
+_TRIPLET_DENOMINATORS = frozenset({6, 12, 24, 48})
+_QUINTUPLET_DENOMINATORS = frozenset({20, 40, 80})
+
+
+def _segment_table(
+    denominators: frozenset[int],
+) -> tuple[tuple[float, int, int], ...]:
+    """Build (beats, denominator, dots) entries for greedy segmentation.
+
+    Entries are limited to the given denominators and sorted longest first,
+    plain before dotted at equal length.
+    """
+    return tuple(
+        sorted(
+            [
+                (duration_value_to_beats(denom, 0), denom, 0)
+                for denom, _ in DURATION_VALUES
+                if denom in denominators
+            ]
+            + [
+                (duration_value_to_beats(denom, dots), denom, dots)
+                for denom, dots, _ in DOTTED_DURATION_VALUES
+                if denom in denominators
+            ],
+            key=lambda entry: (-entry[0], entry[2]),
+        )
+    )
+
+
+_PLAIN_SEGMENT_TABLE = _segment_table(_PLAIN_DENOMINATORS)
+
+
+@dataclass(frozen=True, slots=True)
+class _FeelSpec:
+    """How a transcription feel quantizes and describes its output."""
+
+    # Fixed quantization grid (beats), or None to use the session's grid
+    grid: float | None = None
+    # Notes per beat for tuplet feels, collapsed into crams
+    tuplet_division: int | None = None
+    # Whether alternating notes are quantized long/short
+    swing: bool = False
+    # Durations available to segmentation, from _segment_table()
+    segment_table: tuple[tuple[float, int, int], ...] = _PLAIN_SEGMENT_TABLE
+
+
+_STRAIGHT_FEEL = _FeelSpec()
+
+_FEEL_TABLE = MappingProxyType(
+    {
+        "straight": _STRAIGHT_FEEL,
+        # Swung pairs quantize to two-thirds and one-third of a beat
+        "swing": _FeelSpec(
+            swing=True,
+            segment_table=_segment_table(_PLAIN_DENOMINATORS | _TRIPLET_DENOMINATORS),
+        ),
+        "triplet": _FeelSpec(
+            grid=1.0 / 3.0,
+            tuplet_division=3,
+            segment_table=_segment_table(_PLAIN_DENOMINATORS | _TRIPLET_DENOMINATORS),
+        ),
+        "quintuplet": _FeelSpec(
+            grid=0.2,
+            tuplet_division=5,
+            segment_table=_segment_table(
+                _PLAIN_DENOMINATORS | _QUINTUPLET_DENOMINATORS
+            ),
+        ),
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _SessionTiming:
+    """Quantizer settings derived from a session's feel, grid and tempo."""
+
+    grid: float
+    beats_per_second: float
+    swing_long: float
+    # Segmentation tolerance and (length - tolerance, length, denom, dots)
+    # per segment table entry, longest first, so the greedy matcher compares precomputed
+    # thresholds
+    segment_tolerance: float
+    segment_thresholds: tuple[tuple[float, float, int, int], ...]
+    # Quantized length (beats) -> segments, filled lazily and shared by every
+    # session with these settings
+    segment_cache: dict[float, list[tuple[int, int, float]]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+
+@lru_cache(maxsize=TRANSCRIBE_TIMING_CACHE_SIZE)
+def _session_timing(
+    feel: str, quantize_grid: float, default_tempo: float, swing_ratio: float
+) -> _SessionTiming:
+    """Derive the quantizer settings for one session configuration."""
+    spec = _FEEL_TABLE.get(feel, _STRAIGHT_FEEL)
+    grid = quantize_grid if spec.grid is None else spec.grid
+    tolerance = max(grid / 16.0 if grid else 0.005, 0.005)
+
+    # Fast tempos can't carry a heavy swing, so blend toward straight
+    blend = (SWING_STRAIGHT_TEMPO_BPM - default_tempo) / (
+        SWING_STRAIGHT_TEMPO_BPM - SWING_FULL_TEMPO_BPM
+    )
+    blend = max(0.0, min(1.0, blend))
+    ratio = max(0.0, min(1.0, swing_ratio))
+
+    return _SessionTiming(
+        grid=grid,
+        beats_per_second=default_tempo / 60.0,
+        swing_long=0.5 + (ratio - 0.5) * blend,
+        segment_tolerance=tolerance,
+        segment_thresholds=tuple(
+            (length - tolerance, length, denom, dots)
+            for length, denom, dots in spec.segment_table
+        ),
+    )
+
+
+@dataclass(slots=True)
 class PendingNote:
     """A note that has been started but not yet released."""
 
@@ -51,7 +192,7 @@ class PendingNote:
     start_time: float  # In seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class RecordedNote:
     """A completed note with start time and duration."""
 
@@ -84,12 +225,54 @@ class TranscribeSession:
 
     # Internal state
     _midi_in: MidiIn | None = field(default=None, repr=False)
-    _pending_notes: dict[int, PendingNote] = field(default_factory=dict, repr=False)
+    # Held notes indexed directly by MIDI pitch (None = not sounding)
+    _pending_notes: list[PendingNote | None] = field(
+        default_factory=lambda: [None] * _MIDI_PITCH_COUNT, repr=False
+    )
     _recorded_notes: list[RecordedNote] = field(default_factory=list, repr=False)
-    _start_time: float = field(default=0.0, repr=False)
+    # Refilled in place by every poll, so polling allocates no message list
+    _poll_buffer: list[MidiMessage] = field(default_factory=list, repr=False)
+    _start_ns: int = field(default=0, repr=False)  # time.monotonic_ns() at start
+    _start_timestamp_ns: int = field(default=0, repr=False)
     _running: bool = field(default=False, repr=False)
     _on_note: Callable[[int, int, bool], None] | None = field(default=None, repr=False)
     _swing_next_is_long: bool = field(default=True, repr=False)
+    # Derived from feel/quantize_grid/default_tempo by _refresh_timing()
+    _timing: _SessionTiming | None = field(default=None, init=False, repr=False)
+    _grid: float = field(default=0.0, init=False, repr=False)
+    _beats_per_second: float = field(default=0.0, init=False, repr=False)
+    _swing_long: float = field(default=0.5, init=False, repr=False)
+    _segment_tolerance: float = field(default=0.005, init=False, repr=False)
+    _segment_thresholds: tuple[tuple[float, float, int, int], ...] = field(
+        default=(), init=False, repr=False
+    )
+    # The shared _SessionTiming.segment_cache; lengths repeat heavily on a grid
+    _segment_cache: dict[float, list[tuple[int, int, float]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self._refresh_timing()
+
+    def _refresh_timing(self) -> None:
+        """Cache the quantization grid and tempo factor for the current settings.
+
+        Settings, and the segmentations cached under them, are shared across
+        sessions with the same configuration.
+        """
+        timing = _session_timing(
+            self.feel, self.quantize_grid, self.default_tempo, self.swing_ratio
+        )
+        if timing == self._timing:
+            return
+
+        self._timing = timing
+        self._grid = timing.grid
+        self._beats_per_second = timing.beats_per_second
+        self._swing_long = timing.swing_long
+        self._segment_tolerance = timing.segment_tolerance
+        self._segment_thresholds = timing.segment_thresholds
+        self._segment_cache = timing.segment_cache
 
     def list_input_ports(self) -> list[str]:
         """List available MIDI input ports."""
@@ -131,11 +314,14 @@ class TranscribeSession:
         if err:
             raise RuntimeError(f"Failed to open MIDI port: {err}")
 
-        self._pending_notes = {}
+        self._pending_notes = [None] * _MIDI_PITCH_COUNT
         self._recorded_notes = []
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
+        # Session origin on libremidi's clock, for per-message timestamps
+        self._start_timestamp_ns = self._midi_in.absolute_timestamp()
         self._running = True
         self._swing_next_is_long = True
+        self._refresh_timing()
 
     def stop(self) -> Seq:
         """Stop recording and return the recorded notes as a Seq.
@@ -150,17 +336,19 @@ class TranscribeSession:
         self.poll()
 
         # Close any pending notes
-        end_time = time.time() - self._start_time
-        for pitch, pending in self._pending_notes.items():
-            duration = end_time - pending.start_time
+        end_time = self._elapsed()
+        for pending in self._pending_notes:
+            if pending is None:
+                continue
             self._recorded_notes.append(
                 RecordedNote(
                     pitch=pending.pitch,
                     velocity=pending.velocity,
                     start_time=pending.start_time,
-                    duration=max(0.1, duration),
+                    duration=max(0.1, end_time - pending.start_time),
                 )
             )
+        self._pending_notes = [None] * _MIDI_PITCH_COUNT
 
         self._running = False
         if self._midi_in:
@@ -176,40 +364,83 @@ class TranscribeSession:
         if not self._running or not self._midi_in:
             return
 
-        current_time = time.time() - self._start_time
-        messages = self._midi_in.poll()
+        received_time = self._elapsed()
+        messages = self._poll_buffer
+        if not self._midi_in.poll_into(messages):
+            return
 
         for msg in messages:
-            self._process_message(msg, current_time)
+            self._process_message(msg, self._message_time(msg, received_time))
+
+    def _elapsed(self) -> float:
+        """Seconds since start() on the monotonic clock."""
+        return (time.monotonic_ns() - self._start_ns) * 1e-9
+
+    def _message_time(self, msg: MidiMessage, received_time: float) -> float:
+        """Session-relative time of a message, in seconds.
+
+        Uses the timestamp libremidi recorded when the message arrived, so
+        messages drained in one poll keep their own onset times. Falls back
+        to received_time when the backend provides no usable timestamp.
+        """
+        if msg.timestamp and self._start_timestamp_ns:
+            event_time = (msg.timestamp - self._start_timestamp_ns) * 1e-9
+            # Guard against backends whose clocks do not line up
+            if 0.0 <= event_time <= received_time + 1.0:
+                return event_time
+        return received_time
+
+    def wait(self, timeout: float) -> bool:
+        """Block until MIDI input arrives or timeout elapses, then process it.
+
+        Unlike calling poll() in a sleep loop, this wakes as soon as a message
+        is received, so notes are handled without waiting out a poll interval.
+
+        Args:
+            timeout: Maximum time to block, in seconds.
+
+        Returns:
+            True if messages were received and processed.
+        """
+        if not self._running or not self._midi_in:
+            return False
+
+        if not self._midi_in.wait_for_messages(timeout):
+            return False
+
+        self.poll()
+        return True
 
     def _process_message(self, msg: MidiMessage, current_time: float) -> None:
         """Process a single MIDI message."""
-        if len(msg.bytes) < 2:
+        data = msg.bytes
+        if len(data) < 3:
             return
 
-        status = msg.bytes[0]
-        msg_type = status & 0xF0
+        handler = _STATUS_HANDLERS[data[0]]
+        if handler is not None:
+            handler(self, data[1], data[2], current_time)
 
-        if msg_type == 0x90 and len(msg.bytes) >= 3:
-            # Note On
-            pitch = msg.bytes[1]
-            velocity = msg.bytes[2]
-
-            if velocity == 0:
-                # Note On with velocity 0 = Note Off
-                self._note_off(pitch, current_time)
-            else:
-                self._note_on(pitch, velocity, current_time)
+    def _note_on_message(self, pitch: int, velocity: int, time: float) -> None:
+        """Handle a Note On message."""
+        if velocity == 0:
+            # Note On with velocity 0 = Note Off
+            self._note_off(pitch, time)
+        else:
+            self._note_on(pitch, velocity, time)
 
-        elif msg_type == 0x80 and len(msg.bytes) >= 3:
-            # Note Off
-            pitch = msg.bytes[1]
-            self._note_off(pitch, current_time)
+    def _note_off_message(self, pitch: int, velocity: int, time: float) -> None:
+        """Handle a Note Off message."""
+        self._note_off(pitch, time)
 
     def _note_on(self, pitch: int, velocity: int, time: float) -> None:
         """Handle a note on event."""
+        if not 0 <= pitch < _MIDI_PITCH_COUNT:
+            # Malformed data byte; _pending_notes only has MIDI pitch slots
+            return
+
         # If there's already a pending note at this pitch, end it first
-        if pitch in self._pending_notes:
+        if self._pending_notes[pitch] is not None:
             self._note_off(pitch, time)
 
         self._pending_notes[pitch] = PendingNote(
@@ -221,10 +452,14 @@ class TranscribeSession:
 
     def _note_off(self, pitch: int, time: float) -> None:
         """Handle a note off event."""
-        if pitch not in self._pending_notes:
+        if not 0 <= pitch < _MIDI_PITCH_COUNT:
             return
 
-        pending = self._pending_notes.pop(pitch)
+        pending = self._pending_notes[pitch]
+        if pending is None:
+            return
+
+        self._pending_notes[pitch] = None
         duration = time - pending.start_time
 
         self._recorded_notes.append(
@@ -242,82 +477,111 @@ class TranscribeSession:
     def _notes_to_seq(self) -> Seq:
         """Convert recorded notes to a Seq."""
         if not self._recorded_notes:
-            return Seq()
+            # Nothing to quantize, so skip the timing refresh and grouping
+            return Seq(metadata=self._seq_metadata())
 
-        sorted_notes = sorted(self._recorded_notes, key=lambda n: n.start_time)
-        groups = self._group_notes(sorted_notes)
+        # Settings may have been changed since start()
+        self._refresh_timing()
+        sorted_notes = sorted(self._recorded_notes, key=attrgetter("start_time"))
         elements: list = []
         current_time = 0.0
 
-        for group in groups:
+        # Gaps up to half a grid step quantize to nothing, so skip them
+        # along with gaps under the absolute minimum
+        rest_threshold = max(
+            MIN_REST_GAP_SECONDS, self._beats_to_seconds(max(self._grid * 0.5, 0.005))
+        )
+
+        # Per-group work stays in locals: the tempo factor is applied inline
+        # (same arithmetic as _seconds_to_beats/_beats_to_seconds) and the
+        # segment helpers are bound once
+        beats_per_second = self._beats_per_second
+        segments_for_beats = self._segments_for_beats
+        append_rest_segments = self._append_rest_segments
+        append_group_segments = self._append_group_segments
+
+        # Groups are consumed as they close; no list of groups is built
+        for group in self._iter_groups(sorted_notes):
             start_time = group[0].start_time
             gap_seconds = start_time - current_time
-            if gap_seconds > MIN_REST_GAP_SECONDS:
-                gap_beats = self._seconds_to_beats(gap_seconds)
-                rest_segments = self._segments_for_beats(gap_beats, kind="rest")
-                gained = self._append_rest_segments(rest_segments, elements)
-                current_time += self._beats_to_seconds(gained)
-
-            duration_seconds = max(n.duration for n in group)
-            duration_beats = self._seconds_to_beats(duration_seconds)
-            note_segments = self._segments_for_beats(duration_beats, kind="note")
+            if gap_seconds > rest_threshold:
+                rest_segments = segments_for_beats(
+                    gap_seconds * beats_per_second, kind="rest"
+                )
+                gained = append_rest_segments(rest_segments, elements)
+                current_time += gained / beats_per_second
+
+            if len(group) == 1:
+                duration_seconds = group[0].duration
+            else:
+                duration_seconds = max([n.duration for n in group])
+            note_segments = segments_for_beats(
+                duration_seconds * beats_per_second, kind="note"
+            )
             if not note_segments:
                 continue
 
-            gained = self._append_group_segments(group, note_segments, elements)
+            append_group_segments(group, note_segments, elements)
             current_time = start_time + duration_seconds
 
+        metadata = self._seq_metadata()
+
+        # Only tuplet feels have anything to collapse
+        if "tuplet_division" in metadata:
+            elements = self._collapse_tuplets(elements, metadata)
+        return Seq(elements=elements, metadata=metadata)
+
+    def _seq_metadata(self) -> dict[str, object]:
+        """Describe the feel a transcribed Seq was quantized with."""
         metadata: dict[str, object] = {
             "feel": self.feel,
             "quantize_grid": self.quantize_grid,
         }
-        if self.feel == "swing":
+        spec = _FEEL_TABLE.get(self.feel, _STRAIGHT_FEEL)
+        if spec.swing:
             metadata["swing_ratio"] = self.swing_ratio
-        elif self.feel == "triplet":
-            metadata["tuplet_division"] = 3
-        elif self.feel == "quintuplet":
-            metadata["tuplet_division"] = 5
-
-        collapsed_elements = self._collapse_tuplets(elements, metadata)
-        return Seq(elements=collapsed_elements, metadata=metadata)
+        if spec.tuplet_division is not None:
+            metadata["tuplet_division"] = spec.tuplet_division
+        return metadata
 
     def _group_notes(self, notes: list[RecordedNote]) -> list[list[RecordedNote]]:
-        groups: list[list[RecordedNote]] = []
-        current_group: list[RecordedNote] = []
-        current_start: float | None = None
-
-        for note in notes:
-            if (
-                current_group
-                and current_start is not None
-                and abs(note.start_time - current_start)
-                > CHORD_GROUPING_TOLERANCE_SECONDS
-            ):
-                groups.append(current_group)
-                current_group = []
-                current_start = None
-
-            if not current_group:
-                current_start = note.start_time
-            current_group.append(note)
-
-        if current_group:
-            groups.append(current_group)
-
-        return groups
+        """Split start-sorted notes into chord groups."""
+        return list(self._iter_groups(notes))
+
+    @staticmethod
+    def _iter_groups(notes: list[RecordedNote]) -> Iterator[list[RecordedNote]]:
+        """Yield chord groups from start-sorted notes as they close.
+
+        A group collects every note starting within the chord tolerance of
+        the group's first note.
+        """
+        if not notes:
+            return
+
+        tolerance = CHORD_GROUPING_TOLERANCE_SECONDS
+        current_group = [notes[0]]
+        current_start = notes[0].start_time
+
+        for note in islice(notes, 1, None):
+            start = note.start_time
+            # Input is sorted, so the offset from the group start is never negative
+            if start - current_start > tolerance:
+                yield current_group
+                current_group = [note]
+                current_start = start
+            else:
+                current_group.append(note)
+
+        yield current_group
 
     def _seconds_to_beats(self, seconds: float) -> float:
-        return seconds * self.default_tempo / 60.0
+        return seconds * self._beats_per_second
 
     def _beats_to_seconds(self, beats: float) -> float:
-        return beats * 60.0 / self.default_tempo
+        return beats / self._beats_per_second
 
     def _grid_value(self) -> float:
-        if self.feel == "triplet":
-            return 1.0 / 3.0
-        if self.feel == "quintuplet":
-            return 0.2
-        return self.quantize_grid
+        return self._grid
 
     def _quantize_beats(self, beats: float, *, kind: str) -> float:
         beats = max(beats, 0.0)
@@ -325,37 +589,55 @@ class TranscribeSession:
 
         if kind == "note" and self.feel == "swing":
             if SWING_DETECTION_MIN_BEATS < beats < SWING_DETECTION_MAX_BEATS:
-                long = max(0.0, min(1.0, self.swing_ratio))
-                short = max(0.0, 1.0 - long)
-                target = long if self._swing_next_is_long else short
+                long = self._swing_long
+                target = long if self._swing_next_is_long else 1.0 - long
                 self._swing_next_is_long = not self._swing_next_is_long
                 return target
             self._swing_next_is_long = True
 
         if grid > 0:
-            return round(beats / grid) * grid
+            # Nearest grid point, ties to the earlier one. round() would send
+            # ties to the even index, snapping equal offsets in either direction.
+            steps, offset = divmod(beats, grid)
+            if offset > grid - offset:
+                steps += 1
+            return steps * grid
         return beats
 
     def _segments_for_beats(
         self, beats: float, *, kind: str
     ) -> list[tuple[int, int, float]]:
-        quantized = self._quantize_beats(beats, kind=kind)
-        return self._segment_beats(max(quantized, 0.0))
+        quantized = max(self._quantize_beats(beats, kind=kind), 0.0)
+        if self._grid <= 0:
+            # Unquantized lengths rarely repeat, so don't cache them
+            return self._segment_beats(quantized)
+
+        # The cached list is shared; callers only iterate over it
+        segments = self._segment_cache.get(quantized)
+        if segments is None:
+            segments = self._segment_cache[quantized] = self._segment_beats(quantized)
+        return segments
 
     def _segment_beats(self, beats: float) -> list[tuple[int, int, float]]:
         segments: list[tuple[int, int, float]] = []
         remaining = beats
-        grid = self._grid_value()
-        tolerance = max(grid / 16.0 if grid else 0.005, 0.005)
-
-        while remaining > tolerance:
-            denom, dots = beats_to_duration(remaining)
-            length = duration_value_to_beats(denom, dots)
-            if length <= 0:
-                break
+        tolerance = self._segment_tolerance
+        if remaining <= tolerance:
+            return segments
+
+        # Greedily take the longest duration that fits what is left
+        for threshold, length, denom, dots in self._segment_thresholds:
+            while remaining > threshold:
+                segments.append((denom, dots, length))
+                remaining -= length
+            if remaining <= tolerance:
+                return segments
+
+        # Round a leftover shorter than any duration to the nearer of 0 and
+        # the shortest one
+        _, length, denom, dots = self._segment_thresholds[-1]
+        if remaining >= length / 2.0 or not segments:
             segments.append((denom, dots, length))
-            remaining = max(0.0, remaining - length)
-
         return segments
 
     def _append_rest_segments(
@@ -374,51 +656,57 @@ class TranscribeSession:
         elements: list,
     ) -> float:
         total = 0.0
-        is_chord = len(group) > 1
-        note_infos = [
-            midi_pitch_to_note(note.pitch) for note in group
-        ]  # (letter, octave, accidentals)
-
-        for idx, (denom, dots, length) in enumerate(segments):
-            slur = idx < len(segments) - 1
-            if is_chord:
-                chord_notes = []
-                for letter, octave, accidentals in note_infos:
-                    accidental = accidentals[0] if accidentals else None
-                    chord_notes.append(
-                        Note(
-                            pitch=letter,
-                            duration=None,
-                            dots=0,
-                            octave=octave,
-                            accidental=accidental,
-                            slurred=slur,
-                        )
-                    )
+        last = len(segments) - 1
+        note_infos = [_PITCH_TABLE[note.pitch] for note in group]
+
+        if len(group) > 1:
+            # Chord members differ between segments only in their slur, and
+            # Notes are immutable, so each variant is built once and shared
+            tied_members = self._chord_members(note_infos, slurred=True) if last else ()
+            final_members = self._chord_members(note_infos, slurred=False)
+            for idx, (denom, dots, length) in enumerate(segments):
                 elements.append(
                     Chord(
-                        notes=tuple(chord_notes),
+                        notes=tied_members if idx < last else final_members,
                         duration=denom,
                         dots=dots,
                     )
                 )
-            else:
-                letter, octave, accidentals = note_infos[0]
-                accidental = accidentals[0] if accidentals else None
-                elements.append(
-                    Note(
-                        pitch=letter,
-                        duration=denom,
-                        dots=dots,
-                        octave=octave,
-                        accidental=accidental,
-                        slurred=slur,
-                    )
+                total += length
+            return total
+
+        letter, octave, accidental = note_infos[0]
+        for idx, (denom, dots, length) in enumerate(segments):
+            elements.append(
+                Note(
+                    pitch=letter,
+                    duration=denom,
+                    dots=dots,
+                    octave=octave,
+                    accidental=accidental,
+                    slurred=idx < last,
                 )
+            )
             total += length
 
         return total
 
+    @staticmethod
+    def _chord_members(
+        note_infos: list[tuple[str, int, str | None]], *, slurred: bool
+    ) -> tuple[Note, ...]:
+        return tuple(
+            Note(
+                pitch=letter,
+                duration=None,
+                dots=0,
+                octave=octave,
+                accidental=accidental,
+                slurred=slurred,
+            )
+            for letter, octave, accidental in note_infos
+        )
+
     def _collapse_tuplets(self, elements: list, metadata: dict[str, object]) -> list:
         raw_division = metadata.get("tuplet_division")
         if not isinstance(raw_division, int):
@@ -432,43 +720,40 @@ class TranscribeSession:
         target_beats = 1.0 / division
         tolerance = target_beats / 8.0
 
-        new_elements: list = []
-        buffer: list = []
-        buffer_beats = 0.0
+        cram_duration, cram_dots = beats_to_duration(division * target_beats)
 
-        def flush_buffer() -> None:
-            nonlocal buffer, buffer_beats
-            if buffer:
-                new_elements.extend(buffer)
-            buffer = []
-            buffer_beats = 0.0
+        # Tuplet members collect in one reusable buffer; pending counts them.
+        # Slurs are only stripped once a full tuplet becomes a cram, so runs
+        # that fall short pass through untouched.
+        # Each member is within tolerance of target_beats, so a full buffer
+        # always spans the tuplet and needs no separate length check.
+        new_elements: list = []
+        buffer: list = [None] * division
+        pending = 0
 
         for elem in elements:
             beats = self._element_beats(elem)
             if beats is None or abs(beats - target_beats) > tolerance:
-                flush_buffer()
+                if pending:
+                    new_elements.extend(buffer[:pending])
+                    pending = 0
                 new_elements.append(elem)
                 continue
 
-            buffer.append(self._strip_slur(elem))
-            buffer_beats += beats
-
-            if len(buffer) == division:
-                base_duration, base_dots = beats_to_duration(division * target_beats)
-                if abs(buffer_beats - division * target_beats) <= tolerance * division:
-                    new_elements.append(
-                        Cram(
-                            elements=list(buffer),
-                            duration=base_duration,
-                            dots=base_dots,
-                        )
+            buffer[pending] = elem
+            pending += 1
+            if pending == division:
+                new_elements.append(
+                    Cram(
+                        elements=[self._strip_slur(member) for member in buffer],
+                        duration=cram_duration,
+                        dots=cram_dots,
                     )
-                else:
-                    new_elements.extend(buffer)
-                buffer = []
-                buffer_beats = 0.0
+                )
+                pending = 0
 
-        flush_buffer()
+        if pending:
+            new_elements.extend(buffer[:pending])
         return new_elements
 
     def _element_beats(self, element) -> float | None:
@@ -502,6 +787,17 @@ class TranscribeSession:
         self._on_note = callback
 
 
+# Status byte -> message handler, so note messages on any channel dispatch
+# with a single lookup and everything else is skipped
+_STATUS_HANDLERS: list[Callable[[TranscribeSession, int, int, float], None] | None] = [
+    None
+] * 256
+for _channel in range(16):
+    _STATUS_HANDLERS[0x90 | _channel] = TranscribeSession._note_on_message
+    _STATUS_HANDLERS[0x80 | _channel] = TranscribeSession._note_off_message
+del _channel
+
+
 def transcribe(
     duration: float = 10.0,
     port_name: str | None = None,
@@ -511,7 +807,7 @@ def transcribe(
     feel: Literal["straight", "swing", "triplet", "quintuplet"] = "straight",
     swing_ratio: float = 2.0 / 3.0,
     on_note: Callable[[int, int, bool], None] | None = None,
-    poll_interval: float = 0.01,
+    poll_interval: float = 0.1,
 ) -> "Score":  # noqa: F821
     """Record MIDI input and return a Score.
 
@@ -525,8 +821,11 @@ def transcribe(
         tempo: Tempo in BPM for duration calculations.
         feel: Quantization feel ("straight", "swing", "triplet", "quintuplet").
         swing_ratio: Portion of the beat allocated to the long swing note.
+            Eases toward straight (0.5) between 120 and 180 BPM.
         on_note: Optional callback for note events (pitch, velocity, is_note_on).
-        poll_interval: How often to poll for MIDI messages (seconds).
+        poll_interval: Longest time to block waiting for MIDI input before
+            re-checking the deadline (seconds). Input is handled as soon as
+            it arrives regardless of this value.
 
     Returns:
         A Score containing the recorded notes.
@@ -551,11 +850,11 @@ def transcribe(
 
     session.start(port_name)
 
-    # Record for the specified duration
-    start = time.time()
-    while time.time() - start < duration:
-        session.poll()
-        time.sleep(poll_interval)
+    # Record for the specified duration, waking as soon as input arrives.
+    # Each wait is capped at poll_interval so Ctrl+C stays responsive.
+    deadline = time.monotonic() + duration
+    while (remaining := deadline - time.monotonic()) > 0:
+        session.wait(min(remaining, poll_interval))
 
     seq = session.stop()
 
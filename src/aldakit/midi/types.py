@@ -275,7 +275,7 @@ INSTRUMENT_PROGRAMS: dict[str, int] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class MidiNote:
     """A MIDI note event."""
 
@@ -286,7 +286,7 @@ class MidiNote:
     channel: int = 0  # MIDI channel (0-15)
 
 
-@dataclass
+@dataclass(slots=True)
 class MidiProgramChange:
     """A MIDI program change event."""
 
@@ -295,7 +295,7 @@ class MidiProgramChange:
     channel: int = 0  # MIDI channel (0-15)
 
 
-@dataclass
+@dataclass(slots=True)
 class MidiControlChange:
     """A MIDI control change event."""
 
@@ -305,7 +305,7 @@ class MidiControlChange:
     channel: int = 0  # MIDI channel (0-15)
 
 
-@dataclass
+@dataclass(slots=True)
 class MidiTempoChange:
     """A tempo change event."""
 
@@ -313,7 +313,7 @@ class MidiTempoChange:
     time: float  # Time in seconds
 
 
-@dataclass
+@dataclass(slots=True)
 class MidiSequence:
     """A complete MIDI sequence."""
 
@@ -347,14 +347,14 @@ def note_to_midi(letter: str, octave: int, accidentals: list[str]) -> int:
 
     C4 = MIDI 60 (middle C).
     """
-    base = NOTE_OFFSETS[letter.lower()]
+    base = NOTE_OFFSETS.get(letter)
+    if base is None:
+        base = NOTE_OFFSETS[letter.lower()]
     midi_note = 12 * (octave + 1) + base
 
-    for acc in accidentals:
-        if acc == "+":  # sharp
-            midi_note += 1
-        elif acc == "-":  # flat
-            midi_note -= 1
-        # "_" (natural) has no effect in this context
+    if accidentals:
+        # Sharps (+) raise and flats (-) lower by a semitone; "_" (natural)
+        # has no effect in this context. count() works on lists and strings.
+        midi_note += accidentals.count("+") - accidentals.count("-")
 
     return max(0, min(127, midi_note))
@@ -1,5 +1,6 @@
 """Recursive descent parser for the Alda music programming language."""
 
+from functools import lru_cache
 from typing import NoReturn
 
 from .ast_nodes import (
@@ -36,6 +37,7 @@ from .ast_nodes import (
     VoiceGroupNode,
     VoiceNode,
 )
+from .constants import PARSE_CACHE_SIZE
 from .errors import AldaSyntaxError
 from .scanner import Scanner
 from .tokens import SourcePosition, Token, TokenType
@@ -649,3 +651,13 @@ def parse(source: str, filename: str = "<input>") -> RootNode:
     """Convenience function to parse Alda source code."""
     parser = Parser.from_source(source, filename)
     return parser.parse()
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _cached_parse(source: str, filename: str = "<input>") -> RootNode:
+    """Parse Alda source, reusing the AST for recently seen inputs.
+
+    The returned tree is shared between callers and must not be mutated.
+    Syntax errors are not cached.
+    """
+    return parse(source, filename)
@@ -1,7 +1,10 @@
 """Interactive REPL for aldakit with syntax highlighting and completion."""
 
-import time
+from dataclasses import dataclass, replace
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
 # Initialize vendored packages path (must be before prompt_toolkit imports)
 from . import ext  # noqa: F401
@@ -18,18 +21,32 @@ from prompt_toolkit.styles import Style
 from .constants import (
     DEFAULT_TEMPO,
     DEFAULT_VIRTUAL_PORT_NAME,
-    POLL_INTERVAL_DEFAULT,
     REPL_COMPLETION_MIN_WORD_LENGTH,
     REPL_CONTINUATION_PROMPT,
     REPL_HISTORY_FILENAME,
     REPL_INSTRUMENT_COLUMNS,
+    REPL_LEXER_CACHE_SIZE,
     REPL_PROMPT,
 )
+from .ast_nodes import (
+    EventSequenceNode,
+    LispListNode,
+    LispNumberNode,
+    LispSymbolNode,
+    PartNode,
+    RootNode,
+)
 from .errors import AldaParseError
-from .midi.backends import LibremidiBackend
+from .midi.backends import LibremidiBackend, MidiBackend
 from .midi.generator import generate_midi
 from .midi.types import INSTRUMENT_PROGRAMS
-from .parser import parse
+from .parser import _cached_parse
+
+# Instrument names in completion/listing order, sorted once at import
+_SORTED_INSTRUMENTS: tuple[str, ...] = tuple(sorted(INSTRUMENT_PROGRAMS))
+
+# Attribute names that set tempo (matched case-insensitively, like the generator)
+_TEMPO_ATTRIBUTES = frozenset({"tempo", "tempo!"})
 
 # Alda token colors - clean scheme
 ALDA_STYLE = Style.from_dict(
@@ -46,123 +63,141 @@ ALDA_STYLE = Style.from_dict(
 )
 
 
-class AldaLexer(Lexer):
-    """Syntax highlighter for alda code."""
-
-    def lex_document(self, document: Document):
-        def get_line_tokens(line_number):
-            line = document.lines[line_number]
-            tokens = []
-            i = 0
-            while i < len(line):
-                ch = line[i]
-
-                # Comments
-                if ch == "#":
-                    tokens.append(("class:comment", line[i:]))
-                    break
+# prompt_toolkit re-lexes every visible line on each keystroke, and almost
+# all of them are unchanged, so results are cached by line text
+@lru_cache(maxsize=REPL_LEXER_CACHE_SIZE)
+def _tokenize_line(line: str) -> list[tuple[str, str]]:
+    """Split one line of alda source into (style class, text) tokens.
 
-                # Instrument/part declaration (word followed by :)
-                # Look ahead to check for colon
-                if ch.isalpha():
-                    j = i
-                    while j < len(line) and (line[j].isalnum() or line[j] == "-"):
-                        j += 1
-                    if j < len(line) and line[j] == ":":
-                        # This is an instrument declaration
-                        tokens.append(("class:instrument", line[i : j + 1]))
-                        i = j + 1
-                        continue
-                    # Not followed by colon - check if it's a note/rest/octave
-                    # (handled below by continuing the loop)
-
-                # S-expressions (tempo, volume, etc.)
-                if ch == "(":
-                    j = i + 1
-                    depth = 1
-                    while j < len(line) and depth > 0:
-                        if line[j] == "(":
-                            depth += 1
-                        elif line[j] == ")":
-                            depth -= 1
-                        j += 1
-                    tokens.append(("class:attribute", line[i:j]))
-                    i = j
-                    continue
-
-                # Notes (with optional accidentals and duration)
-                if ch in "abcdefg":
-                    j = i + 1
-                    # Accidentals
-                    while j < len(line) and line[j] in "+-_":
-                        j += 1
-                    tokens.append(("class:note", line[i:j]))
-                    i = j
-                    # Duration (separate token)
-                    if i < len(line) and (line[i].isdigit() or line[i] == "."):
-                        j = i
-                        while j < len(line) and (line[j].isdigit() or line[j] == "."):
-                            j += 1
-                        # ms or s suffix
-                        if j + 1 < len(line) and line[j : j + 2] == "ms":
-                            j += 2
-                        elif (
-                            j < len(line)
-                            and line[j] == "s"
-                            and (j + 1 >= len(line) or not line[j + 1].isalpha())
-                        ):
-                            j += 1
-                        tokens.append(("class:duration", line[i:j]))
-                        i = j
-                    continue
-
-                # Rest (with optional duration)
-                if ch == "r" and (
-                    i + 1 >= len(line) or line[i + 1] not in "abcdefghijklmnopqstuvwxyz"
+    The returned list is cached and shared; callers must copy it before
+    modifying it.
+    """
+    tokens: list[tuple[str, str]] = []
+    append = tokens.append
+    n = len(line)
+    i = 0
+    # End of the last word found not to be an instrument name; letters
+    # before it need not repeat the colon look-ahead
+    word_end = 0
+    while i < n:
+        ch = line[i]
+
+        # Whitespace runs become a single unstyled token
+        if ch == " ":
+            j = i + 1
+            while j < n and line[j] == " ":
+                j += 1
+            append(("", line[i:j]))
+            i = j
+            continue
+
+        # Comments
+        if ch == "#":
+            append(("class:comment", line[i:]))
+            break
+
+        # Instrument/part declaration (word followed by :)
+        # Look ahead to check for colon
+        if i >= word_end and ch.isalpha():
+            j = i + 1
+            while j < n and (line[j].isalnum() or line[j] == "-"):
+                j += 1
+            if j < n and line[j] == ":":
+                # This is an instrument declaration
+                append(("class:instrument", line[i : j + 1]))
+                i = j + 1
+                continue
+            # Not followed by colon - check if it's a note/rest/octave
+            # (handled below by continuing the loop)
+            word_end = j
+
+        # S-expressions (tempo, volume, etc.)
+        if ch == "(":
+            j = i + 1
+            depth = 1
+            while j < n and depth > 0:
+                if line[j] == "(":
+                    depth += 1
+                elif line[j] == ")":
+                    depth -= 1
+                j += 1
+            append(("class:attribute", line[i:j]))
+            i = j
+            continue
+
+        # Notes (with optional accidentals and duration)
+        if ch in "abcdefg":
+            j = i + 1
+            # Accidentals
+            while j < n and line[j] in "+-_":
+                j += 1
+            append(("class:note", line[i:j]))
+            i = j
+            # Duration (separate token)
+            if i < n and (line[i].isdigit() or line[i] == "."):
+                j = i + 1
+                while j < n and (line[j].isdigit() or line[j] == "."):
+                    j += 1
+                # ms or s suffix
+                if line.startswith("ms", j):
+                    j += 2
+                elif (
+                    j < n
+                    and line[j] == "s"
+                    and (j + 1 >= n or not line[j + 1].isalpha())
                 ):
-                    tokens.append(("class:rest", ch))
-                    i += 1
-                    # Duration (separate token)
-                    if i < len(line) and (line[i].isdigit() or line[i] == "."):
-                        j = i
-                        while j < len(line) and (line[j].isdigit() or line[j] == "."):
-                            j += 1
-                        tokens.append(("class:duration", line[i:j]))
-                        i = j
-                    continue
+                    j += 1
+                append(("class:duration", line[i:j]))
+                i = j
+            continue
+
+        # Rest (with optional duration)
+        if ch == "r" and (i + 1 >= n or line[i + 1] not in "abcdefghijklmnopqstuvwxyz"):
+            append(("class:rest", ch))
+            i += 1
+            # Duration (separate token)
+            if i < n and (line[i].isdigit() or line[i] == "."):
+                j = i + 1
+                while j < n and (line[j].isdigit() or line[j] == "."):
+                    j += 1
+                append(("class:duration", line[i:j]))
+                i = j
+            continue
+
+        # Octave set (o followed by number)
+        if ch == "o" and i + 1 < n and line[i + 1].isdigit():
+            j = i + 2
+            while j < n and line[j].isdigit():
+                j += 1
+            append(("class:octave", line[i:j]))
+            i = j
+            continue
+
+        # Octave up/down
+        if ch == "<" or ch == ">":
+            append(("class:octave", ch))
+        # Barline
+        elif ch == "|":
+            append(("class:barline", ch))
+        # Chord markers
+        elif ch == "/":
+            append(("class:note", ch))
+        # Default (tabs, stray characters, etc.)
+        else:
+            append(("", ch))
+        i += 1
 
-                # Octave set (o followed by number)
-                if ch == "o" and i + 1 < len(line) and line[i + 1].isdigit():
-                    j = i + 1
-                    while j < len(line) and line[j].isdigit():
-                        j += 1
-                    tokens.append(("class:octave", line[i:j]))
-                    i = j
-                    continue
+    return tokens
 
-                # Octave up/down
-                if ch in "<>":
-                    tokens.append(("class:octave", ch))
-                    i += 1
-                    continue
 
-                # Barline
-                if ch == "|":
-                    tokens.append(("class:barline", ch))
-                    i += 1
-                    continue
-
-                # Chord markers
-                if ch == "/":
-                    tokens.append(("class:note", ch))
-                    i += 1
-                    continue
+class AldaLexer(Lexer):
+    """Syntax highlighter for alda code."""
 
-                # Default (whitespace, etc.)
-                tokens.append(("", ch))
-                i += 1
+    def lex_document(self, document: Document):
+        lines = document.lines
 
-            return tokens
+        def get_line_tokens(line_number):
+            return list(_tokenize_line(lines[line_number]))
 
         return get_line_tokens
 
@@ -181,22 +216,40 @@ class AldaCompleter(Completer):
     ]
 
     def __init__(self):
-        self.instruments = sorted(INSTRUMENT_PROGRAMS.keys())
+        self.instruments = _SORTED_INSTRUMENTS
+
+    @staticmethod
+    def _unterminated_paren(line: str) -> bool:
+        """Return True if ``line`` ends inside an unclosed ``(``."""
+        depth = 0
+        for char in reversed(line):
+            if char == ")":
+                depth += 1
+            elif char == "(":
+                if depth == 0:
+                    return True
+                depth -= 1
+        return False
 
     def get_completions(self, document, complete_event):
         word = document.get_word_before_cursor()
-        line = document.current_line_before_cursor.strip()
+        # Whitespace never affects the ':' and '(' checks, so no strip() copy
+        line = document.current_line_before_cursor
 
         # Only complete instruments if:
         # - At start of line (no content yet), OR
         # - Word is at least 3 chars (to avoid matching notes)
         if ":" not in line and len(word) >= REPL_COMPLETION_MIN_WORD_LENGTH:
-            for inst in self.instruments:
-                if inst.startswith(word):
-                    yield Completion(inst + ": ", start_position=-len(word))
+            # Matches form a contiguous run in the sorted list; jump to it
+            instruments = self.instruments
+            for idx in range(bisect_left(instruments, word), len(instruments)):
+                inst = instruments[idx]
+                if not inst.startswith(word):
+                    break
+                yield Completion(inst + ": ", start_position=-len(word))
 
         # Complete attributes after (
-        if "(" in line and ")" not in line[line.rfind("(") :]:
+        if self._unterminated_paren(line):
             for attr in self.ATTRIBUTES:
                 if attr.startswith("(" + word):
                     yield Completion(attr, start_position=-len(word) - 1)
@@ -223,6 +276,187 @@ def create_key_bindings(backend):
     return kb
 
 
+def _is_tempo(node) -> bool:
+    """Return True if ``node`` is a ``(tempo ...)`` or ``(tempo! ...)`` call."""
+    if not isinstance(node, LispListNode) or not node.elements:
+        return False
+    head = node.elements[0]
+    return isinstance(head, LispSymbolNode) and head.name.lower() in _TEMPO_ATTRIBUTES
+
+
+def _ast_has_tempo(ast: RootNode) -> bool:
+    """Return True if a top-level sequence or part sets the tempo."""
+    for child in ast.children:
+        if isinstance(child, PartNode):
+            events = child.events.events
+        elif isinstance(child, EventSequenceNode):
+            events = child.events
+        else:
+            events = (child,)
+        if any(_is_tempo(event) for event in events):
+            return True
+    return False
+
+
+def _with_default_tempo(ast: RootNode, tempo: int) -> RootNode:
+    """Return a copy of ``ast`` that sets ``tempo`` at the start of each part.
+
+    The input tree may be shared through the parse cache, so only the
+    containers on the path to each inserted node are copied.
+    """
+    attr = LispListNode(
+        elements=[LispSymbolNode(name="tempo"), LispNumberNode(value=tempo)]
+    )
+    children = []
+    for i, child in enumerate(ast.children):
+        if isinstance(child, PartNode):
+            child = replace(
+                child,
+                events=replace(child.events, events=[attr, *child.events.events]),
+            )
+        elif i == 0:
+            if isinstance(child, EventSequenceNode):
+                child = replace(child, events=[attr, *child.events])
+            else:
+                children.append(EventSequenceNode(events=[attr]))
+        children.append(child)
+    return replace(ast, children=children)
+
+
+_HELP_TEXT = "\n".join(
+    [
+        "Commands:",
+        "  :q :quit :exit    - Exit REPL",
+        "  :help :h :?       - Show this help",
+        "  :ports            - List MIDI ports",
+        "  :instruments      - List instruments",
+        "  :tempo [BPM]      - Show/set default tempo",
+        "  :stop             - Stop playback",
+        "  :clearcache       - Forget cached parse results",
+        "  :status           - Show playback status",
+        "  :concurrent       - Enable concurrent mode (layer inputs)",
+        "  :sequential       - Enable sequential mode (wait for each)",
+        "",
+        "Shortcuts:",
+        "  Alt+Enter         - Multi-line input",
+        "  Ctrl+C            - Stop playback / cancel",
+        "  Ctrl+D            - Exit",
+        "  Tab               - Auto-complete",
+        "  Up/Down           - History",
+    ]
+)
+
+
+@dataclass
+class _ReplState:
+    """Mutable session state shared by the REPL command handlers."""
+
+    backend: MidiBackend
+    supports_concurrent: bool
+    default_tempo: int
+    virtual_port_name: str
+    running: bool = True
+
+
+def _cmd_quit(state: _ReplState, arg: str) -> None:
+    state.running = False
+
+
+def _cmd_help(state: _ReplState, arg: str) -> None:
+    print(_HELP_TEXT)
+
+
+def _cmd_ports(state: _ReplState, arg: str) -> None:
+    if state.supports_concurrent:
+        ports = state.backend.list_output_ports()
+        if ports:
+            for i, p in enumerate(ports):
+                print(f"  {i}: {p}")
+        else:
+            print(f"  (no ports - using virtual {state.virtual_port_name})")
+    else:
+        print("  (using TinySoundFont audio backend)")
+
+
+def _cmd_instruments(state: _ReplState, arg: str) -> None:
+    insts = _SORTED_INSTRUMENTS
+    # Print in columns
+    cols = REPL_INSTRUMENT_COLUMNS
+    for i in range(0, len(insts), cols):
+        row = insts[i : i + cols]
+        print("  " + "  ".join(f"{inst:20}" for inst in row))
+
+
+def _cmd_tempo(state: _ReplState, arg: str) -> None:
+    if arg:
+        try:
+            state.default_tempo = int(arg)
+        except ValueError:
+            print("Invalid tempo")
+            return
+    print(f"Default tempo: {state.default_tempo} BPM")
+
+
+def _cmd_stop(state: _ReplState, arg: str) -> None:
+    state.backend.stop()
+    print("Stopped")
+
+
+def _cmd_clearcache(state: _ReplState, arg: str) -> None:
+    _cached_parse.cache_clear()
+    print("Parse cache cleared")
+
+
+def _cmd_status(state: _ReplState, arg: str) -> None:
+    backend = state.backend
+    playing = "playing" if backend.is_playing() else "idle"
+    if state.supports_concurrent:
+        mode = "concurrent" if backend.concurrent_mode else "sequential"
+        slots = backend.active_slots
+        print("Backend: MIDI (libremidi)")
+        print(f"Mode: {mode}")
+        print(f"Status: {playing}")
+        print(f"Active slots: {slots}/8")
+    else:
+        print("Backend: Audio (TinySoundFont)")
+        print(f"Status: {playing}")
+
+
+def _cmd_concurrent(state: _ReplState, arg: str) -> None:
+    if state.supports_concurrent:
+        state.backend.concurrent_mode = True
+        print("Concurrent mode enabled - inputs will layer on each other")
+    else:
+        print("Concurrent mode not available with audio backend")
+
+
+def _cmd_sequential(state: _ReplState, arg: str) -> None:
+    if state.supports_concurrent:
+        state.backend.concurrent_mode = False
+        print("Sequential mode enabled - each input waits for previous")
+    else:
+        print("Audio backend always uses sequential mode")
+
+
+# REPL ":command" names (lowercased) to their handlers
+_COMMANDS: dict[str, Callable[[_ReplState, str], None]] = {
+    "q": _cmd_quit,
+    "quit": _cmd_quit,
+    "exit": _cmd_quit,
+    "h": _cmd_help,
+    "help": _cmd_help,
+    "?": _cmd_help,
+    "ports": _cmd_ports,
+    "instruments": _cmd_instruments,
+    "tempo": _cmd_tempo,
+    "stop": _cmd_stop,
+    "clearcache": _cmd_clearcache,
+    "status": _cmd_status,
+    "concurrent": _cmd_concurrent,
+    "sequential": _cmd_sequential,
+}
+
+
 def run_repl(
     port_name: str | None = None,
     verbose: bool = False,
@@ -294,7 +528,12 @@ def run_repl(
         is_soft_wrap: REPL_CONTINUATION_PROMPT,
     )
 
-    # State (default_tempo passed as parameter)
+    state = _ReplState(
+        backend=backend,
+        supports_concurrent=supports_concurrent,
+        default_tempo=default_tempo,
+        virtual_port_name=virtual_port_name,
+    )
 
     if supports_concurrent:
         mode_str = "concurrent" if backend.concurrent_mode else "sequential"
@@ -323,93 +562,20 @@ def run_repl(
                 cmd = parts[0].lower() if parts else ""
                 arg = parts[1] if len(parts) > 1 else ""
 
-                if cmd in ("q", "quit", "exit"):
-                    break
-                elif cmd in ("h", "help", "?"):
-                    print("Commands:")
-                    print("  :q :quit :exit    - Exit REPL")
-                    print("  :help :h :?       - Show this help")
-                    print("  :ports            - List MIDI ports")
-                    print("  :instruments      - List instruments")
-                    print("  :tempo [BPM]      - Show/set default tempo")
-                    print("  :stop             - Stop playback")
-                    print("  :status           - Show playback status")
-                    print("  :concurrent       - Enable concurrent mode (layer inputs)")
-                    print(
-                        "  :sequential       - Enable sequential mode (wait for each)"
-                    )
-                    print()
-                    print("Shortcuts:")
-                    print("  Alt+Enter         - Multi-line input")
-                    print("  Ctrl+C            - Stop playback / cancel")
-                    print("  Ctrl+D            - Exit")
-                    print("  Tab               - Auto-complete")
-                    print("  Up/Down           - History")
-                elif cmd == "ports":
-                    if supports_concurrent:
-                        ports = backend.list_output_ports()
-                        if ports:
-                            for i, p in enumerate(ports):
-                                print(f"  {i}: {p}")
-                        else:
-                            print(f"  (no ports - using virtual {virtual_port_name})")
-                    else:
-                        print("  (using TinySoundFont audio backend)")
-                elif cmd == "instruments":
-                    insts = sorted(INSTRUMENT_PROGRAMS.keys())
-                    # Print in columns
-                    cols = REPL_INSTRUMENT_COLUMNS
-                    for i in range(0, len(insts), cols):
-                        row = insts[i : i + cols]
-                        print("  " + "  ".join(f"{inst:20}" for inst in row))
-                elif cmd == "tempo":
-                    if arg:
-                        try:
-                            default_tempo = int(arg)
-                            print(f"Default tempo: {default_tempo} BPM")
-                        except ValueError:
-                            print("Invalid tempo")
-                    else:
-                        print(f"Default tempo: {default_tempo} BPM")
-                elif cmd == "stop":
-                    backend.stop()
-                    print("Stopped")
-                elif cmd == "status":
-                    playing = "playing" if backend.is_playing() else "idle"
-                    if supports_concurrent:
-                        mode = "concurrent" if backend.concurrent_mode else "sequential"
-                        slots = backend.active_slots
-                        print("Backend: MIDI (libremidi)")
-                        print(f"Mode: {mode}")
-                        print(f"Status: {playing}")
-                        print(f"Active slots: {slots}/8")
-                    else:
-                        print("Backend: Audio (TinySoundFont)")
-                        print(f"Status: {playing}")
-                elif cmd == "concurrent":
-                    if supports_concurrent:
-                        backend.concurrent_mode = True
-                        print(
-                            "Concurrent mode enabled - inputs will layer on each other"
-                        )
-                    else:
-                        print("Concurrent mode not available with audio backend")
-                elif cmd == "sequential":
-                    if supports_concurrent:
-                        backend.concurrent_mode = False
-                        print("Sequential mode enabled - each input waits for previous")
-                    else:
-                        print("Audio backend always uses sequential mode")
-                else:
+                handler = _COMMANDS.get(cmd)
+                if handler is None:
                     print(f"Unknown command: :{cmd}")
+                else:
+                    handler(state, arg)
+                if not state.running:
+                    break
                 continue
 
-            # Add default tempo if not specified
-            if "(tempo" not in source.lower():
-                source = f"(tempo {default_tempo}) {source}"
-
             try:
-                ast = parse(source, "<repl>")
+                ast = _cached_parse(source, "<repl>")
+                # Add default tempo if not specified
+                if not _ast_has_tempo(ast):
+                    ast = _with_default_tempo(ast, state.default_tempo)
                 sequence = generate_midi(ast)
 
                 if not sequence.notes:
@@ -425,8 +591,7 @@ def run_repl(
                     print("(all playback slots busy - use :stop to clear)")
                 elif not supports_concurrent or not backend.concurrent_mode:
                     # In sequential mode (or audio backend), wait for playback
-                    while backend.is_playing():
-                        time.sleep(POLL_INTERVAL_DEFAULT)
+                    backend.wait()
                 # In concurrent mode, return immediately to accept next input
 
             except AldaParseError as e:
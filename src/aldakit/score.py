@@ -2,12 +2,34 @@
 
 from __future__ import annotations
 
-import time
-from functools import cached_property
+import atexit
+import threading
+from collections import deque
+from copy import copy
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
-
-from .ast_nodes import EventSequenceNode, PartNode, RootNode
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+from weakref import WeakValueDictionary
+
+from .ast_nodes import (
+    ChordNode,
+    DurationNode,
+    EventSequenceNode,
+    LispListNode,
+    LispNumberNode,
+    LispSymbolNode,
+    NoteLengthNode,
+    NoteNode,
+    OctaveDownNode,
+    OctaveSetNode,
+    OctaveUpNode,
+    PartDeclarationNode,
+    PartNode,
+    RestNode,
+    RootNode,
+)
+from .constants import MIDI_RENDER_CACHE_SIZE
 from .midi.backends import LibremidiBackend
 from .midi.generator import generate_midi
 from .midi.smf import write_midi_file
@@ -23,100 +45,246 @@ _MODE_SOURCE = "source"
 _MODE_ELEMENTS = "elements"
 _MODE_MIDI = "midi"
 
+# Alda text for common (denominator, dots) note lengths
+_DURATION_STRINGS: dict[tuple[int, int], str] = {
+    (denominator, dots): f"{denominator}{'.' * dots}"
+    for denominator in (1, 2, 4, 8, 16, 32, 64)
+    for dots in range(4)
+}
+
+# MIDI backends kept open across Score.play() calls, keyed by port name
+_SHARED_BACKENDS: dict[str | None, LibremidiBackend] = {}
+_SHARED_BACKENDS_LOCK = threading.Lock()
+
+
+def _shared_backend(port: str | None) -> LibremidiBackend:
+    """Return the open backend for ``port``, creating it on first use."""
+    with _SHARED_BACKENDS_LOCK:
+        backend = _SHARED_BACKENDS.get(port)
+        if backend is None:
+            backend = LibremidiBackend(port_name=port)
+            _SHARED_BACKENDS[port] = backend
+        return backend
+
+
+# Live read-only Scores from Score.from_elements_cached(), keyed by elements
+_ELEMENT_SCORES: WeakValueDictionary[tuple, Score] = WeakValueDictionary()
+_ELEMENT_SCORES_LOCK = threading.Lock()
+
+
+@atexit.register
+def _close_shared_backends() -> None:
+    """Close every shared backend (registered to run at interpreter exit)."""
+    with _SHARED_BACKENDS_LOCK:
+        backends = list(_SHARED_BACKENDS.values())
+        _SHARED_BACKENDS.clear()
+    for backend in backends:
+        backend.close()
+
+
+def _emit_duration(d: DurationNode | None, out: list[str]) -> None:
+    if d is None:
+        return
+    # DurationNode has components, typically NoteLengthNode
+    if not d.components:
+        return
+    comp = d.components[0]
+    if isinstance(comp, NoteLengthNode):
+        text = _DURATION_STRINGS.get((comp.denominator, comp.dots))
+        if text is None:
+            text = str(int(comp.denominator)) + "." * comp.dots
+        out.append(text)
+
+
+def _emit_joined(nodes, sep: str, out: list[str]) -> None:
+    for i, child in enumerate(nodes):
+        if i:
+            out.append(sep)
+        _emit_node(child, out)
+
+
+def _emit_part(node: PartNode, out: list[str]) -> None:
+    # PartNode wraps declaration + events
+    _emit_node(node.declaration, out)
+    out.append(" ")
+    _emit_node(node.events, out)
+
+
+def _emit_part_declaration(node: PartDeclarationNode, out: list[str]) -> None:
+    out.append(f"\n{'/'.join(node.names)}:\n")
+
+
+def _emit_note(node: NoteNode, out: list[str]) -> None:
+    out.append(node.letter)
+    out.extend(node.accidentals)
+    _emit_duration(node.duration, out)
+
+
+def _emit_rest(node: RestNode, out: list[str]) -> None:
+    out.append("r")
+    _emit_duration(node.duration, out)
+
+
+def _emit_chord(node: ChordNode, out: list[str]) -> None:
+    # Notes carry their own durations; ChordNode has no duration attr
+    _emit_joined(node.notes, "/", out)
+
+
+def _emit_lisp_list(node: LispListNode, out: list[str]) -> None:
+    out.append("(")
+    for i, elem in enumerate(node.elements):
+        if i:
+            out.append(" ")
+        if isinstance(elem, LispSymbolNode):
+            out.append(elem.name)
+        elif isinstance(elem, LispNumberNode):
+            out.append(str(elem.value))
+        else:
+            _emit_node(elem, out)
+    out.append(")")
+
+
+def _emit_octave_set(node: OctaveSetNode, out: list[str]) -> None:
+    out.append(f"o{node.octave}")
+
+
+def _emit_octave_up(node: OctaveUpNode, out: list[str]) -> None:
+    out.append(">")
+
+
+def _emit_octave_down(node: OctaveDownNode, out: list[str]) -> None:
+    out.append("<")
+
+
+def _emit_events(node, out: list[str]) -> None:
+    # EventSequenceNode
+    _emit_joined(node.events, " ", out)
+
+
+def _emit_children(node, out: list[str]) -> None:
+    # RootNode or similar container
+    _emit_joined(node.children, " ", out)
+
+
+def _emit_nothing(node, out: list[str]) -> None:
+    pass
+
+
+# Node type -> emitter; subclasses and containers are resolved on first sight
+_ALDA_EMITTERS: dict[type, Callable[[Any, list[str]], None]] = {
+    PartNode: _emit_part,
+    PartDeclarationNode: _emit_part_declaration,
+    NoteNode: _emit_note,
+    RestNode: _emit_rest,
+    ChordNode: _emit_chord,
+    LispListNode: _emit_lisp_list,
+    OctaveSetNode: _emit_octave_set,
+    OctaveUpNode: _emit_octave_up,
+    OctaveDownNode: _emit_octave_down,
+}
+
+
+def _resolve_emitter(node) -> Callable[[Any, list[str]], None]:
+    """Find and cache the emitter for a node type missing from the table."""
+    for base in type(node).__mro__[1:]:
+        emit = _ALDA_EMITTERS.get(base)
+        if emit is not None:
+            break
+    else:
+        if hasattr(node, "events"):
+            emit = _emit_events
+        elif hasattr(node, "children"):
+            emit = _emit_children
+        else:
+            emit = _emit_nothing
+    _ALDA_EMITTERS[type(node)] = emit
+    return emit
+
+
+def _emit_node(node, out: list[str]) -> None:
+    emit = _ALDA_EMITTERS.get(type(node))
+    if emit is None:
+        emit = _resolve_emitter(node)
+    emit(node, out)
+
 
 def _ast_to_alda(ast: RootNode) -> str:
     """Convert an AST back to Alda source code."""
-    from .ast_nodes import (
-        ChordNode,
-        DurationNode,
-        LispListNode,
-        LispNumberNode,
-        LispSymbolNode,
-        NoteLengthNode,
-        NoteNode,
-        OctaveDownNode,
-        OctaveSetNode,
-        OctaveUpNode,
-        PartDeclarationNode,
-        PartNode as PartNodeType,
-        RestNode,
+    parts: list[str] = []
+    _emit_node(ast, parts)
+    result = "".join(parts)
+    # Clean up extra whitespace in one pass over the lines
+    return "\n".join(
+        stripped for line in result.split("\n") if (stripped := line.strip())
     )
 
-    def duration_to_str(d: DurationNode | None) -> str:
-        if d is None:
-            return ""
-        # DurationNode has components, typically NoteLengthNode
-        if not d.components:
-            return ""
-        comp = d.components[0]
-        if isinstance(comp, NoteLengthNode):
-            result = str(int(comp.denominator))
-            result += "." * comp.dots
-            return result
-        return ""
-
-    def node_to_str(node) -> str:
-        if isinstance(node, PartNodeType):
-            # PartNode wraps declaration + events
-            decl_str = node_to_str(node.declaration)
-            events_str = node_to_str(node.events)
-            return f"{decl_str} {events_str}"
-
-        elif isinstance(node, PartDeclarationNode):
-            instruments = "/".join(node.names)
-            return f"\n{instruments}:\n"
-
-        elif isinstance(node, NoteNode):
-            result = node.letter
-            result += "".join(node.accidentals)
-            result += duration_to_str(node.duration)
-            return result
-
-        elif isinstance(node, RestNode):
-            result = "r"
-            result += duration_to_str(node.duration)
-            return result
-
-        elif isinstance(node, ChordNode):
-            # Notes carry their own durations; ChordNode has no duration attr
-            notes = "/".join(node_to_str(n) for n in node.notes)
-            return notes
-
-        elif isinstance(node, LispListNode):
-            parts = []
-            for elem in node.elements:
-                if isinstance(elem, LispSymbolNode):
-                    parts.append(elem.name)
-                elif isinstance(elem, LispNumberNode):
-                    parts.append(str(elem.value))
-                else:
-                    parts.append(node_to_str(elem))
-            return "(" + " ".join(parts) + ")"
-
-        elif isinstance(node, OctaveSetNode):
-            return f"o{node.octave}"
-
-        elif isinstance(node, OctaveUpNode):
-            return ">"
-
-        elif isinstance(node, OctaveDownNode):
-            return "<"
-
-        elif hasattr(node, "events"):
-            # EventSequenceNode
-            return " ".join(node_to_str(e) for e in node.events)
-
-        elif hasattr(node, "children"):
-            # RootNode or similar container
-            return " ".join(node_to_str(c) for c in node.children)
 
+def _elements_to_ast(elements: Iterable[ComposeElement]) -> RootNode:
+    """Build an AST directly from compose elements."""
+    from .compose.part import Part
+
+    children = []
+    current_events: list = []
+    current_part_decl: PartDeclarationNode | None = None
+
+    def flush_part():
+        """Flush accumulated events, wrapping in PartNode if there's a declaration."""
+        nonlocal current_events, current_part_decl
+        if current_part_decl is not None:
+            # Wrap declaration and events in a PartNode
+            children.append(
+                PartNode(
+                    declaration=current_part_decl,
+                    events=EventSequenceNode(events=current_events, position=None),
+                    position=None,
+                )
+            )
+            current_part_decl = None
+            current_events = []
+        elif current_events:
+            # No part declaration - bare event sequence
+            children.append(EventSequenceNode(events=current_events, position=None))
+            current_events = []
+
+    for element in elements:
+        ast_node = element.to_ast()
+
+        if isinstance(element, Part):
+            # Flush previous part first
+            flush_part()
+            # Start new part - Part.to_ast() returns PartDeclarationNode
+            assert isinstance(ast_node, PartDeclarationNode)
+            current_part_decl = ast_node
         else:
-            return ""
+            # Accumulate events
+            current_events.append(ast_node)
+
+    # Flush remaining content
+    flush_part()
+
+    return RootNode(children=children, position=None)
+
 
-    result = node_to_str(ast)
-    # Clean up extra whitespace
-    lines = [line.strip() for line in result.split("\n")]
-    return "\n".join(line for line in lines if line)
+@lru_cache(maxsize=MIDI_RENDER_CACHE_SIZE)
+def _render_elements_midi(elements: tuple[ComposeElement, ...]) -> MidiSequence:
+    """Generate MIDI for a tuple of compose elements.
+
+    Compose elements are frozen dataclasses that compare and hash by value,
+    so equal element tuples share one rendered sequence. Callers receive
+    copies from _copy_sequence(), never the cached sequence itself.
+    """
+    return generate_midi(_elements_to_ast(elements))
+
+
+def _copy_sequence(sequence: MidiSequence) -> MidiSequence:
+    """Copy a sequence and its events, so the copy can be mutated freely."""
+    return replace(
+        sequence,
+        notes=list(map(copy, sequence.notes)),
+        program_changes=list(map(copy, sequence.program_changes)),
+        control_changes=list(map(copy, sequence.control_changes)),
+        tempo_changes=list(map(copy, sequence.tempo_changes)),
+    )
 
 
 class Score:
@@ -155,21 +323,79 @@ class Score:
         >>> score.play()
     """
 
-    def __init__(self, source: str, filename: str = "<input>") -> None:
+    __slots__ = (
+        "_mode",
+        "_source",
+        "_filename",
+        "_elements",
+        "_imported_ast",
+        "_ast",
+        "_midi",
+        "_alda",
+        "_duration",
+        "_prefetched_midi",
+        "_ast_shared",
+        "_frozen",
+        "_ast_lock",
+        "_midi_lock",
+        "__weakref__",
+    )
+
+    def __init__(
+        self, source: str, filename: str = "<input>", *, prefetch: bool = False
+    ) -> None:
         """Create a Score from Alda source code.
 
         Args:
             source: Alda source code string.
             filename: Optional filename for error messages.
+            prefetch: Parse and generate MIDI on a background thread, so
+                play() and save() usually find it ready. The prefetched MIDI
+                is discarded if the AST is accessed before MIDI is read,
+                since the caller may change the tree.
         """
         self._mode = _MODE_SOURCE
         self._source = source
         self._filename = filename
-        self._elements: list[ComposeElement] = []
+        self._elements: deque[ComposeElement] = deque()
         self._imported_ast: RootNode | None = None
+        self._ast: RootNode | None = None
+        self._midi: MidiSequence | None = None
+        self._alda: str | None = None
+        self._duration: float | None = None
+        self._prefetched_midi: MidiSequence | None = None
+        self._ast_shared = False
+        self._frozen = False
+        self._init_locks()
+        if prefetch:
+            threading.Thread(target=self._warm_cache, daemon=True).start()
+
+    def _init_locks(self) -> None:
+        """Create the locks guarding the lazily computed ast and midi.
+
+        They are separate so reading ``ast`` never waits for MIDI generation.
+        Lock order is midi before ast.
+        """
+        self._ast_lock = threading.Lock()
+        self._midi_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Locks can't be pickled or copied; __setstate__ creates fresh ones
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in ("_ast_lock", "_midi_lock", "__weakref__")
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._init_locks()
 
     @classmethod
-    def from_source(cls, source: str, filename: str = "<input>") -> Score:
+    def from_source(
+        cls, source: str, filename: str = "<input>", *, prefetch: bool = False
+    ) -> Score:
         """Create a Score from Alda source code.
 
         This is equivalent to calling Score(source, filename) directly.
@@ -177,11 +403,12 @@ class Score:
         Args:
             source: Alda source code string.
             filename: Optional filename for error messages.
+            prefetch: Generate MIDI on a background thread (see Score()).
 
         Returns:
             A new Score instance.
         """
-        return cls(source, filename)
+        return cls(source, filename, prefetch=prefetch)
 
     @classmethod
     def from_file(cls, path: str | Path) -> Score:
@@ -249,8 +476,16 @@ class Score:
         score._mode = _MODE_MIDI
         score._source = ""
         score._filename = str(path)
-        score._elements = []
+        score._elements = deque()
         score._imported_ast = ast
+        score._ast = ast
+        score._midi = None
+        score._alda = None
+        score._duration = None
+        score._prefetched_midi = None
+        score._ast_shared = False
+        score._frozen = False
+        score._init_locks()
         return score
 
     @classmethod
@@ -277,10 +512,48 @@ class Score:
         score._mode = _MODE_ELEMENTS
         score._source = ""
         score._filename = "<compose>"
-        score._elements = list(elements)
+        score._elements = deque(elements)
         score._imported_ast = None
+        score._ast = None
+        score._midi = None
+        score._alda = None
+        score._duration = None
+        score._prefetched_midi = None
+        score._ast_shared = False
+        score._frozen = False
+        score._init_locks()
         return score
 
+    @classmethod
+    def from_elements_cached(cls, *elements: ComposeElement) -> Score:
+        """Return a shared Score for the given compose elements.
+
+        While a Score built from equal elements is still alive, it is
+        returned instead of a new one, so its AST, MIDI and Alda caches are
+        reused. Shared scores are read-only and ``add()`` raises on them: use
+        ``from_elements()`` for a score you intend to extend.
+        Scores containing unhashable elements (such as ``Seq``) are not
+        shared.
+
+        Args:
+            *elements: Compose elements (notes, rests, parts, tempo, etc.).
+
+        Returns:
+            A Score instance, possibly shared with other callers.
+        """
+        try:
+            hash(elements)
+        except TypeError:
+            return cls.from_elements(*elements)
+        key = (cls, elements)
+        with _ELEMENT_SCORES_LOCK:
+            score = _ELEMENT_SCORES.get(key)
+            if score is None:
+                score = cls.from_elements(*elements)
+                score._frozen = True
+                _ELEMENT_SCORES[key] = score
+            return score
+
     @classmethod
     def from_parts(cls, *parts: Any) -> Score:
         """Create a Score from Part objects.
@@ -300,9 +573,41 @@ class Score:
         """The original Alda source code (if created from source)."""
         return self._source
 
-    @cached_property
+    @property
     def ast(self) -> RootNode:
         """The parsed AST (lazily computed and cached)."""
+        # Once handed out the tree may be changed, so prefetched MIDI is stale
+        self._ast_shared = True
+        return self._get_ast()
+
+    def _get_ast(self) -> RootNode:
+        """Return the cached AST, computing it if needed."""
+        ast = self._ast
+        if ast is None:
+            with self._ast_lock:
+                if self._ast is None:
+                    self._ast = self._compute_ast()
+                ast = self._ast
+        return ast
+
+    @property
+    def midi(self) -> MidiSequence:
+        """The generated MIDI sequence (lazily computed and cached)."""
+        midi = self._midi
+        if midi is None:
+            with self._midi_lock:
+                if self._midi is None:
+                    prefetched = self._prefetched_midi
+                    self._prefetched_midi = None
+                    if prefetched is not None and not self._ast_shared:
+                        self._midi = prefetched
+                    else:
+                        self._midi = self._compute_midi()
+                midi = self._midi
+        return midi
+
+    def _compute_ast(self) -> RootNode:
+        """Build the AST for the current mode."""
         if self._mode == _MODE_SOURCE:
             return parse(self._source, self._filename)
         elif self._mode == _MODE_MIDI:
@@ -312,69 +617,49 @@ class Score:
         else:
             return self._build_ast_from_elements()
 
-    @cached_property
-    def midi(self) -> MidiSequence:
-        """The generated MIDI sequence (lazily computed and cached)."""
-        return generate_midi(self.ast)
+    def _compute_midi(self) -> MidiSequence:
+        """Generate MIDI, reusing renders between equal element-built scores."""
+        if self._mode == _MODE_ELEMENTS:
+            elements = tuple(self._elements)
+            try:
+                hash(elements)
+            except TypeError:
+                # Mutable elements such as Seq are unhashable
+                return generate_midi(self._get_ast())
+            return _copy_sequence(_render_elements_midi(elements))
+        return generate_midi(self._get_ast())
+
+    def _warm_cache(self) -> None:
+        """Prefetch ast and midi ahead of use (runs on a daemon thread)."""
+        with self._midi_lock:
+            if self._midi is not None or self._ast_shared:
+                return
+            try:
+                self._prefetched_midi = self._compute_midi()
+            except Exception:
+                # Errors resurface when the caller touches the property
+                pass
 
     @property
     def duration(self) -> float:
         """Total duration of the score in seconds."""
-        return self.midi.duration()
+        duration = self._duration
+        if duration is None:
+            duration = self._duration = self.midi.duration()
+        return duration
 
     def _build_ast_from_elements(self) -> RootNode:
         """Build AST directly from compose elements."""
-        from .ast_nodes import PartDeclarationNode
-
-        from .compose.part import Part
-
-        children = []
-        current_events: list = []
-        current_part_decl: PartDeclarationNode | None = None
-
-        def flush_part():
-            """Flush accumulated events, wrapping in PartNode if there's a declaration."""
-            nonlocal current_events, current_part_decl
-            if current_part_decl is not None:
-                # Wrap declaration and events in a PartNode
-                children.append(
-                    PartNode(
-                        declaration=current_part_decl,
-                        events=EventSequenceNode(events=current_events, position=None),
-                        position=None,
-                    )
-                )
-                current_part_decl = None
-                current_events = []
-            elif current_events:
-                # No part declaration - bare event sequence
-                children.append(EventSequenceNode(events=current_events, position=None))
-                current_events = []
-
-        for element in self._elements:
-            ast_node = element.to_ast()
-
-            if isinstance(element, Part):
-                # Flush previous part first
-                flush_part()
-                # Start new part - Part.to_ast() returns PartDeclarationNode
-                assert isinstance(ast_node, PartDeclarationNode)
-                current_part_decl = ast_node
-            else:
-                # Accumulate events
-                current_events.append(ast_node)
-
-        # Flush remaining content
-        flush_part()
-
-        return RootNode(children=children, position=None)
+        return _elements_to_ast(self._elements)
 
     def _invalidate_cache(self) -> None:
         """Invalidate cached properties after modification."""
-        # Delete cached properties if they exist
-        for attr in ("ast", "midi"):
-            if attr in self.__dict__:
-                del self.__dict__[attr]
+        with self._midi_lock, self._ast_lock:
+            self._ast = None
+            self._midi = None
+            self._prefetched_midi = None
+            self._alda = None
+            self._duration = None
 
     # Builder methods
 
@@ -391,13 +676,20 @@ class Score:
             Self for method chaining.
 
         Raises:
-            ValueError: If the score was created from source code.
+            ValueError: If the score was created from source code, or is a
+                shared score from from_elements_cached().
         """
         if self._mode != _MODE_ELEMENTS:
             raise ValueError(
                 "Cannot add elements to this score. "
                 "Use Score.from_elements() to create a modifiable score."
             )
+        if self._frozen:
+            raise ValueError(
+                "Cannot add elements to a shared score from "
+                "Score.from_elements_cached(). "
+                "Use Score.from_elements() to create a modifiable score."
+            )
         self._elements.extend(elements)
         self._invalidate_cache()
         return self
@@ -453,11 +745,17 @@ class Score:
         """
         if self._mode == _MODE_SOURCE:
             return self._source
-        elif self._mode == _MODE_MIDI:
-            # Generate Alda from AST
-            return _ast_to_alda(self.ast)
-        else:
-            return " ".join(e.to_alda() for e in self._elements)
+        alda = self._alda
+        if alda is None:
+            if self._mode == _MODE_MIDI:
+                # Generate Alda from AST
+                alda = _ast_to_alda(self._get_ast())
+            else:
+                from .compose.core import _join_alda
+
+                alda = _join_alda(self._elements)
+            self._alda = alda
+        return alda
 
     def play(
         self,
@@ -494,12 +792,15 @@ class Score:
                 if wait:
                     audio_backend.wait()
         else:
-            # Default: MIDI backend
-            with LibremidiBackend(port_name=port) as midi_backend:
-                midi_backend.play(self.midi)
-                if wait:
-                    while midi_backend.is_playing():
-                        time.sleep(0.1)
+            # Default: MIDI backend, reusing the port opened by earlier calls
+            midi_backend = _shared_backend(port)
+            midi_backend.play(self.midi)
+            if wait:
+                try:
+                    midi_backend.wait()
+                except KeyboardInterrupt:
+                    midi_backend.stop()
+                    raise
 
     def save(self, path: str | Path) -> None:
         """Save the score to a file.
@@ -0,0 +1,31 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+import aldakit
+from aldakit import Score
+
+
+@pytest.fixture(scope="module")
+def cde_source():
+    """Canonical three-note piano snippet."""
+    return "piano: c d e"
+
+
+@pytest.fixture(scope="module")
+def cde_score(cde_source):
+    """A Score for ``cde_source``, parsed once per module.
+
+    Only use this in tests that treat the score as read-only.
+    """
+    score = Score(cde_source)
+    score.midi  # Materialize ast and midi up front
+    return score
+
+
+@pytest.fixture(scope="session")
+def cde_midi_bytes(tmp_path_factory):
+    """MIDI file bytes for ``piano: c d e``, saved once per session."""
+    path = tmp_path_factory.mktemp("midi") / "cde.mid"
+    aldakit.save("piano: c d e", path)
+    return path.read_bytes()
@@ -1,5 +1,7 @@
 """Tests for the high-level aldakit API."""
 
+import subprocess
+import sys
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -11,12 +13,58 @@ from aldakit.midi.types import MidiSequence
 from aldakit.errors import AldaParseError
 
 
+@pytest.fixture(autouse=True)
+def _fresh_shared_backends():
+    """Keep Score.play's shared MIDI backends from leaking between tests."""
+    from aldakit import score
+
+    score._SHARED_BACKENDS.clear()
+    yield
+    score._SHARED_BACKENDS.clear()
+
+
+class _FakeMidiBackend:
+    """LibremidiBackend stand-in recording how Score.play drives it."""
+
+    def __init__(self, port_name=None):
+        self.port_name = port_name
+        self.played = []
+        self.waits = 0
+        self.closed = False
+
+    def play(self, sequence):
+        self.played.append(sequence)
+        return 0
+
+    def wait(self):
+        self.waits += 1
+
+    def stop(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_backends(monkeypatch):
+    """Patch Score's MIDI backend with fakes; returns those created, in order."""
+    created = []
+
+    def make_backend(port_name=None):
+        backend = _FakeMidiBackend(port_name)
+        created.append(backend)
+        return backend
+
+    monkeypatch.setattr("aldakit.score.LibremidiBackend", make_backend)
+    return created
+
+
 class TestScore:
     """Test Score class."""
 
-    def test_create_from_string(self):
-        score = Score("piano: c d e")
-        assert score.source == "piano: c d e"
+    def test_create_from_string(self, cde_score, cde_source):
+        assert cde_score.source == cde_source
 
     def test_create_from_file(self, tmp_path):
         alda_file = tmp_path / "test.alda"
@@ -29,9 +77,8 @@ class TestScore:
         with pytest.raises(FileNotFoundError):
             Score.from_file("/nonexistent/file.alda")
 
-    def test_ast_property(self):
-        score = Score("piano: c d e")
-        ast = score.ast
+    def test_ast_property(self, cde_score):
+        ast = cde_score.ast
         assert isinstance(ast, RootNode)
         assert len(ast.children) == 1
 
@@ -41,9 +88,12 @@ class TestScore:
         ast2 = score.ast
         assert ast1 is ast2  # Same object (cached)
 
-    def test_midi_property(self):
-        score = Score("piano: c d e")
-        midi = score.midi
+    def test_ast_not_shared_between_scores(self):
+        """Each Score parses its own (mutable) tree."""
+        assert Score("piano: c d e").ast is not Score("piano: c d e").ast
+
+    def test_midi_property(self, cde_score):
+        midi = cde_score.midi
         assert isinstance(midi, MidiSequence)
         assert len(midi.notes) == 3
 
@@ -53,6 +103,82 @@ class TestScore:
         midi2 = score.midi
         assert midi1 is midi2  # Same object (cached)
 
+    def test_caches_warmed_in_background(self):
+        """prefetch=True materializes ast and midi without being asked."""
+        import time
+
+        score = Score("piano: c d e", prefetch=True)
+        deadline = time.monotonic() + 5.0
+        while score._prefetched_midi is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert score._ast is not None
+        prefetched = score._prefetched_midi
+        assert len(prefetched.notes) == 3
+        assert score.midi is prefetched
+
+    def test_no_prefetch_by_default(self):
+        """Without prefetch, no background thread is started."""
+        with patch("aldakit.score.threading.Thread") as thread:
+            score = Score("piano: c d e")
+        thread.assert_not_called()
+        assert len(score.midi.notes) == 3
+
+    def test_prefetched_midi_discarded_once_ast_shared(self):
+        """MIDI prefetched before the AST was handed out is regenerated."""
+        import time
+
+        score = Score("piano: c d e", prefetch=True)
+        deadline = time.monotonic() + 5.0
+        while score._prefetched_midi is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert score._prefetched_midi is not None
+
+        score.ast.children[0].events.events.pop()
+        assert len(score.midi.notes) == 2
+
+    def test_ast_does_not_wait_for_background_midi(self):
+        """Reading ast returns while MIDI generation is still running."""
+        import threading
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_generate(ast):
+            started.set()
+            release.wait(5.0)
+            return MidiSequence()
+
+        with patch("aldakit.score.generate_midi", slow_generate):
+            score = Score("piano: c d e", prefetch=True)
+            assert started.wait(5.0)
+            try:
+                assert isinstance(score.ast, RootNode)
+                assert score._midi is None
+            finally:
+                release.set()
+
+    def test_copy_and_pickle(self):
+        """Scores survive deepcopy and pickling, with fresh locks."""
+        import copy
+        import pickle
+
+        score = Score("piano: c d e")
+        score.midi
+        for clone in (copy.deepcopy(score), pickle.loads(pickle.dumps(score))):
+            assert clone.source == score.source
+            assert len(clone.midi.notes) == 3
+            assert clone._midi_lock is not score._midi_lock
+
+    def test_uses_slots(self):
+        """Scores keep their state in slots rather than a __dict__."""
+        assert not hasattr(Score("piano: c"), "__dict__")
+
+    def test_background_parse_error_surfaces(self):
+        """A parse error in the background is raised on access."""
+        score = Score("piano: (tempo 120")
+        with pytest.raises(AldaParseError):
+            score.midi
+
     def test_duration_property(self):
         score = Score("piano: c4 d4 e4")  # Three quarter notes
         duration = score.duration
@@ -63,9 +189,8 @@ class TestScore:
         with pytest.raises(AldaParseError):
             _ = score.ast
 
-    def test_repr(self):
-        score = Score("piano: c d e")
-        repr_str = repr(score)
+    def test_repr(self, cde_score):
+        repr_str = repr(cde_score)
         assert "Score(" in repr_str
         assert "piano: c d e" in repr_str
 
@@ -76,43 +201,55 @@ class TestScore:
         assert "..." in repr_str
         assert len(repr_str) < 100
 
-    @patch("aldakit.score.LibremidiBackend")
-    def test_play(self, mock_backend_class):
-        mock_backend = MagicMock()
-        mock_backend.is_playing.return_value = False
-        mock_backend.__enter__ = MagicMock(return_value=mock_backend)
-        mock_backend.__exit__ = MagicMock(return_value=None)
-        mock_backend_class.return_value = mock_backend
+    def test_play(self, fake_backends, cde_score):
+        cde_score.play()
+
+        (backend,) = fake_backends
+        assert backend.port_name is None
+        assert backend.played == [cde_score.midi]
+        assert backend.waits == 1
+
+    def test_play_with_port(self, fake_backends, cde_score):
+        cde_score.play(port="TestPort")
+
+        (backend,) = fake_backends
+        assert backend.port_name == "TestPort"
+        assert len(backend.played) == 1
+
+    def test_play_no_wait(self, fake_backends, cde_score):
+        cde_score.play(wait=False)
+
+        (backend,) = fake_backends
+        assert len(backend.played) == 1
+        assert backend.waits == 0
 
+    def test_play_reuses_backend(self, fake_backends):
+        """Repeated plays on one port share a single open backend."""
         score = Score("piano: c d e")
         score.play()
+        Score("piano: f").play(wait=False)
+        score.play(port="Other")
 
-        assert mock_backend_class.call_count == 1
-        assert mock_backend_class.call_args.kwargs == {"port_name": None}
-        assert mock_backend.play.call_count == 1
+        default, other = fake_backends
+        assert (default.port_name, other.port_name) == (None, "Other")
+        assert (len(default.played), len(other.played)) == (2, 1)
+        assert not default.closed and not other.closed
 
-    @patch("aldakit.score.LibremidiBackend")
-    def test_play_with_port(self, mock_backend_class):
-        mock_backend = MagicMock()
-        mock_backend.is_playing.return_value = False
-        mock_backend.__enter__ = MagicMock(return_value=mock_backend)
-        mock_backend.__exit__ = MagicMock(return_value=None)
-        mock_backend_class.return_value = mock_backend
+    def test_shared_backends_closed_at_exit(self, fake_backends):
+        """The exit hook closes and forgets every shared backend."""
+        from aldakit import score as score_module
 
-        score = Score("piano: c d e")
-        score.play(port="TestPort")
+        Score("piano: c").play()
+        score_module._close_shared_backends()
 
-        assert mock_backend_class.call_count == 1
-        assert mock_backend_class.call_args.kwargs == {"port_name": "TestPort"}
-        assert mock_backend.play.call_count == 1
+        assert [backend.closed for backend in fake_backends] == [True]
+        assert score_module._SHARED_BACKENDS == {}
 
     @patch("aldakit.score.write_midi_file")
-    @patch("aldakit.score.LibremidiBackend")
-    def test_save(self, mock_backend_class, mock_write):
-        score = Score("piano: c d e")
-        score.save("output.mid")
+    def test_save(self, mock_write, fake_backends, cde_score):
+        cde_score.save("output.mid")
 
-        mock_backend_class.assert_not_called()
+        assert fake_backends == []
         mock_write.assert_called_once()
         from pathlib import Path
 
@@ -122,6 +259,26 @@ class TestScore:
 class TestModuleFunctions:
     """Test module-level convenience functions."""
 
+    def test_import_defers_midi_backends(self):
+        """Importing aldakit does not load the MIDI backends until needed."""
+        code = (
+            "import sys, aldakit; "
+            "assert 'aldakit.midi.backends' not in sys.modules; "
+            "aldakit.Score; "
+            "assert 'aldakit.midi.backends' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_lazy_names_exported(self):
+        """Every name in __all__ resolves and is listed by dir()."""
+        for name in aldakit.__all__:
+            assert getattr(aldakit, name) is not None
+            assert name in dir(aldakit)
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            aldakit.no_such_name
+
     @patch("aldakit.api.Score")
     def test_play(self, mock_score_class):
         mock_score = MagicMock()
@@ -187,6 +344,7 @@ class TestModuleFunctions:
         assert ports == ["Port1", "Port2"]
 
 
+@pytest.mark.slow
 class TestIntegration:
     """Integration tests using real parsing and MIDI generation."""
 
@@ -211,15 +369,10 @@ class TestIntegration:
         assert output_file.exists()
         assert output_file.stat().st_size > 0
 
-    def test_save_function_creates_file(self, tmp_path):
+    def test_save_function_creates_file(self, cde_midi_bytes):
         """Test save() function creates a valid MIDI file."""
-        output_file = tmp_path / "test.mid"
-        aldakit.save("piano: c d e", output_file)
-
-        assert output_file.exists()
         # MIDI files start with "MThd"
-        with open(output_file, "rb") as f:
-            assert f.read(4) == b"MThd"
+        assert cde_midi_bytes[:4] == b"MThd"
 
 
 # =============================================================================
@@ -382,22 +535,20 @@ class TestScoreFromMidi:
         assert imported_score.midi is not None
         assert len(imported_score.midi.notes) >= 3
 
-    def test_from_midi_file_repr(self, tmp_path):
+    def test_from_midi_file_repr(self, tmp_path, cde_score):
         """Repr for midi-imported score."""
-        source_score = Score("piano: c d e")
         midi_path = tmp_path / "test.mid"
-        source_score.save(midi_path)
+        cde_score.save(midi_path)
 
         imported_score = Score.from_midi_file(midi_path)
         repr_str = repr(imported_score)
 
         assert "Score.from_midi_file" in repr_str
 
-    def test_from_midi_file_to_alda(self, tmp_path):
+    def test_from_midi_file_to_alda(self, tmp_path, cde_score):
         """Convert MIDI file to Alda."""
-        source_score = Score("piano: c d e")
         midi_path = tmp_path / "test.mid"
-        source_score.save(midi_path)
+        cde_score.save(midi_path)
 
         imported_score = Score.from_midi_file(midi_path)
         alda = imported_score.to_alda()
@@ -405,11 +556,10 @@ class TestScoreFromMidi:
         # Should generate some Alda code
         assert len(alda) > 0
 
-    def test_from_file_auto_detects_midi(self, tmp_path):
+    def test_from_file_auto_detects_midi(self, tmp_path, cde_score):
         """from_file auto-detects MIDI files."""
-        source_score = Score("piano: c d e")
         midi_path = tmp_path / "test.mid"
-        source_score.save(midi_path)
+        cde_score.save(midi_path)
 
         imported_score = Score.from_file(midi_path)
 
@@ -428,16 +578,14 @@ class TestScoreFromMidi:
 class TestScoreSave:
     """Tests for Score.save method."""
 
-    def test_save_midi(self, tmp_path):
+    @pytest.mark.slow
+    def test_save_midi(self, tmp_path, cde_score, cde_midi_bytes):
         """Save as MIDI file."""
-        score = Score("piano: c d e")
         midi_path = tmp_path / "output.mid"
 
-        score.save(midi_path)
+        cde_score.save(midi_path)
 
-        assert midi_path.exists()
-        with open(midi_path, "rb") as f:
-            assert f.read(4) == b"MThd"
+        assert midi_path.read_bytes() == cde_midi_bytes
 
     def test_save_alda(self, tmp_path):
         """Save as Alda file."""
@@ -451,16 +599,13 @@ class TestScoreSave:
         content = alda_path.read_text()
         assert "piano" in content
 
-    def test_save_unknown_extension(self, tmp_path):
+    def test_save_unknown_extension(self, tmp_path, cde_score, cde_midi_bytes):
         """Save with unknown extension defaults to MIDI."""
-        score = Score("piano: c d e")
         output_path = tmp_path / "output.xyz"
 
-        score.save(output_path)
+        cde_score.save(output_path)
 
-        assert output_path.exists()
-        with open(output_path, "rb") as f:
-            assert f.read(4) == b"MThd"
+        assert output_path.read_bytes() == cde_midi_bytes
 
 
 class TestScorePlay:
@@ -481,6 +626,52 @@ class TestScorePlay:
 class TestAstToAlda:
     """Tests for _ast_to_alda helper function."""
 
+    def test_ast_to_alda_exact_output(self):
+        """Fragments are joined with the expected separators."""
+        from aldakit.score import _ast_to_alda
+        from aldakit.parser import parse
+
+        ast = parse("piano: (tempo 90) o4 c+8. d/f+/a4 > r2 <", "<test>")
+
+        assert _ast_to_alda(ast) == "piano:\n(tempo 90) o4 c+8. d/f+/a4 > r2 <"
+
+    def test_ast_to_alda_long_sequence(self):
+        """Long sequences round-trip through parse and back."""
+        from aldakit.score import _ast_to_alda
+        from aldakit.parser import parse
+
+        body = " ".join(["c8 e8 g4"] * 500)
+        alda = _ast_to_alda(parse(f"piano: {body}", "<test>"))
+
+        assert alda == f"piano:\n{body}"
+
+    def test_ast_to_alda_uncommon_durations(self):
+        """Denominators outside the precomputed table still render."""
+        from aldakit.score import _ast_to_alda
+        from aldakit.parser import parse
+
+        ast = parse("piano: c3 d6.. e128 f1...", "<test>")
+
+        assert _ast_to_alda(ast) == "piano:\nc3 d6.. e128 f1..."
+
+    def test_ast_to_alda_subclass_uses_base_emitter(self):
+        """Node subclasses render like their registered base class."""
+        from aldakit.ast_nodes import NoteNode, RootNode
+        from aldakit.score import _ALDA_EMITTERS, _ast_to_alda
+
+        class AccentedNote(NoteNode):
+            pass
+
+        try:
+            root = RootNode(
+                children=[AccentedNote(letter="c", accidentals=["+"], position=None)],
+                position=None,
+            )
+            assert _ast_to_alda(root) == "c+"
+            assert _ALDA_EMITTERS[AccentedNote] is _ALDA_EMITTERS[NoteNode]
+        finally:
+            _ALDA_EMITTERS.pop(AccentedNote, None)
+
     def test_ast_to_alda_notes(self):
         """Convert notes to Alda."""
         from aldakit.score import _ast_to_alda
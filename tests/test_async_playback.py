@@ -165,6 +165,34 @@ class TestAsyncPlaybackManager:
         assert manager.is_playing() is False
         assert elapsed >= 0.1  # At least note duration
 
+    def test_wait_idle_tracks_playback(self, manager):
+        """wait_idle times out while playing and returns True once drained."""
+        assert manager.wait_idle(0) is True
+        seq = MidiSequence(
+            notes=[
+                MidiNote(
+                    pitch=60, velocity=100, start_time=0.0, duration=0.2, channel=0
+                )
+            ]
+        )
+        manager.play(seq)
+        assert manager.wait_idle(0.01) is False
+        assert manager.wait_idle(2.0) is True
+        assert manager.is_playing() is False
+
+    def test_wait_idle_after_stop(self, manager):
+        """Stopping playback releases waiters."""
+        seq = MidiSequence(
+            notes=[
+                MidiNote(
+                    pitch=60, velocity=100, start_time=0.0, duration=5.0, channel=0
+                )
+            ]
+        )
+        manager.play(seq)
+        manager.stop()
+        assert manager.wait_idle(1.0) is True
+
     def test_concurrent_playback_multiple_slots(self, manager):
         """Multiple sequences can play concurrently."""
         seq1 = MidiSequence(
@@ -2,6 +2,7 @@
 
 import argparse
 import builtins
+import io
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -32,134 +33,95 @@ def test_cli_version_matches_package(capsys):
     assert out.endswith(__version__)
 
 
-def test_stdin_mode_uses_backend_context(monkeypatch):
-    entered = False
-    exited = False
+class DummyBackend:
+    """LibremidiBackend stand-in that records construction and context use."""
 
-    class DummyBackend:
-        def __init__(self, port_name=None, virtual_port_name=None):
-            pass
-
-        def __enter__(self):
-            nonlocal entered
-            entered = True
-            return self
+    instances: list["DummyBackend"] = []
 
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            nonlocal exited
-            exited = True
+    def __init__(self, port_name=None, virtual_port_name=None):
+        self.port_name = port_name
+        self.virtual_port_name = virtual_port_name
+        self.entered = False
+        self.exited = False
+        self.played = []
+        DummyBackend.instances.append(self)
 
-        def play(self, sequence):
-            return None
+    def __enter__(self):
+        self.entered = True
+        return self
 
-        def is_playing(self):
-            return False
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.exited = True
 
-    def fake_input(prompt: str | None = None):
-        raise EOFError
+    def play(self, sequence):
+        self.played.append(sequence)
 
-    monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-    monkeypatch.setattr(builtins, "input", fake_input)
-
-    assert (
-        stdin_mode(port_name=None, verbose=False, virtual_port_name="AldakitMIDI") == 0
-    )
-    assert entered and exited
+    def is_playing(self):
+        return False
 
 
 class TestResolvePortSpecifier:
     """Tests for _resolve_port_specifier."""
 
-    def test_none_returns_none_with_multiple_ports(self):
-        port, ok = _resolve_port_specifier(None, ["PortA", "PortB"], "output")
-        assert port is None
-        assert ok is True
-
-    def test_none_returns_none_with_no_ports(self):
-        port, ok = _resolve_port_specifier(None, [], "output")
-        assert port is None
-        assert ok is True
-
-    def test_index_resolves_to_name(self):
-        port, ok = _resolve_port_specifier("0", ["FluidSynth", "IAC"], "output")
-        assert port == "FluidSynth"
-        assert ok is True
-
-    def test_index_second_port(self):
-        port, ok = _resolve_port_specifier("1", ["FluidSynth", "IAC"], "output")
-        assert port == "IAC"
-        assert ok is True
-
-    def test_index_out_of_range_fails(self, capsys):
-        port, ok = _resolve_port_specifier("5", ["A", "B"], "output")
-        assert port is None
-        assert ok is False
-        err = capsys.readouterr().err
-        assert "out of range" in err
-
-    def test_name_passed_through(self):
-        port, ok = _resolve_port_specifier("FluidSynth", ["FluidSynth"], "output")
-        assert port == "FluidSynth"
-        assert ok is True
-
-    def test_partial_name_passed_through(self):
-        # Backend handles partial matching, so we just pass it through
-        port, ok = _resolve_port_specifier("Fluid", ["FluidSynth"], "output")
-        assert port == "Fluid"
-        assert ok is True
-
-
-class TestResolveOutputPort:
-    """Tests for _resolve_output_port auto-selection."""
-
-    def test_auto_selects_single_port(self, monkeypatch):
-        class DummyBackend:
-            def list_output_ports(self):
-                return ["OnlyPort"]
-
-        monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        port, ok = _resolve_output_port(None)
-        assert port == "OnlyPort"
-        assert ok is True
-
-    def test_no_auto_select_with_multiple_ports(self, monkeypatch):
-        class DummyBackend:
-            def list_output_ports(self):
-                return ["PortA", "PortB"]
-
-        monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        port, ok = _resolve_output_port(None)
-        assert port is None
-        assert ok is True
-
-    def test_no_auto_select_with_no_ports(self, monkeypatch):
-        class DummyBackend:
-            def list_output_ports(self):
-                return []
+    @pytest.mark.parametrize(
+        "spec,ports,expected_port,expected_ok,err_contains",
+        [
+            (None, ["PortA", "PortB"], None, True, None),
+            (None, [], None, True, None),
+            ("0", ["FluidSynth", "IAC"], "FluidSynth", True, None),
+            ("1", ["FluidSynth", "IAC"], "IAC", True, None),
+            ("5", ["A", "B"], None, False, "out of range"),
+            ("FluidSynth", ["FluidSynth"], "FluidSynth", True, None),
+            # Backend handles partial matching, so we just pass it through
+            ("Fluid", ["FluidSynth"], "Fluid", True, None),
+        ],
+    )
+    def test_resolve(
+        self, capsys, spec, ports, expected_port, expected_ok, err_contains
+    ):
+        port, ok = _resolve_port_specifier(spec, ports, "output")
+        assert port == expected_port
+        assert ok is expected_ok
+        if err_contains:
+            assert err_contains in capsys.readouterr().err
 
-        monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        port, ok = _resolve_output_port(None)
-        assert port is None
-        assert ok is True
 
+def _patch_output_ports(monkeypatch, ports):
+    class DummyBackend:
+        def list_output_ports(self):
+            return ports
 
-class TestResolveInputPort:
-    """Tests for _resolve_input_port auto-selection."""
+    monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
 
-    def test_auto_selects_single_port(self, monkeypatch):
-        monkeypatch.setattr(
-            "aldakit.midi.transcriber.list_input_ports", lambda: ["OnlyInputPort"]
-        )
-        port, ok = _resolve_input_port(None)
-        assert port == "OnlyInputPort"
-        assert ok is True
 
-    def test_no_auto_select_with_multiple_ports(self, monkeypatch):
-        monkeypatch.setattr(
-            "aldakit.midi.transcriber.list_input_ports", lambda: ["InputA", "InputB"]
-        )
-        port, ok = _resolve_input_port(None)
-        assert port is None
+def _patch_input_ports(monkeypatch, ports):
+    monkeypatch.setattr("aldakit.midi.transcriber.list_input_ports", lambda: ports)
+
+
+class TestResolvePortAutoSelect:
+    """Tests for _resolve_output_port / _resolve_input_port auto-selection."""
+
+    @pytest.mark.parametrize(
+        "resolver,patch_ports,ports,expected",
+        [
+            (_resolve_output_port, _patch_output_ports, ["OnlyPort"], "OnlyPort"),
+            (_resolve_output_port, _patch_output_ports, ["PortA", "PortB"], None),
+            (_resolve_output_port, _patch_output_ports, [], None),
+            (
+                _resolve_input_port,
+                _patch_input_ports,
+                ["OnlyInputPort"],
+                "OnlyInputPort",
+            ),
+            (_resolve_input_port, _patch_input_ports, ["InputA", "InputB"], None),
+            (_resolve_input_port, _patch_input_ports, [], None),
+        ],
+    )
+    def test_auto_select(self, monkeypatch, resolver, patch_ports, ports, expected):
+        """Only a single available port is auto-selected."""
+        patch_ports(monkeypatch, ports)
+        port, ok = resolver(None)
+        assert port == expected
         assert ok is True
 
 
@@ -177,6 +139,10 @@ class TestCreateParser:
         assert parser is not None
         assert parser.prog == "aldakit"
 
+    def test_parser_is_cached(self):
+        """Repeated calls return the same parser instance."""
+        assert create_parser() is create_parser()
+
     def test_has_version_argument(self):
         """Parser has --version argument."""
         parser = create_parser()
@@ -448,109 +414,53 @@ class TestReadSource:
 class TestStdinMode:
     """Tests for stdin_mode function."""
 
-    def test_handles_keyboard_interrupt(self, monkeypatch, capsys):
-        """Handle Ctrl+C gracefully."""
-        call_count = 0
-
-        class DummyBackend:
-            def __init__(self, port_name=None, virtual_port_name=None):
-                pass
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
+    @pytest.fixture(autouse=True)
+    def _stdin(self, monkeypatch):
+        """Install the dummy backend and an empty preloaded sys.stdin."""
+        DummyBackend.instances = []
+        monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+
+    @pytest.mark.parametrize("verbose", [True, False])
+    @pytest.mark.parametrize("port_name", [None, "X"])
+    def test_uses_backend_context(self, verbose, port_name):
+        """The backend is entered and exited around the read loop."""
+        result = stdin_mode(
+            port_name=port_name, verbose=verbose, virtual_port_name="AldakitMIDI"
+        )
+        assert result == 0
 
-            def play(self, sequence):
-                return None
+        (backend,) = DummyBackend.instances
+        assert backend.port_name == port_name
+        assert backend.entered and backend.exited
 
-            def is_playing(self):
-                return False
+    def test_handles_keyboard_interrupt(self, monkeypatch, capsys):
+        """Handle Ctrl+C gracefully."""
 
         def fake_input(prompt=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise KeyboardInterrupt
+            raise KeyboardInterrupt
 
-        monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
         monkeypatch.setattr(builtins, "input", fake_input)
 
         result = stdin_mode(port_name=None, verbose=False)
         assert result == 0
+        assert DummyBackend.instances[0].exited
 
     def test_plays_valid_input(self, monkeypatch, capsys):
         """Parse and play valid Alda input."""
-        input_calls = 0
-
-        class DummyBackend:
-            def __init__(self, port_name=None, virtual_port_name=None):
-                self.played = False
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-            def play(self, sequence):
-                self.played = True
-                return None
-
-            def is_playing(self):
-                return False
-
-        def fake_input(prompt=None):
-            nonlocal input_calls
-            input_calls += 1
-            if input_calls == 1:
-                return "piano: c d e"
-            elif input_calls == 2:
-                return ""  # First blank line
-            elif input_calls == 3:
-                return ""  # Second blank line triggers play
-            raise EOFError
-
-        monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        monkeypatch.setattr(builtins, "input", fake_input)
+        # Second blank line triggers play
+        monkeypatch.setattr("sys.stdin", io.StringIO("piano: c d e\n\n\n"))
 
         result = stdin_mode(port_name=None, verbose=False)
         assert result == 0
 
+        (backend,) = DummyBackend.instances
+        assert len(backend.played) == 1
+        assert len(backend.played[0].notes) == 3
+
     def test_handles_parse_error(self, monkeypatch, capsys):
         """Show parse error for invalid input."""
-        input_calls = 0
-
-        class DummyBackend:
-            def __init__(self, port_name=None, virtual_port_name=None):
-                pass
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-            def play(self, sequence):
-                return None
-
-            def is_playing(self):
-                return False
-
-        def fake_input(prompt=None):
-            nonlocal input_calls
-            input_calls += 1
-            if input_calls == 1:
-                return "piano: ((((invalid"
-            elif input_calls == 2:
-                return ""
-            elif input_calls == 3:
-                return ""
-            raise EOFError
-
-        monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        monkeypatch.setattr(builtins, "input", fake_input)
+        monkeypatch.setattr("sys.stdin", io.StringIO("piano: ((((invalid\n\n\n"))
 
         result = stdin_mode(port_name=None, verbose=False)
         assert result == 0
@@ -560,37 +470,7 @@ class TestStdinMode:
 
     def test_verbose_mode(self, monkeypatch, capsys):
         """Verbose mode prints note count."""
-        input_calls = 0
-
-        class DummyBackend:
-            def __init__(self, port_name=None, virtual_port_name=None):
-                pass
-
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-            def play(self, sequence):
-                return None
-
-            def is_playing(self):
-                return False
-
-        def fake_input(prompt=None):
-            nonlocal input_calls
-            input_calls += 1
-            if input_calls == 1:
-                return "piano: c d e"
-            elif input_calls == 2:
-                return ""
-            elif input_calls == 3:
-                return ""
-            raise EOFError
-
-        monkeypatch.setattr("aldakit.cli.LibremidiBackend", DummyBackend)
-        monkeypatch.setattr(builtins, "input", fake_input)
+        monkeypatch.setattr("sys.stdin", io.StringIO("piano: c d e\n\n\n"))
 
         result = stdin_mode(port_name=None, verbose=True)
         assert result == 0
@@ -1,5 +1,8 @@
 """Tests for the compose module."""
 
+import sys
+from unittest.mock import patch
+
 import pytest
 
 from aldakit import Score
@@ -99,14 +102,20 @@ class TestNote:
         ast = n.to_ast()
         assert ast.accidentals == ["+", "+"]
 
-    def test_note_to_alda(self):
-        assert note("c").to_alda() == "c"
-        assert note("c", duration=4).to_alda() == "c4"
-        assert note("c", accidental="+").to_alda() == "c+"
-        assert note("c", duration=4, dots=1).to_alda() == "c4."
-        assert note("c", ms=500).to_alda() == "c500ms"
-        assert note("c", seconds=2).to_alda() == "c2s"
-        assert note("c", slurred=True).to_alda() == "c~"
+    @pytest.mark.parametrize(
+        "element,expected",
+        [
+            (note("c"), "c"),
+            (note("c", duration=4), "c4"),
+            (note("c", accidental="+"), "c+"),
+            (note("c", duration=4, dots=1), "c4."),
+            (note("c", ms=500), "c500ms"),
+            (note("c", seconds=2), "c2s"),
+            (note("c", slurred=True), "c~"),
+        ],
+    )
+    def test_note_to_alda(self, element, expected):
+        assert element.to_alda() == expected
 
     def test_note_midi_pitch(self):
         assert note("c").midi_pitch == 60  # C4
@@ -153,6 +162,24 @@ class TestNote:
         slurred = n.slur()
         assert slurred.slurred is True
 
+    def test_identical_calls_share_instance(self):
+        assert note("c", duration=8) is note("c", duration=8)
+        assert note("c", duration=8) is not note("d", duration=8)
+
+    def test_cache_distinguishes_int_and_float(self):
+        assert type(note("c", duration=4.0).duration) is float
+        assert type(note("c", duration=4).duration) is int
+
+    def test_invalid_pitch_not_cached(self):
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                note("h")
+
+    def test_unhashable_arguments_bypass_cache(self):
+        n = note("c", duration=[4])
+        assert n.duration == [4]
+        assert note("c", duration=[4]) is not n
+
 
 class TestRest:
     """Test Rest class and rest() factory."""
@@ -174,10 +201,16 @@ class TestRest:
         ast = r.to_ast()
         assert isinstance(ast, RestNode)
 
-    def test_rest_to_alda(self):
-        assert rest().to_alda() == "r"
-        assert rest(duration=2).to_alda() == "r2"
-        assert rest(ms=1000).to_alda() == "r1000ms"
+    @pytest.mark.parametrize(
+        "element,expected",
+        [
+            (rest(), "r"),
+            (rest(duration=2), "r2"),
+            (rest(ms=1000), "r1000ms"),
+        ],
+    )
+    def test_rest_to_alda(self, element, expected):
+        assert element.to_alda() == expected
 
 
 class TestChord:
@@ -202,9 +235,15 @@ class TestChord:
         assert isinstance(ast, ChordNode)
         assert len(ast.notes) == 3
 
-    def test_chord_to_alda(self):
-        assert chord("c", "e", "g").to_alda() == "c/e/g"
-        assert chord("c", "e", "g", duration=1).to_alda() == "c1/e/g"
+    @pytest.mark.parametrize(
+        "element,expected",
+        [
+            (chord("c", "e", "g"), "c/e/g"),
+            (chord("c", "e", "g", duration=1), "c1/e/g"),
+        ],
+    )
+    def test_chord_to_alda(self, element, expected):
+        assert element.to_alda() == expected
 
 
 class TestSeq:
@@ -247,6 +286,12 @@ class TestSeq:
         ast = s.to_ast()
         assert isinstance(ast, EventSequenceNode)
 
+    def test_nested_seq_to_alda(self):
+        """Nested sequences flatten into one space-separated string."""
+        s = seq(note("c"), seq(note("d"), seq(note("e"))), Seq.from_alda("f  g"))
+        assert s.to_alda() == "c d e f  g"
+        assert Score.from_elements(part("piano"), s).to_alda() == "piano: c d e f  g"
+
 
 class TestRepeat:
     """Test Repeat class."""
@@ -296,10 +341,27 @@ class TestPart:
         assert isinstance(ast, PartDeclarationNode)
         assert ast.names == ["piano"]
 
-    def test_part_to_alda(self):
-        assert part("piano").to_alda() == "piano:"
-        assert part("violin", alias="v1").to_alda() == 'violin "v1":'
-        assert part("violin", "viola").to_alda() == "violin/viola:"
+    def test_part_names_interned(self):
+        """Runtime-built instrument names and aliases are interned."""
+        p = part("".join(["vio", "lin"]), alias="".join(["v", "1"]))
+        assert p.instruments[0] is sys.intern("violin")
+        assert p.alias is sys.intern("v1")
+
+    def test_non_str_part_names_not_interned(self):
+        """Non-str names are passed through rather than rejected by interning."""
+        p = part(None)
+        assert p.instruments == (None,)
+
+    @pytest.mark.parametrize(
+        "element,expected",
+        [
+            (part("piano"), "piano:"),
+            (part("violin", alias="v1"), 'violin "v1":'),
+            (part("violin", "viola"), "violin/viola:"),
+        ],
+    )
+    def test_part_to_alda(self, element, expected):
+        assert element.to_alda() == expected
 
 
 class TestTempo:
@@ -323,6 +385,10 @@ class TestTempo:
         assert tempo(120).to_alda() == "(tempo 120)"
         assert tempo(120, global_=True).to_alda() == "(tempo! 120)"
 
+    def test_identical_calls_share_instance(self):
+        assert tempo(120) is tempo(120)
+        assert tempo(120) is not tempo(120, global_=True)
+
 
 class TestVolume:
     """Test volume attribute."""
@@ -371,13 +437,19 @@ class TestOctave:
 class TestDynamics:
     """Test dynamic markings."""
 
-    def test_dynamics(self):
-        assert pp().to_alda() == "(pp)"
-        assert p().to_alda() == "(p)"
-        assert mp().to_alda() == "(mp)"
-        assert mf().to_alda() == "(mf)"
-        assert f().to_alda() == "(f)"
-        assert ff().to_alda() == "(ff)"
+    @pytest.mark.parametrize(
+        "factory,expected",
+        [
+            (pp, "(pp)"),
+            (p, "(p)"),
+            (mp, "(mp)"),
+            (mf, "(mf)"),
+            (f, "(f)"),
+            (ff, "(ff)"),
+        ],
+    )
+    def test_dynamics(self, factory, expected):
+        assert factory().to_alda() == expected
 
     def test_dynamics_to_ast(self):
         d = mf()
@@ -410,14 +482,18 @@ class TestScoreFromElements:
         assert len(score._elements) == 5
 
     def test_from_elements_ast(self):
-        score = Score.from_elements(part("piano"), note("c"), note("d"), note("e"))
+        score = Score.from_elements_cached(
+            part("piano"), note("c"), note("d"), note("e")
+        )
         ast = score.ast
         assert ast is not None
         # Should have part declaration + event sequence
         assert len(ast.children) >= 1
 
     def test_from_elements_midi(self):
-        score = Score.from_elements(part("piano"), note("c"), note("d"), note("e"))
+        score = Score.from_elements_cached(
+            part("piano"), note("c"), note("d"), note("e")
+        )
         midi = score.midi
         assert midi is not None
         assert len(midi.notes) == 3
@@ -433,6 +509,41 @@ class TestScoreFromElements:
         assert "c" in alda
         assert "d" in alda
 
+    def test_from_elements_cached_shares_live_score(self):
+        elements = (part("piano"), note("c"), note("d"))
+        score = Score.from_elements_cached(*elements)
+        assert Score.from_elements_cached(*elements) is score
+        assert Score.from_elements(*elements) is not score
+
+    def test_from_elements_cached_distinguishes_elements(self):
+        a = Score.from_elements_cached(part("piano"), note("c"))
+        b = Score.from_elements_cached(part("piano"), note("d"))
+        assert a is not b
+
+    def test_from_elements_cached_released_when_unused(self):
+        import gc
+        import weakref
+
+        ref = weakref.ref(Score.from_elements_cached(part("piano"), note("g")))
+        gc.collect()
+        assert ref() is None
+
+    def test_from_elements_cached_is_read_only(self):
+        score = Score.from_elements_cached(part("piano"), note("a"))
+        with pytest.raises(ValueError, match="from_elements_cached"):
+            score.add(note("b"))
+        with pytest.raises(ValueError):
+            score.with_tempo(90)
+        assert len(score._elements) == 2
+        assert Score.from_elements(part("piano"), note("a")).add(note("b"))
+
+    def test_from_elements_cached_unhashable_not_shared(self):
+        s = seq(note("c"), note("d"))
+        a = Score.from_elements_cached(part("piano"), s)
+        b = Score.from_elements_cached(part("piano"), s)
+        assert a is not b
+        assert len(a.midi.notes) == 2
+
     def test_from_parts(self):
         score = Score.from_parts(part("piano"), part("violin"))
         assert len(score._elements) == 2
@@ -442,6 +553,29 @@ class TestScoreFromElements:
         score.add(note("c"), note("d"), note("e"))
         assert len(score._elements) == 4
 
+    def test_add_in_loop_keeps_order(self):
+        score = Score.from_elements(part("piano"))
+        for letter in "cdefgab" * 20:
+            score.add(note(letter))
+        assert len(score._elements) == 141
+        assert score.to_alda().split()[1:8] == list("cdefgab")
+
+    def test_to_alda_cached_until_add(self):
+        score = Score.from_elements(part("piano"), note("c"))
+        first = score.to_alda()
+        assert score.to_alda() is first
+        score.add(note("d"))
+        assert score.to_alda() == "piano: c d"
+
+    def test_duration_cached_until_add(self, monkeypatch):
+        score = Score.from_elements(part("piano"), note("c"))
+        first = score.duration
+        monkeypatch.setattr(type(score.midi), "duration", lambda self: -1.0)
+        assert score.duration == first
+        monkeypatch.undo()
+        score.add(note("d"))
+        assert score.duration > first
+
     def test_add_returns_self(self):
         score = Score.from_elements(part("piano"))
         result = score.add(note("c"))
@@ -490,14 +624,13 @@ class TestScoreFromElements:
         content = output.read_text()
         assert "piano:" in content
 
+    @pytest.mark.slow
     def test_save_midi(self, tmp_path):
         score = Score.from_elements(part("piano"), note("c"))
         output = tmp_path / "test.mid"
         score.save(output)
-        assert output.exists()
         # MIDI files start with "MThd"
-        with open(output, "rb") as f:
-            assert f.read(4) == b"MThd"
+        assert output.read_bytes()[:4] == b"MThd"
 
     def test_part_generates_partnode_in_ast(self):
         """Regression: compose API must wrap parts in PartNode for MIDI generator."""
@@ -559,55 +692,151 @@ class TestScoreFromElements:
         assert "e" in alda
         assert "f" in alda
 
-
-class TestIntegration:
-    """Integration tests for compose -> MIDI pipeline."""
-
-    def test_simple_melody(self, tmp_path):
-        """Test a simple melody plays correctly."""
-        score = Score.from_elements(
+    def test_equal_element_scores_reuse_midi_render(self):
+        """Equal element scores reuse one render but get independent copies."""
+        a = Score.from_elements(part("piano"), note("c"), note("d", duration=8))
+        b = Score.from_elements(part("piano"), note("c"), note("d", duration=8))
+        assert a.midi == b.midi
+        assert a.midi is not b.midi
+        a.midi.notes[0].pitch = 0
+        a.midi.notes.clear()
+        assert [n.pitch for n in b.midi.notes] == [60, 62]
+
+    def test_render_copy_keeps_every_event_field(self):
+        """Copies are field-for-field equal but share no event objects."""
+        from aldakit.midi.types import (
+            MidiControlChange,
+            MidiNote,
+            MidiProgramChange,
+            MidiSequence,
+            MidiTempoChange,
+        )
+        from aldakit.score import _copy_sequence
+
+        sequence = MidiSequence(
+            notes=[MidiNote(60, 90, 0.5, 1.0, channel=3)],
+            program_changes=[MidiProgramChange(40, 0.0, channel=3)],
+            control_changes=[MidiControlChange(7, 100, 0.0, channel=3)],
+            tempo_changes=[MidiTempoChange(90.0, 0.0)],
+            ticks_per_beat=960,
+        )
+        copied = _copy_sequence(sequence)
+        assert copied == sequence
+        assert copied.notes[0] is not sequence.notes[0]
+        assert copied.tempo_changes[0] is not sequence.tempo_changes[0]
+
+    def test_render_type_error_not_retried(self):
+        """A TypeError from MIDI generation propagates without a second render."""
+        calls = []
+
+        def failing_generate(ast):
+            calls.append(ast)
+            raise TypeError("boom")
+
+        score = Score.from_elements(part("piano"), note("e", duration=3))
+        with patch("aldakit.score.generate_midi", failing_generate):
+            with pytest.raises(TypeError, match="boom"):
+                score.midi
+        assert len(calls) == 1
+
+    def test_different_element_scores_do_not_share_midi(self):
+        """Scores with different elements render separately."""
+        a = Score.from_elements(part("piano"), note("c"))
+        b = Score.from_elements(part("piano"), note("d"))
+        assert a.midi is not b.midi
+
+    def test_unhashable_elements_fall_back(self):
+        """Mutable elements such as Seq still render via the AST."""
+        score = Score.from_elements(part("piano"), seq(note("c"), note("d")))
+        assert len(score.midi.notes) == 2
+
+
+class TestSlots:
+    """Compose elements are slotted dataclasses."""
+
+    @pytest.mark.parametrize(
+        "element",
+        [
+            note("c"),
+            rest(),
+            chord("c", "e", "g"),
+            seq(note("c")),
+            Seq.from_alda("c d"),
             part("piano"),
             tempo(120),
-            note("c", duration=4),
-            note("d", duration=4),
-            note("e", duration=4),
-            note("f", duration=4),
-        )
+            volume(80),
+            octave(4),
+            mf(),
+        ],
+    )
+    def test_no_instance_dict(self, element):
+        assert not hasattr(element, "__dict__")
+
+
+@pytest.fixture(scope="module")
+def simple_melody_midi():
+    return Score.from_elements(
+        part("piano"),
+        tempo(120),
+        note("c", duration=4),
+        note("d", duration=4),
+        note("e", duration=4),
+        note("f", duration=4),
+    ).midi
+
+
+@pytest.fixture(scope="module")
+def chord_progression_midi():
+    return Score.from_elements(
+        part("piano"),
+        chord("c", "e", "g", duration=1),
+        chord("f", "a", "c", duration=1),
+    ).midi
+
+
+@pytest.fixture(scope="module")
+def attributes_midi():
+    return Score.from_elements(
+        part("piano"), tempo(60), volume(80), note("c", duration=4)
+    ).midi
+
+
+@pytest.fixture(scope="module")
+def repeated_sequence_midi():
+    return Score.from_elements(
+        part("piano"), seq(note("c", duration=8), note("d", duration=8)) * 4
+    ).midi
+
+
+@pytest.mark.slow
+class TestIntegration:
+    """Integration tests for compose -> MIDI pipeline.
 
-        midi = score.midi
-        assert len(midi.notes) == 4
+    Each score is rendered once per module; the tests only inspect the result.
+    """
 
-        # Verify pitches
-        pitches = [n.pitch for n in midi.notes]
+    def test_simple_melody_note_count(self, simple_melody_midi):
+        """A simple melody produces one MIDI note per note element."""
+        assert len(simple_melody_midi.notes) == 4
+
+    def test_simple_melody_pitches(self, simple_melody_midi):
+        """A simple melody keeps its pitches in order."""
+        pitches = [n.pitch for n in simple_melody_midi.notes]
         assert pitches == [60, 62, 64, 65]  # C, D, E, F
 
-    def test_chord_progression(self, tmp_path):
+    def test_chord_progression(self, chord_progression_midi):
         """Test chord generation."""
-        score = Score.from_elements(
-            part("piano"),
-            chord("c", "e", "g", duration=1),
-            chord("f", "a", "c", duration=1),
-        )
+        assert len(chord_progression_midi.notes) == 6  # 3 notes per chord * 2 chords
 
-        midi = score.midi
-        assert len(midi.notes) == 6  # 3 notes per chord * 2 chords
+    def test_with_attributes_note_count(self, attributes_midi):
+        """Attributes do not produce notes of their own."""
+        assert len(attributes_midi.notes) == 1
 
-    def test_with_attributes(self, tmp_path):
+    def test_with_attributes_tempo(self, attributes_midi):
         """Test that attributes affect MIDI generation."""
-        score = Score.from_elements(
-            part("piano"), tempo(60), volume(80), note("c", duration=4)
-        )
+        # At tempo 60, quarter note = 1 second (allow for quantization)
+        assert abs(attributes_midi.notes[0].duration - 1.0) < 0.2
 
-        midi = score.midi
-        assert len(midi.notes) == 1
-        # At tempo 60, quarter note = 1 second
-        assert abs(midi.notes[0].duration - 1.0) < 0.2  # Allow for quantization
-
-    def test_repeated_sequence(self, tmp_path):
+    def test_repeated_sequence(self, repeated_sequence_midi):
         """Test sequence repetition."""
-        score = Score.from_elements(
-            part("piano"), seq(note("c", duration=8), note("d", duration=8)) * 4
-        )
-
-        midi = score.midi
-        assert len(midi.notes) == 8  # 2 notes * 4 repetitions
+        assert len(repeated_sequence_midi.notes) == 8  # 2 notes * 4 repetitions
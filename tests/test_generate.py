@@ -149,6 +149,14 @@ class TestRandomWalk:
         for n in result.elements:
             assert 48 <= n.midi_pitch <= 72
 
+    def test_random_walk_spells_steps_as_sharps(self):
+        """Chromatic steps spell black keys as sharps and keep their pitch."""
+        result = random_walk("c", 30, intervals=[1], max_pitch=127, seed=42)
+        assert [n.midi_pitch for n in result.elements] == list(range(60, 90))
+        assert {n.accidental for n in result.elements} <= {None, "+"}
+        assert result.elements[1].pitch == "c"
+        assert result.elements[1].accidental == "+"
+
     def test_random_walk_custom_intervals(self):
         """Custom intervals are used."""
         result = random_walk("c", 10, intervals=[1, 2], seed=42)
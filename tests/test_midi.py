@@ -1,13 +1,25 @@
 """Tests for MIDI generation."""
 
+import pickle
+
+import pytest
+
 from aldakit import parse, generate_midi
+from aldakit.ast_nodes import NoteNode, RootNode
 from aldakit.midi import (
+    MidiControlChange,
     MidiSequence,
     MidiTempoChange,
     note_to_midi,
     INSTRUMENT_PROGRAMS,
 )
-from aldakit.midi.smf import TempoMap
+from aldakit.midi.smf import (
+    TempoMap,
+    _encode_track_events,
+    _write_variable_length,
+    write_midi_file,
+)
+from aldakit.midi.smf_reader import _read_variable_length, read_midi_file
 
 
 class TestNoteToMidi:
@@ -27,6 +39,18 @@ class TestNoteToMidi:
     def test_b_flat(self):
         assert note_to_midi("b", 4, ["-"]) == 70
 
+    def test_mixed_accidentals(self):
+        assert note_to_midi("c", 4, ["+", "+"]) == 62
+        assert note_to_midi("c", 4, ["+", "-"]) == 60
+        assert note_to_midi("e", 4, ["_"]) == 64
+
+    def test_uppercase_letter(self):
+        assert note_to_midi("C", 4, []) == 60
+
+    def test_clamped_to_midi_range(self):
+        assert note_to_midi("c", -1, ["-"]) == 0
+        assert note_to_midi("b", 9, ["+"]) == 127
+
     def test_double_sharp(self):
         assert note_to_midi("c", 4, ["+", "+"]) == 62
 
@@ -83,6 +107,15 @@ class TestMidiGenerator:
         # D should start later than C's end
         assert seq.notes[1].start_time > seq.notes[0].start_time + seq.notes[0].duration
 
+    def test_node_subclass_uses_base_handler(self):
+        """Subclassed AST nodes dispatch to their base node's handler."""
+
+        class AccentedNoteNode(NoteNode):
+            pass
+
+        seq = generate_midi(RootNode(children=[AccentedNoteNode(letter="d")]))
+        assert [n.pitch for n in seq.notes] == [62]
+
 
 class TestDurations:
     """Test duration calculations."""
@@ -272,6 +305,16 @@ class TestSequenceProperties:
         seq = MidiSequence()
         assert seq.duration() == 0.0
 
+    def test_sequence_and_events_use_slots(self):
+        seq = generate_midi(parse("piano: c d (tempo 90) e"))
+        events = [seq, seq.notes[0], seq.program_changes[0], seq.tempo_changes[0]]
+        for event in events:
+            assert not hasattr(event, "__dict__")
+
+    def test_notes_pickle(self):
+        seq = generate_midi(parse("c4 e g"))
+        assert pickle.loads(pickle.dumps(seq)) == seq
+
 
 class TestInstrumentMapping:
     """Test instrument name to MIDI program mapping."""
@@ -283,6 +326,18 @@ class TestInstrumentMapping:
         assert INSTRUMENT_PROGRAMS["trumpet"] == 56
         assert INSTRUMENT_PROGRAMS["cello"] == 42
 
+    def test_part_program_from_name(self):
+        seq = generate_midi(parse("violin: c"))
+        assert seq.program_changes[0].program == 40
+
+    def test_part_program_normalizes_name(self):
+        seq = generate_midi(parse("French_Horn: c"))
+        assert seq.program_changes[0].program == INSTRUMENT_PROGRAMS["french-horn"]
+
+    def test_part_program_unknown_defaults_to_piano(self):
+        seq = generate_midi(parse("kazoo-of-doom: c"))
+        assert seq.program_changes[0].program == 0
+
 
 class TestVariableSemantics:
     """Test variable definition semantics."""
@@ -368,6 +423,63 @@ class TestTempoMap:
         assert tempo_map.seconds_to_ticks(2.0) == 1440
         assert tempo_map.seconds_to_ticks(3.0) == 3360
 
+    def test_first_tempo_change_after_start(self):
+        """Time before the first tempo change runs at the default 120 BPM."""
+        seq = MidiSequence(
+            tempo_changes=[MidiTempoChange(bpm=60.0, time=1.0)],
+            ticks_per_beat=480,
+        )
+        tempo_map = TempoMap(seq)
+        assert tempo_map.seconds_to_ticks(0.5) == 480
+        assert tempo_map.seconds_to_ticks(1.0) == 960
+        assert tempo_map.seconds_to_ticks(2.0) == 1440
+
+    def test_simultaneous_tempo_changes_last_wins(self):
+        """Of several tempo changes at one time, the last applies."""
+        seq = MidiSequence(
+            tempo_changes=[
+                MidiTempoChange(bpm=120.0, time=0.0),
+                MidiTempoChange(bpm=240.0, time=1.0),
+                MidiTempoChange(bpm=60.0, time=1.0),
+            ],
+            ticks_per_beat=480,
+        )
+        tempo_map = TempoMap(seq)
+        assert tempo_map.seconds_to_ticks(1.0) == 960
+        assert tempo_map.seconds_to_ticks(2.0) == 1440
+
+    def test_many_tempo_changes(self):
+        """Lookups stay exact across many tempo segments."""
+        seq = MidiSequence(
+            tempo_changes=[
+                MidiTempoChange(bpm=60.0 if i % 2 else 120.0, time=float(i))
+                for i in range(100)
+            ],
+            ticks_per_beat=480,
+        )
+        tempo_map = TempoMap(seq)
+        # Alternating 960 and 480 ticks per second
+        assert tempo_map.seconds_to_ticks(50.0) == 25 * 960 + 25 * 480
+        assert tempo_map.seconds_to_ticks(50.5) == 25 * 960 + 25 * 480 + 480
+
+    def test_equal_tempo_layouts_share_points(self):
+        """Sequences with the same tempo changes reuse one precomputation."""
+
+        def make(ticks_per_beat):
+            return MidiSequence(
+                tempo_changes=[
+                    MidiTempoChange(bpm=90.0, time=0.0),
+                    MidiTempoChange(bpm=150.0, time=2.0),
+                ],
+                ticks_per_beat=ticks_per_beat,
+            )
+
+        first, second = TempoMap(make(480)), TempoMap(make(480))
+        assert first._tempo_points is second._tempo_points
+        other = TempoMap(make(96))
+        assert other._tempo_points is not first._tempo_points
+        assert other.seconds_to_ticks(3.0) == 288 + 240
+
 
 class TestKeySignature:
     """Test key signature application."""
@@ -603,3 +715,88 @@ class TestTranspose:
         pitches = [n.pitch for n in seq.notes]
         # First motif: C D E, second motif: F G A
         assert pitches == [60, 62, 64, 65, 67, 69]
+
+
+class TestWriteMidiFile:
+    """Test the Standard MIDI File writer."""
+
+    def test_one_track_per_channel_plus_tempo(self, tmp_path):
+        """The header count matches the MTrk chunks streamed to disk."""
+        seq = generate_midi(parse("piano: c d violin: e f cello: g"))
+        path = tmp_path / "parts.mid"
+        write_midi_file(seq, path)
+
+        data = path.read_bytes()
+        assert data[:4] == b"MThd"
+        assert int.from_bytes(data[10:12], "big") == 4
+        assert data.count(b"MTrk") == 4
+
+    def test_round_trip_notes(self, tmp_path):
+        """Notes survive a write/read round trip."""
+        seq = generate_midi(parse("piano: c d e violin: g"))
+        path = tmp_path / "round.mid"
+        write_midi_file(seq, path)
+
+        pitches = sorted(n.pitch for n in read_midi_file(path).notes)
+        assert pitches == [60, 62, 64, 67]
+
+    def test_long_delta_round_trip(self, tmp_path):
+        """Deltas needing multi-byte variable-length encoding survive."""
+        seq = generate_midi(parse("piano: (tempo 30) c1 r1 r1 r1 d1"))
+        path = tmp_path / "long.mid"
+        write_midi_file(seq, path)
+
+        notes = sorted(read_midi_file(path).notes, key=lambda n: n.start_time)
+        assert [n.pitch for n in notes] == [60, 62]
+        assert abs(notes[1].start_time - seq.notes[1].start_time) < 0.01
+
+    def test_program_and_control_changes_stay_on_their_channel(self, tmp_path):
+        """Each track carries only its own channel's program and controls."""
+        seq = generate_midi(parse("piano: c violin: e cello: g"))
+        seq.control_changes = [
+            MidiControlChange(control=7, value=50, time=0.0, channel=1),
+            MidiControlChange(control=10, value=20, time=0.0, channel=2),
+            MidiControlChange(control=7, value=90, time=0.0, channel=0),
+        ]
+        path = tmp_path / "programs.mid"
+        write_midi_file(seq, path)
+
+        result = read_midi_file(path)
+        assert {(pc.channel, pc.program) for pc in result.program_changes} == {
+            (pc.channel, pc.program) for pc in seq.program_changes
+        }
+        assert sorted(
+            (cc.channel, cc.control, cc.value) for cc in result.control_changes
+        ) == sorted((cc.channel, cc.control, cc.value) for cc in seq.control_changes)
+
+
+class TestVariableLength:
+    """Test MIDI variable-length quantity encoding."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (0, b"\x00"),
+            (0x7F, b"\x7f"),
+            (0x80, b"\x81\x00"),
+            (0x3FFF, b"\xff\x7f"),
+            (0x4000, b"\x81\x80\x00"),
+            (0x0FFFFFFF, b"\xff\xff\xff\x7f"),
+        ],
+    )
+    def test_encoding(self, value, expected):
+        assert _write_variable_length(value) == expected
+
+    def test_round_trip_through_reader(self):
+        values = [1, 0x81, 0x2000, 0x3FFF, 0x4001, 0x1FFFFF, 0x200000, 0x0FFFFFFF]
+        for value in values:
+            encoded = _write_variable_length(value)
+            assert _read_variable_length(encoded, 0) == (value, len(encoded))
+
+    def test_negative_rejected(self):
+        with pytest.raises(ValueError):
+            _write_variable_length(-1)
+
+    def test_track_events_use_variable_length_deltas(self):
+        data = _encode_track_events([(0, b"\x90\x3c\x40"), (200, b"\x80\x3c\x00")])
+        assert data == b"\x00\x90\x3c\x40\x81\x48\x80\x3c\x00"
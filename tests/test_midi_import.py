@@ -2,12 +2,18 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
 from aldakit import Score
-from aldakit.ast_nodes import EventSequenceNode, LispListNode
+from aldakit.ast_nodes import (
+    ChordNode,
+    EventSequenceNode,
+    LispListNode,
+    PartDeclarationNode,
+    RestNode,
+)
 from aldakit.midi.smf_reader import read_midi_file, MidiParseError
 from aldakit.midi.midi_to_ast import (
     midi_pitch_to_note,
@@ -17,7 +23,12 @@ from aldakit.midi.midi_to_ast import (
     quantize_to_grid,
     midi_to_ast,
 )
-from aldakit.midi.types import MidiSequence, MidiNote, MidiTempoChange
+from aldakit.midi.types import (
+    MidiNote,
+    MidiProgramChange,
+    MidiSequence,
+    MidiTempoChange,
+)
 
 
 # =============================================================================
@@ -49,6 +60,13 @@ class TestMidiPitchToNote:
         assert octave == 4
         assert accidentals == ["+"]
 
+    def test_accidental_lists_not_shared(self):
+        """Each call returns its own accidentals list."""
+        first = midi_pitch_to_note(61)[2]
+        first.append("+")
+        assert midi_pitch_to_note(61)[2] == ["+"]
+        assert midi_pitch_to_note(60)[2] is not midi_pitch_to_note(60)[2]
+
     def test_low_c(self):
         """MIDI 24 is C1."""
         letter, octave, accidentals = midi_pitch_to_note(24)
@@ -63,6 +81,16 @@ class TestMidiPitchToNote:
         assert octave == 6
         assert accidentals == []
 
+    def test_extremes(self):
+        """MIDI 0 is C-1 and MIDI 127 is G9."""
+        assert midi_pitch_to_note(0) == ("c", -1, [])
+        assert midi_pitch_to_note(127) == ("g", 9, [])
+
+    def test_out_of_range_computed(self):
+        """Pitches outside 0-127 still convert arithmetically."""
+        assert midi_pitch_to_note(-1) == ("b", -2, [])
+        assert midi_pitch_to_note(132) == ("c", 10, [])
+
 
 # =============================================================================
 # Timing Conversion Tests
@@ -133,6 +161,28 @@ class TestBeatsToDuration:
         assert duration == 20
         assert dots == 0
 
+    def test_plain_value_preferred_over_equal_dotted(self):
+        """0.5 beats is a plain eighth, not a dotted triplet eighth."""
+        assert beats_to_duration(0.5) == (8, 0)
+
+    def test_closest_match_between_values(self):
+        """Lengths between table entries snap to the nearest one."""
+        assert beats_to_duration(0.9) == (4, 0)
+        assert beats_to_duration(1.4) == (4, 1)
+
+    def test_non_positive_defaults_to_quarter(self):
+        assert beats_to_duration(0.0) == (4, 0)
+        assert beats_to_duration(-1.0) == (4, 0)
+
+    def test_repeated_lengths_hit_cache(self):
+        """Each distinct beat length is matched only once."""
+        from aldakit.midi.midi_to_ast import _closest_duration
+
+        beats_to_duration(0.75)
+        hits = _closest_duration.cache_info().hits
+        assert beats_to_duration(0.75) == (8, 1)
+        assert _closest_duration.cache_info().hits == hits + 1
+
 
 class TestDurationValueToBeats:
     """Tests for duration_value_to_beats helper."""
@@ -250,6 +300,41 @@ class TestMidiToAst:
             for node in tempo_nodes
         )
 
+    def test_equal_durations_share_a_node(self):
+        """Notes of equal length within a part share one DurationNode."""
+        seq = MidiSequence(
+            notes=[
+                MidiNote(pitch=60 + i, velocity=100, start_time=i * 0.5, duration=0.5)
+                for i in range(4)
+            ]
+        )
+        events = midi_to_ast(seq).children[1].events
+        durations = {id(node.duration) for node in events}
+        assert len(durations) == 1
+        assert events[0].duration.components[0].denominator == 4
+
+    def test_tempo_changes_merge_in_time_order(self):
+        """Tempo changes land before the first note at or after them."""
+        seq = MidiSequence(
+            notes=[
+                MidiNote(pitch=60, velocity=100, start_time=t, duration=0.5)
+                for t in (0.0, 0.5, 2.0)
+            ],
+            tempo_changes=[
+                MidiTempoChange(bpm=120.0, time=0.0),
+                MidiTempoChange(bpm=100.0, time=1.0),
+                MidiTempoChange(bpm=80.0, time=1.5),
+                MidiTempoChange(bpm=70.0, time=5.0),
+            ],
+        )
+        events = midi_to_ast(seq).children[1].events
+        layout = [
+            node.elements[1].value if isinstance(node, LispListNode) else "n"
+            for node in events
+            if not isinstance(node, RestNode)
+        ]
+        assert layout == ["n", "n", 100, 80, "n", 70]
+
     def test_multiple_channels(self):
         """Multiple channels become separate parts."""
         seq = MidiSequence(
@@ -266,6 +351,41 @@ class TestMidiToAst:
         assert ast is not None
         # Should have two part declarations
 
+    def test_chord_and_dotted_durations(self):
+        """Chord durations sit on the first note; gaps become rests."""
+        seq = MidiSequence(
+            notes=[
+                MidiNote(pitch=60, velocity=100, start_time=0.0, duration=0.75),
+                MidiNote(pitch=64, velocity=100, start_time=0.0, duration=0.75),
+                MidiNote(pitch=67, velocity=100, start_time=1.0, duration=0.25),
+            ]
+        )
+        events = midi_to_ast(seq).children[1].events
+        chord, rest, note = events
+        assert isinstance(chord, ChordNode)
+        first, second = chord.notes
+        assert first.duration.components[0].denominator == 4
+        assert first.duration.components[0].dots == 1
+        assert second.duration is None
+        assert isinstance(rest, RestNode)
+        assert rest.duration.components[0].denominator == 8
+        assert note.letter == "g"
+        assert note.duration.components[0].denominator == 8
+
+    @pytest.mark.parametrize(
+        "program,expected",
+        [(0, "piano"), (40, "violin"), (73, "flute"), (127, "piano")],
+    )
+    def test_program_names_part(self, program, expected):
+        """Program changes choose the part's instrument name."""
+        seq = MidiSequence(
+            notes=[MidiNote(pitch=60, velocity=100, start_time=0.0, duration=0.5)],
+            program_changes=[MidiProgramChange(program=program, time=0.0)],
+        )
+        part = midi_to_ast(seq).children[0]
+        assert isinstance(part, PartDeclarationNode)
+        assert part.names == [expected]
+
 
 # =============================================================================
 # MIDI File Reader Tests
@@ -296,6 +416,36 @@ class TestMidiFileReader:
             with pytest.raises(MidiParseError):
                 read_midi_file(f.name)
 
+    def test_running_status_and_long_delta(self, tmp_path):
+        """Running-status events and multi-byte deltas are decoded."""
+        track = (
+            b"\x00\x90\x3c\x40"  # note on C4
+            b"\x83\x60\x3c\x00"  # 480 ticks later, running status: C4 off
+            b"\x00\x3e\x40"  # running status: note on D4
+            b"\x81\x70\x3e\x00"  # 240 ticks later: D4 off
+            b"\x00\xff\x2f\x00"  # end of track
+        )
+        path = tmp_path / "running.mid"
+        path.write_bytes(
+            b"MThd\x00\x00\x00\x06\x00\x00\x00\x01\x01\xe0"
+            + b"MTrk"
+            + len(track).to_bytes(4, "big")
+            + track
+        )
+
+        notes = read_midi_file(path).notes
+        assert [(n.pitch, n.start_time, n.duration) for n in notes] == [
+            (60, 0.0, 0.5),
+            (62, 0.5, 0.25),
+        ]
+
+    def test_truncated_track_rejected(self, tmp_path):
+        """A file declaring more tracks than it holds raises MidiParseError."""
+        path = tmp_path / "short.mid"
+        path.write_bytes(b"MThd\x00\x00\x00\x06\x00\x01\x00\x02\x01\xe0")
+        with pytest.raises(MidiParseError):
+            read_midi_file(path)
+
 
 # =============================================================================
 # Score MIDI Import Integration Tests
@@ -367,15 +517,15 @@ class TestScoreMidiImport:
         assert "from_midi_file" in repr_str
         assert "test.mid" in repr_str
 
-    def test_play_imported_midi(self, tmp_path):
+    def test_play_imported_midi(self, tmp_path, monkeypatch):
         """Imported MIDI can be played."""
         midi_path = tmp_path / "test.mid"
         self._create_test_midi(midi_path)
+        monkeypatch.setattr("aldakit.score._SHARED_BACKENDS", {})
 
         # Mock the backend to avoid actual MIDI playback
         with patch("aldakit.score.LibremidiBackend") as mock_backend:
-            mock_instance = MagicMock()
-            mock_backend.return_value.__enter__.return_value = mock_instance
+            mock_instance = mock_backend.return_value
             mock_instance.is_playing.return_value = False
 
             score = Score.from_midi_file(midi_path)
@@ -1,5 +1,7 @@
 """Tests for MIDI transcription functionality."""
 
+import time
+
 import pytest
 
 from aldakit.midi.transcriber import (
@@ -34,6 +36,17 @@ class TestTranscribeSession:
         seq = session._notes_to_seq()
         assert len(seq.elements) == 0
 
+    def test_notes_to_seq_empty_keeps_metadata(self):
+        """An empty transcription still records the feel it was taken with."""
+        session = TranscribeSession(feel="swing", swing_ratio=0.6)
+        seq = session._notes_to_seq()
+        assert seq.elements == []
+        assert seq.metadata == {
+            "feel": "swing",
+            "quantize_grid": 0.25,
+            "swing_ratio": 0.6,
+        }
+
     def test_notes_to_seq_single_note(self):
         """Single note converts correctly."""
         session = TranscribeSession(default_tempo=120.0)
@@ -79,6 +92,21 @@ class TestTranscribeSession:
         assert isinstance(seq.elements[1], Rest)
         assert isinstance(seq.elements[2], Note)
 
+    def test_notes_to_seq_sub_grid_gap_no_rest(self):
+        """Gaps shorter than half a grid step do not insert a rest."""
+        session = TranscribeSession(default_tempo=120.0, quantize_grid=0.25)
+        session._recorded_notes = [
+            RecordedNote(pitch=60, velocity=100, start_time=0.0, duration=0.5),
+            # 0.06 s = 0.12 beats, under half a sixteenth
+            RecordedNote(pitch=62, velocity=100, start_time=0.56, duration=0.5),
+            # 0.1 s = 0.2 beats, rounds to a sixteenth rest
+            RecordedNote(pitch=64, velocity=100, start_time=1.16, duration=0.5),
+        ]
+        seq = session._notes_to_seq()
+        kinds = [type(e) for e in seq.elements]
+        assert kinds == [Note, Note, Rest, Note]
+        assert seq.elements[2].duration == 16
+
     def test_notes_to_seq_accidentals(self):
         """Sharps are correctly detected."""
         session = TranscribeSession(default_tempo=120.0)
@@ -214,21 +242,45 @@ class TestTranscribeSession:
         assert isinstance(seq.elements[0], Cram)
         assert all(isinstance(elem, Chord) for elem in seq.elements[0].elements)
 
+    def test_tied_chord_segments(self):
+        """A long chord splits into tied chords whose members carry the slur."""
+        session = TranscribeSession(default_tempo=120.0)
+        session._recorded_notes = [
+            RecordedNote(pitch=60, velocity=100, start_time=0.0, duration=1.25),
+            RecordedNote(pitch=64, velocity=100, start_time=0.0, duration=1.25),
+        ]
+        seq = session._notes_to_seq()
+        first, second = seq.elements
+        assert (first.duration, second.duration) == (2, 8)
+        assert all(n.slurred for n in first.notes)
+        assert not any(n.slurred for n in second.notes)
+        assert [n.pitch for n in second.notes] == ["c", "e"]
+
+    def test_chord_uses_longest_note_duration(self):
+        """A chord lasts as long as its longest note."""
+        session = TranscribeSession(default_tempo=120.0)
+        session._recorded_notes = [
+            RecordedNote(pitch=60, velocity=100, start_time=0.0, duration=0.25),
+            RecordedNote(pitch=64, velocity=100, start_time=0.0, duration=0.5),
+        ]
+        seq = session._notes_to_seq()
+        assert isinstance(seq.elements[0], Chord)
+        assert seq.elements[0].duration == 4
+
     def test_note_on_off_tracking(self):
         """Note on/off events are tracked correctly."""
         session = TranscribeSession()
         session._running = True
-        session._start_time = 0.0
+        session._start_ns = 0
 
         # Note on
         session._note_on(60, 100, 0.0)
-        assert 60 in session._pending_notes
         assert session._pending_notes[60].pitch == 60
         assert session._pending_notes[60].velocity == 100
 
         # Note off
         session._note_off(60, 0.5)
-        assert 60 not in session._pending_notes
+        assert session._pending_notes[60] is None
         assert len(session._recorded_notes) == 1
         assert session._recorded_notes[0].pitch == 60
         assert session._recorded_notes[0].duration == 0.5
@@ -285,6 +337,13 @@ class TestRecordedNote:
         assert note.start_time == 0.5
         assert note.duration == 1.0
 
+    def test_slotted(self):
+        """Note records use slots rather than a per-instance __dict__."""
+        note = RecordedNote(pitch=60, velocity=100, start_time=0.5, duration=1.0)
+        pending = PendingNote(pitch=60, velocity=100, start_time=0.5)
+        assert not hasattr(note, "__dict__")
+        assert not hasattr(pending, "__dict__")
+
 
 # =============================================================================
 # MidiIn Binding Tests
@@ -317,6 +376,15 @@ class TestMidiInBindings:
         assert isinstance(messages, list)
         assert len(messages) == 0
 
+    def test_midi_in_poll_into_replaces_contents(self):
+        """poll_into empties the given list when no messages are queued."""
+        from aldakit._libremidi import MidiIn
+
+        midi_in = MidiIn()
+        buffer = ["stale"]
+        assert midi_in.poll_into(buffer) == 0
+        assert buffer == []
+
     def test_midi_in_has_messages(self):
         """has_messages returns False when empty."""
         from aldakit._libremidi import MidiIn
@@ -324,6 +392,13 @@ class TestMidiInBindings:
         midi_in = MidiIn()
         assert not midi_in.has_messages()
 
+    def test_midi_in_wait_for_messages_times_out(self):
+        """wait_for_messages returns False when nothing arrives."""
+        from aldakit._libremidi import MidiIn
+
+        midi_in = MidiIn()
+        assert midi_in.wait_for_messages(0.01) is False
+
     def test_midi_in_is_port_open(self):
         """is_port_open returns False before opening."""
         from aldakit._libremidi import MidiIn
@@ -363,7 +438,6 @@ class TestTranscribeSessionProcessMessage:
 
         session = TranscribeSession()
         session._running = True
-        session._pending_notes = {}
         session._recorded_notes = []
 
         # Single byte message
@@ -371,7 +445,7 @@ class TestTranscribeSessionProcessMessage:
         session._process_message(msg, 0.0)
 
         # No notes should be recorded
-        assert len(session._pending_notes) == 0
+        assert not any(session._pending_notes)
         assert len(session._recorded_notes) == 0
 
     def test_process_note_on_with_velocity_zero(self):
@@ -383,21 +457,37 @@ class TestTranscribeSessionProcessMessage:
 
         session = TranscribeSession()
         session._running = True
-        session._pending_notes = {}
         session._recorded_notes = []
 
         # First send Note On
         note_on = MockMessage([0x90, 60, 100])  # Note On, C4, velocity 100
         session._process_message(note_on, 0.0)
-        assert 60 in session._pending_notes
+        assert session._pending_notes[60] is not None
 
         # Then send Note On with velocity 0 (= Note Off)
         note_off = MockMessage([0x90, 60, 0])  # Note On, C4, velocity 0
         session._process_message(note_off, 0.5)
 
-        assert 60 not in session._pending_notes
+        assert session._pending_notes[60] is None
         assert len(session._recorded_notes) == 1
 
+    def test_out_of_range_pitch_ignored(self):
+        """A malformed data byte above 127 is skipped instead of raising."""
+
+        class MockMessage:
+            def __init__(self, bytes_):
+                self.bytes = bytes_
+
+        session = TranscribeSession()
+        session._running = True
+        session._recorded_notes = []
+
+        session._process_message(MockMessage([0x90, 200, 100]), 0.0)
+        session._process_message(MockMessage([0x80, 200, 0]), 0.5)
+
+        assert not any(session._pending_notes)
+        assert session._recorded_notes == []
+
     def test_process_note_off_message(self):
         """Note Off messages (0x80) are processed correctly."""
 
@@ -407,7 +497,6 @@ class TestTranscribeSessionProcessMessage:
 
         session = TranscribeSession()
         session._running = True
-        session._pending_notes = {}
         session._recorded_notes = []
 
         # First send Note On
@@ -418,10 +507,43 @@ class TestTranscribeSessionProcessMessage:
         note_off = MockMessage([0x80, 60, 0])
         session._process_message(note_off, 0.5)
 
-        assert 60 not in session._pending_notes
+        assert session._pending_notes[60] is None
         assert len(session._recorded_notes) == 1
         assert session._recorded_notes[0].duration == 0.5
 
+    def test_process_messages_on_any_channel(self):
+        """Note messages are handled regardless of MIDI channel."""
+
+        class MockMessage:
+            def __init__(self, bytes_):
+                self.bytes = bytes_
+
+        session = TranscribeSession()
+        session._running = True
+
+        session._process_message(MockMessage([0x9F, 60, 100]), 0.0)
+        assert session._pending_notes[60] is not None
+
+        session._process_message(MockMessage([0x85, 60, 0]), 0.5)
+        assert session._pending_notes[60] is None
+        assert len(session._recorded_notes) == 1
+
+    def test_process_ignores_non_note_messages(self):
+        """Control change and other messages are ignored."""
+
+        class MockMessage:
+            def __init__(self, bytes_):
+                self.bytes = bytes_
+
+        session = TranscribeSession()
+        session._running = True
+
+        session._process_message(MockMessage([0xB0, 64, 127]), 0.0)
+        session._process_message(MockMessage([0xC0, 5]), 0.0)
+
+        assert not any(session._pending_notes)
+        assert session._recorded_notes == []
+
     def test_process_note_on_replaces_pending(self):
         """New Note On at same pitch ends previous note."""
 
@@ -431,7 +553,6 @@ class TestTranscribeSessionProcessMessage:
 
         session = TranscribeSession()
         session._running = True
-        session._pending_notes = {}
         session._recorded_notes = []
 
         # First Note On
@@ -445,7 +566,144 @@ class TestTranscribeSessionProcessMessage:
         # Should have ended first note and started new one
         assert len(session._recorded_notes) == 1
         assert session._recorded_notes[0].duration == pytest.approx(0.3, abs=0.01)
-        assert 60 in session._pending_notes
+        assert session._pending_notes[60] is not None
+
+
+class _FakeMidiIn:
+    """MidiIn stand-in that delivers a fixed batch of messages once."""
+
+    def __init__(self, messages):
+        self._messages = list(messages)
+        self.wait_timeouts = []
+
+    def wait_for_messages(self, timeout):
+        self.wait_timeouts.append(timeout)
+        return bool(self._messages)
+
+    def poll(self):
+        messages, self._messages = self._messages, []
+        return messages
+
+    def poll_into(self, out):
+        out[:] = self.poll()
+        return len(out)
+
+
+class TestTranscribeSessionWait:
+    """Tests for the blocking wait() ingestion path."""
+
+    def test_wait_processes_arriving_messages(self):
+        """wait() processes messages as soon as they are available."""
+
+        class MockMessage:
+            def __init__(self, bytes_):
+                self.bytes = bytes_
+                self.timestamp = 0
+
+        session = TranscribeSession()
+        session._running = True
+        session._midi_in = _FakeMidiIn([MockMessage([0x90, 60, 100])])
+
+        assert session.wait(1.0) is True
+        assert session._pending_notes[60] is not None
+        assert session._midi_in.wait_timeouts == [1.0]
+
+    def test_wait_times_out_without_messages(self):
+        """wait() returns False when no input arrives."""
+        session = TranscribeSession()
+        session._running = True
+        session._midi_in = _FakeMidiIn([])
+
+        assert session.wait(0.01) is False
+
+    def test_poll_reuses_buffer(self):
+        """Polling refills one session-owned list."""
+
+        class MockMessage:
+            def __init__(self, bytes_):
+                self.bytes = bytes_
+                self.timestamp = 0
+
+        session = TranscribeSession()
+        session._running = True
+        buffer = session._poll_buffer
+        session._midi_in = _FakeMidiIn([MockMessage([0x90, 62, 90])])
+        session.poll()
+        session.poll()
+        assert session._poll_buffer is buffer
+        assert buffer == []
+        assert session._pending_notes[62] is not None
+
+    def test_wait_when_not_running(self):
+        """wait() is a no-op when the session is not running."""
+        session = TranscribeSession()
+        assert session.wait(0.01) is False
+
+
+class TestTranscribeSessionTimestamps:
+    """Tests for per-message timestamps in poll()."""
+
+    class TimedMessage:
+        def __init__(self, bytes_, timestamp):
+            self.bytes = bytes_
+            self.timestamp = timestamp
+
+    def _session(self, messages, start_ns=1_000_000_000):
+        session = TranscribeSession()
+        session._running = True
+        # received_time becomes "now", well after the events
+        session._start_ns = time.monotonic_ns() - 5_000_000_000
+        session._start_timestamp_ns = start_ns
+        session._midi_in = _FakeMidiIn(messages)
+        return session
+
+    def test_batched_messages_keep_their_own_times(self):
+        """Messages drained in one poll use their individual timestamps."""
+        start = 1_000_000_000
+        session = self._session(
+            [
+                self.TimedMessage([0x90, 60, 100], start + 100_000_000),
+                self.TimedMessage([0x90, 64, 100], start + 125_000_000),
+                self.TimedMessage([0x80, 60, 0], start + 600_000_000),
+            ],
+            start_ns=start,
+        )
+
+        session.poll()
+
+        assert session._pending_notes[64].start_time == pytest.approx(0.125)
+        recorded = session._recorded_notes[0]
+        assert recorded.start_time == pytest.approx(0.1)
+        assert recorded.duration == pytest.approx(0.5)
+
+    def test_receive_time_uses_monotonic_clock(self, monkeypatch):
+        """Receive times come from time.monotonic_ns, not the wall clock."""
+        session = self._session([self.TimedMessage([0x90, 60, 100], 0)])
+        session._start_ns = 10_000_000_000
+        monkeypatch.setattr(time, "monotonic_ns", lambda: 12_500_000_000)
+        monkeypatch.setattr(time, "time", lambda: 0.0)
+
+        session.poll()
+
+        assert session._pending_notes[60].start_time == pytest.approx(2.5)
+
+    def test_missing_timestamp_uses_receive_time(self):
+        """A zero timestamp falls back to the poll's receive time."""
+        session = self._session([self.TimedMessage([0x90, 60, 100], 0)])
+
+        session.poll()
+
+        assert session._pending_notes[60].start_time > 1.0
+
+    def test_implausible_timestamp_uses_receive_time(self):
+        """Timestamps before the session start are ignored."""
+        session = self._session(
+            [self.TimedMessage([0x90, 60, 100], 500)], start_ns=1_000_000_000
+        )
+
+        session.poll()
+
+        assert session._pending_notes[60].start_time > 1.0
 
 
 class TestTranscribeSessionQuantization:
@@ -473,6 +731,35 @@ class TestTranscribeSessionQuantization:
         # Should use normal quantization (0.5 rounds to 0.5 with 0.25 grid)
         assert result == pytest.approx(0.5, abs=0.01)
 
+    def test_swing_full_ratio_at_moderate_tempo(self):
+        """At 120 BPM the configured swing ratio applies unchanged."""
+        session = TranscribeSession(feel="swing", default_tempo=120.0, swing_ratio=0.7)
+        assert session._quantize_beats(0.5, kind="note") == pytest.approx(0.7)
+        assert session._quantize_beats(0.5, kind="note") == pytest.approx(0.3)
+
+    def test_swing_eases_with_tempo(self):
+        """Swing blends toward straight between 120 and 180 BPM."""
+        session = TranscribeSession(feel="swing", default_tempo=150.0, swing_ratio=0.7)
+        assert session._quantize_beats(0.5, kind="note") == pytest.approx(0.6)
+
+    def test_swing_straight_at_fast_tempo(self):
+        """At 180 BPM and above swung pairs come out even."""
+        session = TranscribeSession(feel="swing", default_tempo=200.0, swing_ratio=0.7)
+        assert session._quantize_beats(0.5, kind="note") == pytest.approx(0.5)
+        assert session._quantize_beats(0.5, kind="note") == pytest.approx(0.5)
+
+    def test_quantize_beats_nearest_grid_point(self):
+        """Beats snap to the nearest grid point."""
+        session = TranscribeSession(quantize_grid=0.25)
+        assert session._quantize_beats(0.6, kind="note") == pytest.approx(0.5)
+        assert session._quantize_beats(0.65, kind="note") == pytest.approx(0.75)
+
+    def test_quantize_beats_ties_snap_earlier(self):
+        """Halfway values snap to the earlier grid point regardless of parity."""
+        session = TranscribeSession(quantize_grid=0.25)
+        assert session._quantize_beats(0.375, kind="note") == pytest.approx(0.25)
+        assert session._quantize_beats(0.625, kind="note") == pytest.approx(0.5)
+
     def test_quantize_beats_no_grid(self):
         """Quantization with zero grid returns raw beats."""
         session = TranscribeSession(quantize_grid=0)
@@ -495,6 +782,136 @@ class TestTranscribeSessionQuantization:
         session = TranscribeSession(feel="straight", quantize_grid=0.125)
         assert session._grid_value() == 0.125
 
+    def test_settings_changed_after_init_apply_on_conversion(self):
+        """Changing feel or tempo after construction is honored by _notes_to_seq."""
+        session = TranscribeSession(default_tempo=120.0)
+        session.feel = "triplet"
+        session.default_tempo = 60.0
+        session._recorded_notes = [
+            RecordedNote(pitch=60, velocity=100, start_time=0.0, duration=1.0 / 3.0)
+        ]
+
+        seq = session._notes_to_seq()
+
+        assert session._grid_value() == pytest.approx(1.0 / 3.0)
+        assert seq.elements[0].duration == 12
+
+
+class TestTranscribeSessionSegmentBeats:
+    """Tests for _segment_beats method."""
+
+    def test_single_duration(self):
+        """A length matching one duration yields one segment."""
+        session = TranscribeSession()
+        assert session._segment_beats(1.5) == [(4, 1, 1.5)]
+
+    def test_segments_preserve_length(self):
+        """Lengths between durations are tied without gaining or losing time."""
+        session = TranscribeSession()
+        segments = session._segment_beats(1.75)
+        assert [(denom, dots) for denom, dots, _ in segments] == [(4, 1), (16, 0)]
+        assert sum(length for _, _, length in segments) == pytest.approx(1.75)
+
+    def test_triplet_lengths(self):
+        """Triplet feel lengths use tuplet durations."""
+        session = TranscribeSession(feel="triplet")
+        segments = session._segment_beats(4.0 / 3.0)
+        assert [(denom, dots) for denom, dots, _ in segments] == [(4, 0), (12, 0)]
+
+    def test_zero_length(self):
+        """Lengths within tolerance of zero yield no segments."""
+        session = TranscribeSession()
+        assert session._segment_beats(0.0) == []
+
+    def test_segments_cached_per_quantized_length(self):
+        """Lengths that quantize alike reuse one segmentation."""
+        session = TranscribeSession()
+        first = session._segments_for_beats(1.74, kind="note")
+        second = session._segments_for_beats(1.76, kind="note")
+        assert first is second
+        assert [(denom, dots) for denom, dots, _ in first] == [(4, 1), (16, 0)]
+
+    def test_segment_cache_follows_settings(self):
+        """Refreshing timing settings switches to that configuration's cache."""
+        session = TranscribeSession()
+        straight = session._segment_cache
+        session._segments_for_beats(1.0, kind="note")
+        session.feel = "triplet"
+        session._refresh_timing()
+        assert session._segment_cache is not straight
+        assert session._segment_cache is session._timing.segment_cache
+        assert 1.0 in straight
+
+    def test_segment_cache_shared_across_sessions(self):
+        """A new session reuses segmentations computed under equal settings."""
+        first = TranscribeSession(quantize_grid=0.125, default_tempo=96.0)
+        segments = first._segments_for_beats(1.5, kind="note")
+        second = TranscribeSession(quantize_grid=0.125, default_tempo=96.0)
+        assert second._segments_for_beats(1.5, kind="note") is segments
+
+    def test_segment_cache_kept_without_changes(self):
+        """Refreshing with unchanged settings keeps cached segmentations."""
+        session = TranscribeSession()
+        segments = session._segments_for_beats(1.0, kind="note")
+        session._refresh_timing()
+        assert session._segments_for_beats(1.0, kind="note") is segments
+
+    def test_sessions_share_timing(self):
+        """Sessions with the same configuration share derived settings."""
+        first = TranscribeSession(feel="swing", default_tempo=140.0)
+        second = TranscribeSession(feel="swing", default_tempo=140.0)
+        assert first._timing is second._timing
+        assert TranscribeSession(feel="swing")._timing is not first._timing
+
+    @pytest.mark.parametrize(
+        ("feel", "grid", "extra"),
+        [
+            ("straight", 0.25, {}),
+            ("swing", 0.25, {"swing_ratio": 2.0 / 3.0}),
+            ("triplet", 1.0 / 3.0, {"tuplet_division": 3}),
+            ("quintuplet", 0.2, {"tuplet_division": 5}),
+        ],
+    )
+    def test_feel_table(self, feel, grid, extra):
+        """Each feel's grid and metadata come from the shared feel table."""
+        session = TranscribeSession(feel=feel, quantize_grid=0.25)
+        assert session._grid == pytest.approx(grid)
+        assert session._seq_metadata() == {
+            "feel": feel,
+            "quantize_grid": 0.25,
+            **extra,
+        }
+
+    def test_tolerance_follows_grid(self):
+        """Coarser grids absorb larger leftovers, per refreshed settings."""
+        session = TranscribeSession(quantize_grid=0.0)
+        segments = session._segment_beats(1.05)
+        assert [(denom, dots) for denom, dots, _ in segments] == [(4, 0), (64, 0)]
+        session.quantize_grid = 1.0
+        session._refresh_timing()
+        assert session._segment_beats(1.05) == [(4, 0, 1.0)]
+
+    @pytest.mark.parametrize(
+        ("beats", "expected"),
+        [
+            (0.3, [(16, 0), (64, 0)]),
+            (0.9, [(8, 1), (32, 0)]),
+            (2.2, [(2, 0), (32, 0), (64, 0)]),
+        ],
+    )
+    def test_unquantized_straight_uses_plain_values(self, beats, expected):
+        """With grid 0, straight feel never ties into tuplet values."""
+        session = TranscribeSession(quantize_grid=0.0)
+        segments = session._segment_beats(beats)
+        assert [(denom, dots) for denom, dots, _ in segments] == expected
+
+    def test_quintuplet_feel_uses_quintuplet_values(self):
+        """Tuplet values stay available to the matching tuplet feel."""
+        session = TranscribeSession(feel="quintuplet")
+        assert session._segment_beats(0.2) == [(20, 0, pytest.approx(0.2))]
+        straight = TranscribeSession(quantize_grid=0.0)._segment_beats(0.2)
+        assert [(denom, dots) for denom, dots, _ in straight] == [(32, 0), (64, 0)]
+
 
 class TestTranscribeSessionElementBeats:
     """Tests for _element_beats method."""
@@ -588,6 +1005,21 @@ class TestTranscribeSessionStopNotRunning:
         result = session.stop()
         assert len(result.elements) == 0
 
+    def test_stop_closes_held_notes(self):
+        """stop() records notes still held and clears the pending slots."""
+        session = TranscribeSession()
+        session._running = True
+        session._start_ns = time.monotonic_ns() - 1_000_000_000
+        session._note_on(60, 100, 0.0)
+        session._note_on(64, 90, 0.5)
+
+        session.stop()
+
+        recorded = sorted(session._recorded_notes, key=lambda n: n.pitch)
+        assert [n.pitch for n in recorded] == [60, 64]
+        assert recorded[0].duration == pytest.approx(1.0, abs=0.1)
+        assert not any(session._pending_notes)
+
 
 class TestTranscribeSessionSecondsBeatsConversion:
     """Tests for seconds/beats conversion methods."""
@@ -617,6 +1049,19 @@ class TestTranscribeSessionSecondsBeatsConversion:
 class TestTranscribeSessionCollapseTuplets:
     """Tests for _collapse_tuplets method."""
 
+    def test_straight_feel_skips_collapse(self, monkeypatch):
+        """Feels without a tuplet division never scan for tuplets."""
+        session = TranscribeSession(default_tempo=120.0, feel="swing")
+        session._recorded_notes = [
+            RecordedNote(pitch=60, velocity=100, start_time=0.0, duration=0.5)
+        ]
+
+        def fail(*args):
+            raise AssertionError("_collapse_tuplets should not be called")
+
+        monkeypatch.setattr(session, "_collapse_tuplets", fail)
+        assert len(session._notes_to_seq().elements) == 1
+
     def test_collapse_tuplets_no_division(self):
         """No collapse when no tuplet_division in metadata."""
         session = TranscribeSession()
@@ -645,6 +1090,38 @@ class TestTranscribeSessionCollapseTuplets:
         result = session._collapse_tuplets(elements, metadata)
         assert result == elements
 
+    def test_collapse_tuplets_groups_and_flushes_partial(self):
+        """Full tuplets become unslurred crams; an incomplete run passes through as-is."""
+        session = TranscribeSession(feel="triplet")
+        triplets = [Note(pitch=p, duration=12, slurred=True) for p in "cdefg"]
+        quarter = Note(pitch="a", duration=4)
+        metadata = {"tuplet_division": 3}
+
+        result = session._collapse_tuplets([*triplets, quarter], metadata)
+
+        assert isinstance(result[0], Cram)
+        assert [n.pitch for n in result[0].elements] == ["c", "d", "e"]
+        assert (result[0].duration, result[0].dots) == (4, 0)
+        assert not any(n.slurred for n in result[0].elements)
+        assert result[1:3] == triplets[3:]
+        assert result[1] is triplets[3]
+        assert result[3] is quarter
+
+
+class TestPitchTable:
+    """Tests for the precomputed MIDI pitch table."""
+
+    def test_matches_midi_pitch_to_note(self):
+        """Every entry agrees with midi_pitch_to_note."""
+        from aldakit.midi.midi_to_ast import midi_pitch_to_note
+        from aldakit.midi.transcriber import _PITCH_TABLE
+
+        assert len(_PITCH_TABLE) == 128
+        for pitch, (letter, octave, accidental) in enumerate(_PITCH_TABLE):
+            expected_letter, expected_octave, accidentals = midi_pitch_to_note(pitch)
+            assert (letter, octave) == (expected_letter, expected_octave)
+            assert accidental == (accidentals[0] if accidentals else None)
+
 
 class TestGroupNotes:
     """Tests for _group_notes method."""
@@ -672,6 +1149,20 @@ class TestGroupNotes:
         assert len(groups) == 1
         assert len(groups[0]) == 2
 
+    def test_group_hand_played_chord(self):
+        """Notes struck within 30 ms of each other form one chord."""
+        session = TranscribeSession()
+        notes = [
+            RecordedNote(pitch=60, velocity=100, start_time=0.0, duration=0.5),
+            RecordedNote(pitch=64, velocity=100, start_time=0.012, duration=0.5),
+            RecordedNote(pitch=67, velocity=100, start_time=0.025, duration=0.5),
+        ]
+
+        groups = session._group_notes(notes)
+
+        assert len(groups) == 1
+        assert len(groups[0]) == 3
+
     def test_group_sequential_notes(self):
         """Notes at different times form separate groups."""
         session = TranscribeSession()
@@ -685,3 +1176,35 @@ class TestGroupNotes:
         assert len(groups) == 2
         assert len(groups[0]) == 1
         assert len(groups[1]) == 1
+
+    def test_iter_groups_is_lazy(self):
+        """_iter_groups yields each group without materializing the rest."""
+        notes = [
+            RecordedNote(pitch=60, velocity=100, start_time=0.0, duration=0.5),
+            RecordedNote(pitch=64, velocity=100, start_time=0.001, duration=0.5),
+            RecordedNote(pitch=67, velocity=100, start_time=0.5, duration=0.5),
+        ]
+
+        groups = TranscribeSession._iter_groups(notes)
+
+        assert [n.pitch for n in next(groups)] == [60, 64]
+        assert [n.pitch for n in next(groups)] == [67]
+        assert next(groups, None) is None
+
+    def test_group_empty(self):
+        """No notes produce no groups."""
+        session = TranscribeSession()
+        assert session._group_notes([]) == []
+
+    def test_group_anchored_to_first_note(self):
+        """Tolerance is measured from the group's first note, not the previous one."""
+        session = TranscribeSession()
+        notes = [
+            RecordedNote(pitch=60, velocity=100, start_time=0.0, duration=0.5),
+            RecordedNote(pitch=64, velocity=100, start_time=0.02, duration=0.5),
+            RecordedNote(pitch=67, velocity=100, start_time=0.04, duration=0.5),
+        ]
+
+        groups = session._group_notes(notes)
+
+        assert [[n.pitch for n in g] for g in groups] == [[60, 64], [67]]
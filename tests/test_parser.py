@@ -1,7 +1,7 @@
 """Tests for the aldakit parser."""
 
 import pytest
-from aldakit.parser import parse
+from aldakit.parser import _cached_parse, parse
 from aldakit.ast_nodes import (
     RootNode,
     PartNode,
@@ -587,3 +587,25 @@ class TestComplexExpressions:
         assert isinstance(bracketed, BracketedSequenceNode)
         # First event should be on-repetition
         assert isinstance(bracketed.events.events[0], OnRepetitionsNode)
+
+
+class TestCachedParse:
+    """Test the memoized parse entry point."""
+
+    def test_repeat_source_reuses_ast(self):
+        """Parsing the same source twice returns the same tree."""
+        _cached_parse.cache_clear()
+        assert _cached_parse("piano: c d e") is _cached_parse("piano: c d e")
+
+    def test_filename_is_part_of_key(self):
+        """Different filenames produce separate trees."""
+        _cached_parse.cache_clear()
+        assert _cached_parse("c", "a.alda") is not _cached_parse("c", "b.alda")
+
+    def test_errors_not_cached(self):
+        """Syntax errors are raised on every call."""
+        _cached_parse.cache_clear()
+        for _ in range(2):
+            with pytest.raises(AldaSyntaxError):
+                _cached_parse("(tempo 120")
+        assert _cached_parse.cache_info().currsize == 0
@@ -13,6 +13,7 @@ from aldakit.repl import (
     AldaCompleter,
     create_key_bindings,
     ALDA_STYLE,
+    _tokenize_line,
 )
 
 
@@ -152,6 +153,41 @@ class TestAldaLexer:
         bar_tokens = [(cls, txt) for cls, txt in tokens if cls == "class:barline"]
         assert len(bar_tokens) == 1
 
+    def test_highlight_dense_notes(self):
+        """Notes written without spaces still split into note/duration tokens."""
+        lexer = AldaLexer()
+        tokens = lexer.lex_document(Document("c8d8e4"))(0)
+
+        assert tokens == [
+            ("class:note", "c"),
+            ("class:duration", "8"),
+            ("class:note", "d"),
+            ("class:duration", "8"),
+            ("class:note", "e"),
+            ("class:duration", "4"),
+        ]
+
+    def test_highlight_instrument_after_words(self):
+        """An instrument later in the line is found after non-instrument words."""
+        lexer = AldaLexer()
+        tokens = lexer.lex_document(Document("cab  piano:"))(0)
+
+        assert tokens[-1] == ("class:instrument", "piano:")
+        assert ("", "  ") in tokens
+
+    def test_unchanged_lines_use_cache(self):
+        """Re-lexing an unchanged line is served from the cache."""
+        lexer = AldaLexer()
+        line = "piano: o4 c8 d e f | g2"
+        first = lexer.lex_document(Document(line))(0)
+        hits = _tokenize_line.cache_info().hits
+
+        second = lexer.lex_document(Document(line))(0)
+
+        assert _tokenize_line.cache_info().hits == hits + 1
+        assert second == first
+        assert second is not first  # callers get their own copy
+
     def test_highlight_chord_marker(self):
         """Highlight chord markers."""
         lexer = AldaLexer()
@@ -242,6 +278,23 @@ class TestAldaCompleter:
         # Should include violin, viola, etc.
         assert any("violin:" in label for label in labels)
 
+    def test_complete_instrument_matches_linear_scan(self):
+        """Completions are exactly the instruments sharing the prefix, in order."""
+        completer = AldaCompleter()
+        doc = Document("vio")
+
+        labels = [c.text for c in completer.get_completions(doc, None)]
+
+        expected = [i + ": " for i in completer.instruments if i.startswith("vio")]
+        assert labels == expected
+
+    def test_complete_instrument_no_match(self):
+        """Prefixes past the end of the table yield nothing."""
+        completer = AldaCompleter()
+        doc = Document("zzz")
+
+        assert list(completer.get_completions(doc, None)) == []
+
     def test_complete_attribute(self):
         """Complete attributes after opening paren."""
         completer = AldaCompleter()
@@ -252,6 +305,30 @@ class TestAldaCompleter:
         labels = [c.text for c in completions]
         assert any("tempo" in label for label in labels)
 
+    def test_complete_attribute_with_surrounding_whitespace(self):
+        """Leading and trailing spaces do not change completion."""
+        completer = AldaCompleter()
+        doc = Document("   piano: c (tem")
+
+        labels = [c.text for c in completer.get_completions(doc, None)]
+        assert labels == ["(tempo "]
+
+    def test_no_attribute_completion_after_closed_paren(self):
+        """A closed attribute does not trigger attribute completion."""
+        completer = AldaCompleter()
+        doc = Document("piano: (tempo 90) c")
+
+        assert list(completer.get_completions(doc, None)) == []
+
+    def test_unterminated_paren(self):
+        """Only a trailing unmatched ( counts as unterminated."""
+        assert AldaCompleter._unterminated_paren("(tem")
+        assert AldaCompleter._unterminated_paren("c (tempo 90) (vol")
+        assert AldaCompleter._unterminated_paren("(foo (bar) ")
+        assert not AldaCompleter._unterminated_paren("(tempo 90) c")
+        assert not AldaCompleter._unterminated_paren("piano: c d e")
+        assert not AldaCompleter._unterminated_paren("")
+
     def test_no_instrument_completion_after_colon(self):
         """Don't complete instruments if colon already present."""
         completer = AldaCompleter()
@@ -265,7 +342,11 @@ class TestAldaCompleter:
     def test_instruments_sorted(self):
         """Instruments list is sorted."""
         completer = AldaCompleter()
-        assert completer.instruments == sorted(completer.instruments)
+        assert list(completer.instruments) == sorted(completer.instruments)
+
+    def test_instruments_shared_between_completers(self):
+        """Completers reuse the module-level sorted instrument tuple."""
+        assert AldaCompleter().instruments is AldaCompleter().instruments
 
 
 # =============================================================================
@@ -347,3 +428,196 @@ class TestRunRepl:
 
         result = repl.run_repl(use_audio=True, soundfont="/nonexistent/path.sf2")
         assert result == 1
+
+
+class _ScriptedSession:
+    """PromptSession stand-in that returns scripted inputs, then EOF."""
+
+    def __init__(self, inputs):
+        self._inputs = list(inputs)
+
+    def prompt(self, message):
+        if not self._inputs:
+            raise EOFError
+        return self._inputs.pop(0)
+
+
+class _RecordingBackend:
+    """LibremidiBackend stand-in that records played sequences."""
+
+    def __init__(self, **kwargs):
+        self.played = []
+        self.concurrent_mode = kwargs.get("concurrent", True)
+        self.active_slots = 0
+        self.waits = 0
+
+    def _ensure_port_open(self):
+        pass
+
+    def list_output_ports(self):
+        return ["Fake Port"]
+
+    def play(self, sequence):
+        self.played.append(sequence)
+        return 0
+
+    def is_playing(self):
+        return False
+
+    def wait(self):
+        self.waits += 1
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _run_scripted_repl(monkeypatch, inputs, **kwargs):
+    """Run the REPL over scripted inputs and return the backend it used."""
+    from aldakit import repl
+
+    backends = []
+
+    def make_backend(**backend_kwargs):
+        backend = _RecordingBackend(**backend_kwargs)
+        backends.append(backend)
+        return backend
+
+    monkeypatch.setattr(repl, "LibremidiBackend", make_backend)
+    monkeypatch.setattr(
+        repl, "PromptSession", lambda *args, **kw: _ScriptedSession(inputs)
+    )
+    assert repl.run_repl(port_name="Fake Port", **kwargs) == 0
+    return backends[-1]
+
+
+class TestRunReplSession:
+    """Tests for the run_repl input loop."""
+
+    def test_default_tempo_prepended(self, monkeypatch):
+        """Input without a tempo attribute plays at the default tempo."""
+        backend = _run_scripted_repl(monkeypatch, ["c"], default_tempo=60)
+
+        (sequence,) = backend.played
+        # Quarter note at 60 BPM (notes sound for 90% of their length)
+        assert sequence.notes[0].duration == pytest.approx(0.9)
+
+    def test_explicit_tempo_kept(self, monkeypatch):
+        """An explicit tempo attribute, in any case, is not overridden."""
+        backend = _run_scripted_repl(monkeypatch, ["(TEMPO 240) c"], default_tempo=60)
+
+        (sequence,) = backend.played
+        # Quarter note at 240 BPM
+        assert sequence.notes[0].duration == pytest.approx(0.225)
+
+    def test_sequential_mode_waits_for_playback(self, monkeypatch):
+        """Sequential mode blocks on the backend after each input."""
+        backend = _run_scripted_repl(monkeypatch, ["c", "d"], concurrent=False)
+
+        assert len(backend.played) == 2
+        assert backend.waits == 2
+
+    def test_concurrent_mode_does_not_wait(self, monkeypatch):
+        """Concurrent mode returns to the prompt immediately."""
+        backend = _run_scripted_repl(monkeypatch, ["c", "d"])
+
+        assert len(backend.played) == 2
+        assert backend.waits == 0
+
+    def test_instruments_command_lists_sorted(self, monkeypatch, capsys):
+        """:instruments prints every instrument in sorted order."""
+        from aldakit.midi.types import INSTRUMENT_PROGRAMS
+
+        _run_scripted_repl(monkeypatch, [":instruments"])
+
+        out = capsys.readouterr().out
+        listed = [
+            name
+            for line in out.splitlines()
+            if line.startswith("  ")
+            for name in line.split()
+            if name in INSTRUMENT_PROGRAMS
+        ]
+        assert listed == sorted(INSTRUMENT_PROGRAMS)
+
+    def test_clearcache_command(self, monkeypatch, capsys):
+        """:clearcache empties the parse cache."""
+        from aldakit.parser import _cached_parse
+
+        _run_scripted_repl(monkeypatch, ["c", ":clearcache"])
+
+        assert _cached_parse.cache_info().currsize == 0
+        assert "Parse cache cleared" in capsys.readouterr().out
+
+    def test_tempo_command_sets_default(self, monkeypatch, capsys):
+        """:tempo updates the tempo applied to later input."""
+        backend = _run_scripted_repl(monkeypatch, [":tempo 240", "c"])
+
+        (sequence,) = backend.played
+        assert sequence.notes[0].duration == pytest.approx(0.225)
+        assert "Default tempo: 240 BPM" in capsys.readouterr().out
+
+    def test_invalid_tempo_command(self, monkeypatch, capsys):
+        """A non-numeric :tempo argument is rejected."""
+        _run_scripted_repl(monkeypatch, [":tempo fast"])
+
+        assert "Invalid tempo" in capsys.readouterr().out
+
+    def test_quit_command_stops_loop(self, monkeypatch):
+        """Input after :quit is never played."""
+        backend = _run_scripted_repl(monkeypatch, [":QUIT", "c"])
+
+        assert backend.played == []
+
+    def test_help_and_unknown_commands(self, monkeypatch, capsys):
+        """:help prints the command list; unknown commands are reported."""
+        _run_scripted_repl(monkeypatch, [":help", ":bogus"])
+
+        out = capsys.readouterr().out
+        assert "Commands:" in out
+        assert "  :clearcache       - Forget cached parse results" in out
+        assert "Unknown command: :bogus" in out
+
+    def test_sequential_command_switches_mode(self, monkeypatch):
+        """:sequential makes later input wait for playback."""
+        backend = _run_scripted_repl(monkeypatch, ["c", ":sequential", "d"])
+
+        assert backend.concurrent_mode is False
+        assert backend.waits == 1
+
+    def test_default_tempo_applies_to_every_part(self, monkeypatch):
+        """The default tempo reaches notes after part declarations."""
+        backend = _run_scripted_repl(
+            monkeypatch, ["piano: c violin: d"], default_tempo=60
+        )
+
+        (sequence,) = backend.played
+        assert [n.duration for n in sequence.notes] == pytest.approx([0.9, 0.9])
+
+    def test_part_tempo_kept(self, monkeypatch):
+        """A tempo attribute inside a part is not overridden."""
+        backend = _run_scripted_repl(
+            monkeypatch, ["piano: (tempo 240) c"], default_tempo=60
+        )
+
+        (sequence,) = backend.played
+        assert sequence.notes[0].duration == pytest.approx(0.225)
+
+    def test_commented_tempo_ignored(self, monkeypatch):
+        """A tempo inside a comment does not suppress the default."""
+        backend = _run_scripted_repl(monkeypatch, ["c # (tempo 240)"], default_tempo=60)
+
+        (sequence,) = backend.played
+        assert sequence.notes[0].duration == pytest.approx(0.9)
+
+    def test_default_tempo_leaves_cached_ast_untouched(self, monkeypatch):
+        """Adding the default tempo does not modify the cached parse tree."""
+        from aldakit.parser import _cached_parse
+
+        _cached_parse.cache_clear()
+        _run_scripted_repl(monkeypatch, ["piano: c"], default_tempo=60)
+
+        events = _cached_parse("piano: c", "<repl>").children[0].events.events
+        assert len(events) == 1
@@ -3,6 +3,9 @@
 import os
 import hashlib
 import tempfile
+import threading
+import time
+import urllib.error
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -10,6 +13,7 @@ import pytest
 
 from aldakit.midi.soundfont import (
     SoundFontManager,
+    SoundFontEntry,
     SOUNDFONT_CATALOG,
     DEFAULT_SOUNDFONT,
     SOUNDFONT_NAMES,
@@ -18,6 +22,7 @@ from aldakit.midi.soundfont import (
     list_soundfonts,
     list_available_downloads,
     print_download_progress,
+    make_download_progress,
 )
 
 
@@ -35,6 +40,16 @@ class TestSoundFontManager:
         assert manager.soundfont_dir == Path.home() / ".aldakit" / "soundfonts"
         assert manager.catalog == SOUNDFONT_CATALOG
 
+    def test_init_custom_directory_skips_home_lookup(self, tmp_path, monkeypatch):
+        """An explicit directory doesn't need the home directory to resolve."""
+
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.setattr(Path, "home", staticmethod(no_home))
+        manager = SoundFontManager(soundfont_dir=tmp_path)
+        assert manager.soundfont_dir == tmp_path
+
     def test_init_custom_directory(self, tmp_path):
         """Manager accepts custom soundfont directory."""
         custom_dir = tmp_path / "custom_soundfonts"
@@ -57,12 +72,19 @@ class TestSoundFontManager:
         )
         assert "TestSF" in manager.catalog
         assert "FluidR3_GM" not in manager.catalog
+        assert manager.catalog["TestSF"] == SoundFontEntry(
+            url="https://example.com/test.sf2",
+            filename="test.sf2",
+            size_mb=1,
+            description="Test SoundFont",
+        )
 
-    def test_catalog_returns_copy(self, tmp_path):
-        """Catalog property returns a copy, not the original."""
+    def test_catalog_is_read_only(self, tmp_path):
+        """Catalog property returns a read-only view of the catalog."""
         manager = SoundFontManager(soundfont_dir=tmp_path)
         catalog = manager.catalog
-        catalog["NewSF"] = {}
+        with pytest.raises(TypeError):
+            catalog["NewSF"] = {}
         assert "NewSF" not in manager.catalog
 
     def test_get_search_paths(self, tmp_path):
@@ -127,6 +149,60 @@ class TestSoundFontManager:
         result = manager.find()
         assert result == sf_path
 
+    def test_find_uses_name_preference_order(self, tmp_path, monkeypatch):
+        """Within a directory, the earliest SOUNDFONT_NAMES entry wins."""
+        monkeypatch.delenv("ALDAKIT_SOUNDFONT", raising=False)
+
+        for name in ("default.sf2", "TimGM6mb.sf2", "FluidR3_GS.sf2"):
+            (tmp_path / name).write_bytes(b"data")
+
+        manager = SoundFontManager(soundfont_dir=tmp_path)
+        monkeypatch.setattr(manager, "get_search_paths", lambda: [tmp_path])
+
+        assert manager.find() == tmp_path / "FluidR3_GS.sf2"
+
+    def test_find_prefers_known_name_in_later_directory(self, tmp_path, monkeypatch):
+        """Known names in any directory win over the generic .sf2 fallback."""
+        monkeypatch.delenv("ALDAKIT_SOUNDFONT", raising=False)
+
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        (first / "random_soundfont.sf2").write_bytes(b"data")
+        known = second / "TimGM6mb.sf2"
+        known.write_bytes(b"data")
+
+        manager = SoundFontManager(soundfont_dir=tmp_path)
+        monkeypatch.setattr(
+            manager,
+            "get_search_paths",
+            lambda: [tmp_path / "missing", first, second],
+        )
+
+        assert manager.find() == known
+
+    def test_find_stops_at_first_known_name(self, tmp_path, monkeypatch):
+        """Directories after the first known-name hit are not scanned."""
+        monkeypatch.delenv("ALDAKIT_SOUNDFONT", raising=False)
+        known = tmp_path / "TimGM6mb.sf2"
+        known.write_bytes(b"data")
+
+        manager = SoundFontManager(soundfont_dir=tmp_path)
+        monkeypatch.setattr(manager, "get_search_paths", lambda: [tmp_path, tmp_path / "later"])
+
+        scanned = []
+        original = SoundFontManager._scan_sf2_names
+
+        def recording_scan(directory):
+            scanned.append(directory)
+            return original(directory)
+
+        monkeypatch.setattr(SoundFontManager, "_scan_sf2_names", staticmethod(recording_scan))
+
+        assert manager.find() == known
+        assert scanned == [tmp_path]
+
     def test_list_returns_all_soundfonts(self, tmp_path, monkeypatch):
         """List returns all SoundFont files in search paths."""
         monkeypatch.delenv("ALDAKIT_SOUNDFONT", raising=False)
@@ -144,6 +220,23 @@ class TestSoundFontManager:
         assert sf1 in result
         assert sf2 in result
 
+    def test_list_skips_missing_and_non_directory_paths(self, tmp_path, monkeypatch):
+        """List ignores search paths that are missing or are plain files."""
+        monkeypatch.delenv("ALDAKIT_SOUNDFONT", raising=False)
+
+        sf_path = tmp_path / "font.sf2"
+        sf_path.write_bytes(b"data")
+        (tmp_path / "notes.txt").write_bytes(b"not a soundfont")
+
+        manager = SoundFontManager(soundfont_dir=tmp_path)
+        monkeypatch.setattr(
+            manager,
+            "get_search_paths",
+            lambda: [tmp_path / "missing", sf_path, tmp_path],
+        )
+
+        assert manager.list() == [sf_path]
+
     def test_list_includes_env_soundfont(self, tmp_path, monkeypatch):
         """List includes soundfont from environment variable."""
         sf_path = tmp_path / "env_font.sf2"
@@ -170,7 +263,7 @@ class TestSoundFontManager:
         assert result.count(sf_path) == 1
 
     def test_list_available_downloads(self, tmp_path):
-        """List available downloads returns catalog copy."""
+        """List available downloads returns a read-only catalog view."""
         manager = SoundFontManager(soundfont_dir=tmp_path)
         downloads = manager.list_available_downloads()
 
@@ -208,15 +301,15 @@ class TestSoundFontManager:
         target.write_bytes(b"old data")
 
         # Mock the download to avoid actual network call
-        def mock_download(url, path, callback):
+        def mock_download(url, path, callback, resume=False):
             path.write_bytes(b"new data")
 
-        # Also need to mock _file_sha256 to return expected hash
+        # Also need to mock _file_sha256_digest to return expected hash
         def mock_sha256(path):
-            return SOUNDFONT_CATALOG["TimGM6mb"]["sha256"]
+            return SOUNDFONT_CATALOG["TimGM6mb"].sha256_digest
 
         monkeypatch.setattr(SoundFontManager, "_download_file", staticmethod(mock_download))
-        monkeypatch.setattr(SoundFontManager, "_file_sha256", staticmethod(mock_sha256))
+        monkeypatch.setattr(SoundFontManager, "_file_sha256_digest", staticmethod(mock_sha256))
 
         manager = SoundFontManager(soundfont_dir=tmp_path)
         result = manager.download("TimGM6mb", force=True)
@@ -224,6 +317,103 @@ class TestSoundFontManager:
         assert result == target
         assert target.read_bytes() == b"new data"
 
+    def test_download_hash_mismatch_removes_partial(self, tmp_path, monkeypatch):
+        """A checksum mismatch discards the .part file and leaves no target."""
+
+        def mock_download(url, path, callback, resume=False):
+            path.write_bytes(b"corrupt data")
+
+        monkeypatch.setattr(SoundFontManager, "_download_file", staticmethod(mock_download))
+
+        manager = SoundFontManager(soundfont_dir=tmp_path)
+        with pytest.raises(RuntimeError, match="Hash mismatch"):
+            manager.download("TimGM6mb")
+
+        assert not (tmp_path / "TimGM6mb.sf2").exists()
+        assert not (tmp_path / "TimGM6mb.sf2.part").exists()
+
+    def test_download_error_keeps_partial_for_resume(self, tmp_path, monkeypatch):
+        """An interrupted download keeps its .part file and resumes it next time."""
+        calls = []
+
+        def mock_download(url, path, callback, resume=False):
+            calls.append((path, resume))
+            path.write_bytes(b"partial")
+            raise OSError("connection reset")
+
+        monkeypatch.setattr(SoundFontManager, "_download_file", staticmethod(mock_download))
+
+        manager = SoundFontManager(soundfont_dir=tmp_path)
+        with pytest.raises(OSError):
+            manager.download("TimGM6mb")
+
+        assert (tmp_path / "TimGM6mb.sf2.part").read_bytes() == b"partial"
+        assert calls == [(tmp_path / "TimGM6mb.sf2.part", True)]
+
+    def test_download_restarts_stale_partial_on_hash_mismatch(self, tmp_path, monkeypatch):
+        """A resumed .part that fails the checksum is downloaded once from scratch."""
+        (tmp_path / "TimGM6mb.sf2.part").write_bytes(b"stale")
+        calls = []
+
+        def mock_download(url, path, callback, resume=False):
+            calls.append(resume)
+            if not resume:
+                path.write_bytes(b"fresh")
+
+        def mock_sha256(path):
+            if path.read_bytes() == b"fresh":
+                return SOUNDFONT_CATALOG["TimGM6mb"].sha256_digest
+            return b"\x00" * 32
+
+        monkeypatch.setattr(SoundFontManager, "_download_file", staticmethod(mock_download))
+        monkeypatch.setattr(SoundFontManager, "_file_sha256_digest", staticmethod(mock_sha256))
+
+        manager = SoundFontManager(soundfont_dir=tmp_path)
+        result = manager.download("TimGM6mb")
+
+        assert calls == [True, False]
+        assert result.read_bytes() == b"fresh"
+        assert not (tmp_path / "TimGM6mb.sf2.part").exists()
+
+    def test_download_force_discards_partial(self, tmp_path, monkeypatch):
+        """force=True starts from scratch instead of resuming a .part file."""
+        (tmp_path / "TimGM6mb.sf2.part").write_bytes(b"stale")
+        seen = []
+
+        def mock_download(url, path, callback, resume=False):
+            seen.append(path.exists())
+            path.write_bytes(b"fresh")
+
+        def mock_sha256(path):
+            return SOUNDFONT_CATALOG["TimGM6mb"].sha256_digest
+
+        monkeypatch.setattr(SoundFontManager, "_download_file", staticmethod(mock_download))
+        monkeypatch.setattr(SoundFontManager, "_file_sha256_digest", staticmethod(mock_sha256))
+
+        manager = SoundFontManager(soundfont_dir=tmp_path)
+        result = manager.download("TimGM6mb", force=True)
+
+        assert seen == [False]
+        assert result.read_bytes() == b"fresh"
+
+    def test_download_without_checksum_discards_partial(self, tmp_path, monkeypatch):
+        """A .part file is not resumed when there is no checksum to verify it."""
+        (tmp_path / "custom.sf2.part").write_bytes(b"foreign")
+        seen = []
+
+        def mock_download(url, path, callback, resume=False):
+            seen.append(path.exists())
+            path.write_bytes(b"fresh")
+
+        monkeypatch.setattr(SoundFontManager, "_download_file", staticmethod(mock_download))
+
+        catalog = {"custom": {"url": "https://example.com/c.sf2", "filename": "custom.sf2"}}
+        manager = SoundFontManager(soundfont_dir=tmp_path, catalog=catalog)
+        result = manager.download("custom")
+
+        assert seen == [False]
+        assert result.read_bytes() == b"fresh"
+
     def test_ensure_returns_existing(self, tmp_path, monkeypatch):
         """Ensure returns existing SoundFont if available."""
         monkeypatch.delenv("ALDAKIT_SOUNDFONT", raising=False)
@@ -292,6 +482,29 @@ class TestSoundFontManager:
 
         assert result["TimGM6mb"] is False
 
+    def test_verify_checksums_multiple_files(self, tmp_path):
+        """Verify checksums hashes several files and keeps catalog order."""
+        good = b"good content"
+        (tmp_path / "a.sf2").write_bytes(good)
+        (tmp_path / "b.sf2").write_bytes(b"tampered")
+        (tmp_path / "c.sf2").write_bytes(good)
+
+        custom_catalog = {
+            key: {
+                "url": f"https://example.com/{key}.sf2",
+                "filename": f"{key}.sf2",
+                "size_mb": 1,
+                "sha256": hashlib.sha256(good).hexdigest(),
+            }
+            for key in ("a", "missing", "b", "c")
+        }
+
+        manager = SoundFontManager(soundfont_dir=tmp_path, catalog=custom_catalog)
+        result = manager.verify_checksums()
+
+        assert list(result) == ["a", "missing", "b", "c"]
+        assert result == {"a": True, "missing": False, "b": False, "c": True}
+
     def test_verify_checksums_no_hash_in_catalog(self, tmp_path):
         """Verify checksums returns True for files without hash in catalog."""
         # Create file
@@ -328,6 +541,16 @@ class TestSoundFontManagerFileHash:
 
         assert actual == expected
 
+    def test_file_sha256_digest(self, tmp_path):
+        """File SHA256 digest returns the raw 32-byte digest."""
+        test_file = tmp_path / "test.bin"
+        content = b"Hello, World!"
+        test_file.write_bytes(content)
+
+        actual = SoundFontManager._file_sha256_digest(test_file)
+
+        assert actual == hashlib.sha256(content).digest()
+
     def test_file_sha256_empty_file(self, tmp_path):
         """File SHA256 handles empty files."""
         test_file = tmp_path / "empty.bin"
@@ -339,6 +562,138 @@ class TestSoundFontManagerFileHash:
         assert actual == expected
 
 
+class _FakeResponse:
+    """Minimal stand-in for the object returned by urlopen."""
+
+    def __init__(self, data: bytes, status: int = 200):
+        self._data = data
+        self._pos = 0
+        self.status = status
+        self.headers = {"Content-Length": str(len(data))}
+
+    def read(self, size: int) -> bytes:
+        chunk = self._data[self._pos : self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class TestSoundFontManagerDownloadFile:
+    """Tests for SoundFontManager._download_file."""
+
+    def test_download_writes_file(self, tmp_path):
+        """A plain download writes the full body and reports progress."""
+        target = tmp_path / "out.sf2"
+        progress = []
+
+        with patch("urllib.request.urlopen", return_value=_FakeResponse(b"abcdef")) as urlopen:
+            SoundFontManager._download_file(
+                "https://example.com/x.sf2", target, lambda d, t: progress.append((d, t))
+            )
+
+        assert target.read_bytes() == b"abcdef"
+        assert progress[-1] == (6, 6)
+        assert "Range" not in urlopen.call_args[0][0].headers
+
+    def test_resume_appends_on_partial_content(self, tmp_path):
+        """Resuming sends a Range header and appends a 206 response."""
+        target = tmp_path / "out.sf2"
+        target.write_bytes(b"abc")
+        progress = []
+
+        with patch(
+            "urllib.request.urlopen", return_value=_FakeResponse(b"def", status=206)
+        ) as urlopen:
+            SoundFontManager._download_file(
+                "https://example.com/x.sf2",
+                target,
+                lambda d, t: progress.append((d, t)),
+                resume=True,
+            )
+
+        assert urlopen.call_args[0][0].get_header("Range") == "bytes=3-"
+        assert target.read_bytes() == b"abcdef"
+        assert progress[-1] == (6, 6)
+
+    def test_resume_restarts_when_range_ignored(self, tmp_path):
+        """A 200 response to a Range request overwrites the partial file."""
+        target = tmp_path / "out.sf2"
+        target.write_bytes(b"stale")
+
+        with patch("urllib.request.urlopen", return_value=_FakeResponse(b"fresh")):
+            SoundFontManager._download_file(
+                "https://example.com/x.sf2", target, resume=True
+            )
+
+        assert target.read_bytes() == b"fresh"
+
+
+    def test_resume_keeps_complete_partial_on_416(self, tmp_path):
+        """A 416 to a Range request leaves the partial file for the checksum."""
+        target = tmp_path / "out.sf2"
+        target.write_bytes(b"complete")
+        error = urllib.error.HTTPError("https://example.com/x.sf2", 416, "", {}, None)
+
+        with patch("urllib.request.urlopen", side_effect=error) as urlopen:
+            SoundFontManager._download_file(
+                "https://example.com/x.sf2", target, resume=True
+            )
+
+        assert urlopen.call_count == 1
+        assert target.read_bytes() == b"complete"
+
+
+class TestSoundFontManagerPrefetchChunks:
+    """Tests for SoundFontManager._prefetch_chunks."""
+
+    def test_yields_chunks_in_order(self):
+        """Chunks come out in read order and stop at the empty read."""
+        response = _FakeResponse(b"abcdefghij")
+        chunks = list(SoundFontManager._prefetch_chunks(response.read, 3, max_pending=2))
+        assert chunks == [b"abc", b"def", b"ghi", b"j"]
+
+    def test_reader_error_is_reraised(self):
+        """An exception from read() surfaces in the consumer."""
+
+        def failing_read(size):
+            raise OSError("connection reset")
+
+        with pytest.raises(OSError, match="connection reset"):
+            list(SoundFontManager._prefetch_chunks(failing_read, 3))
+
+    def test_close_stops_blocked_reader(self):
+        """Closing early releases a reader waiting on a full queue."""
+        response = _FakeResponse(b"x" * 100)
+        chunks = SoundFontManager._prefetch_chunks(response.read, 1, max_pending=1)
+        assert next(chunks) == b"x"
+        chunks.close()
+        assert response._pos < 100
+
+    def test_close_does_not_wait_for_blocked_read(self):
+        """Closing returns at once even while the reader is stuck in read()."""
+        release = threading.Event()
+        reads = []
+
+        def slow_read(size):
+            reads.append(size)
+            if len(reads) > 1:
+                release.wait(5.0)
+            return b"x"
+
+        chunks = SoundFontManager._prefetch_chunks(slow_read, 1, max_pending=1)
+        assert next(chunks) == b"x"
+        start = time.monotonic()
+        chunks.close()
+        elapsed = time.monotonic() - start
+        release.set()
+        assert elapsed < 1.0
+
+
 # =============================================================================
 # Module-Level Function Tests
 # =============================================================================
@@ -363,6 +718,15 @@ class TestModuleFunctions:
         finally:
             sf_module._default_manager = original_manager
 
+    def test_default_manager_created_lazily(self, monkeypatch):
+        """The default manager is only built when a helper first needs it."""
+        from aldakit.midi import soundfont as sf_module
+
+        monkeypatch.setattr(sf_module, "_default_manager", None)
+        manager = sf_module._get_default_manager()
+        assert isinstance(manager, SoundFontManager)
+        assert sf_module._get_default_manager() is manager
+
     def test_find_soundfont_delegates(self, tmp_path, monkeypatch):
         """find_soundfont delegates to manager.find()."""
         sf_path = tmp_path / "test.sf2"
@@ -400,6 +764,27 @@ class TestPrintDownloadProgress:
         assert "%" not in captured.out
 
 
+class TestMakeDownloadProgress:
+    """Tests for make_download_progress factory."""
+
+    def test_rate_limits_intermediate_updates(self, capsys):
+        """Updates within min_interval are dropped."""
+        progress = make_download_progress(min_interval=60.0)
+        progress(1024 * 1024, 4 * 1024 * 1024)
+        progress(2 * 1024 * 1024, 4 * 1024 * 1024)
+        captured = capsys.readouterr()
+        assert captured.out.count("Downloading") == 1
+        assert "25%" in captured.out
+
+    def test_always_prints_final_update(self, capsys):
+        """The completing update is printed even inside min_interval."""
+        progress = make_download_progress(min_interval=60.0)
+        progress(1024 * 1024, 2 * 1024 * 1024)
+        progress(2 * 1024 * 1024, 2 * 1024 * 1024)
+        captured = capsys.readouterr()
+        assert "100%" in captured.out
+
+
 # =============================================================================
 # Constants Tests
 # =============================================================================
@@ -414,17 +799,19 @@ class TestConstants:
 
     def test_catalog_entries_have_required_fields(self):
         """All catalog entries have required fields."""
-        required_fields = ["url", "filename", "size_mb", "description"]
-
         for name, info in SOUNDFONT_CATALOG.items():
-            for field in required_fields:
-                assert field in info, f"{name} missing {field}"
+            assert isinstance(info, SoundFontEntry), f"{name} is not a SoundFontEntry"
+            assert info.url, f"{name} missing url"
+            assert info.filename, f"{name} missing filename"
+            assert info.size_mb > 0, f"{name} missing size_mb"
+            assert info.description, f"{name} missing description"
 
     def test_catalog_entries_have_sha256(self):
         """All catalog entries have SHA256 checksums."""
         for name, info in SOUNDFONT_CATALOG.items():
-            assert "sha256" in info, f"{name} missing sha256"
-            assert len(info["sha256"]) == 64, f"{name} has invalid sha256 length"
+            assert info.sha256 is not None, f"{name} missing sha256"
+            assert len(info.sha256) == 64, f"{name} has invalid sha256 length"
+            assert info.sha256_digest == bytes.fromhex(info.sha256)
 
     def test_soundfont_names_are_sf2(self):
         """All SOUNDFONT_NAMES end with .sf2."""
@@ -64,6 +64,20 @@ class TestTsfModule:
         assert result is False
         assert not player.is_loaded()
 
+    def test_schedule_notes_batch(self):
+        player = _tsf.TsfPlayer()
+        player.schedule_notes([(0, 60, 0.8, 0.0, 0.5), (0, 64, 0.8, 0.25, 1.0)])
+        player.schedule_note(1, 67, 0.8, 0.5, 0.25)
+        assert player.duration() == pytest.approx(1.25)
+        player.clear_schedule()
+        assert player.duration() == 0.0
+
+    def test_wait_until_playing_when_stopped(self):
+        player = _tsf.TsfPlayer()
+        start = time.monotonic()
+        assert player.wait_until_playing(5.0) is False
+        assert time.monotonic() - start < 1.0
+
 
 class TestFindSoundFont:
     """Test SoundFont discovery functions."""
@@ -232,15 +246,9 @@ class TestTsfPlayback:
             ],
         )
 
+        # play() returns once the audio thread has rendered its first block
         backend.play(sequence)
-
-        # Poll for time advancement with timeout (audio thread startup can be slow)
-        t = 0.0
-        for _ in range(20):  # Up to 1 second total
-            time.sleep(0.05)
-            t = backend.current_time()
-            if t > 0.0:
-                break
+        t = backend.current_time()
 
         assert t > 0.0, "current_time() never advanced from 0.0"
 
@@ -333,9 +341,7 @@ class TestTsfBackendSave:
         assert output_path.stat().st_size > 0
 
         # Verify it's a valid MIDI file (starts with MThd)
-        with open(output_path, "rb") as f:
-            header = f.read(4)
-            assert header == b"MThd"
+        assert output_path.read_bytes()[:4] == b"MThd"
 
 
 class TestTsfBackendNoSoundFont: